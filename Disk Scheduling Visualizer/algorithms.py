@@ -1,4 +1,142 @@
-def fcfs(requests: list[int], head: int, disk_size: int, direction: str = None) -> list[int]:
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+
+from lazy import lazy_import
+from sequence import SeekSequence
+
+# NumPy is optional (fall back to pure Python sorting) and is only imported on first use
+np = lazy_import("numpy")
+
+
+# Engines used by _split_requests() to order requests for SCAN/C-SCAN/LOOK/C-LOOK
+SPLIT_ENGINES = ("sorted", "counting", "numpy-sort", "numpy-counting")
+
+# Below this many requests NumPy's conversion overhead outweighs its speed
+NUMPY_MIN_REQUESTS = 64
+
+# Counting pays off once a pass over the whole disk costs no more than
+# sorting the requests: disk_size <= COUNTING_RATIO * n
+COUNTING_RATIO = 1
+NUMPY_COUNTING_RATIO = 8
+
+
+def _new_sequence(head: int, disk_size: int, compact: bool) -> list[int] | SeekSequence:
+    """
+    Start a seek sequence at the initial head position.
+
+    Returns a SeekSequence (compact integer array) if compact is True,
+    otherwise a plain list. Both support append() and extend().
+    """
+    if compact:
+        return SeekSequence.for_disk(disk_size, [head])
+    return [head]
+
+
+def _choose_engine(requests, disk_size: int) -> str:
+    """
+    Pick the fastest engine in SPLIT_ENGINES for a request list.
+
+    Counting (O(n + disk_size)) is used when the disk is small relative to
+    the number of requests and every track lies on the disk; otherwise the
+    requests are sorted (O(n log n)). NumPy versions are used for large
+    inputs when NumPy is installed.
+    """
+    n = len(requests)
+    use_numpy = np is not None and n >= NUMPY_MIN_REQUESTS
+    ratio = NUMPY_COUNTING_RATIO if use_numpy else COUNTING_RATIO
+
+    counting = n > 0 and disk_size <= ratio * n and 0 <= min(requests) and max(requests) < disk_size
+    if use_numpy:
+        return "numpy-counting" if counting else "numpy-sort"
+    return "counting" if counting else "sorted"
+
+
+def _compact_array(values, typecode: str) -> array | None:
+    """
+    Copy a sorted NumPy integer array into an array.array without boxing each item.
+
+    Returns:
+        The array, or None if a value does not fit the typecode.
+    """
+    dtype = np.dtype(typecode)
+    info = np.iinfo(dtype)
+    if len(values) and (values[0] < info.min or values[-1] > info.max):
+        return None
+    packed = array(typecode)
+    packed.frombytes(values.astype(dtype, copy=False).tobytes())
+    return packed
+
+
+def _split_requests(requests: list[int], head: int, disk_size: int,
+                    engine: str = None, typecode: str = None) -> tuple[int, list[int], list[int]]:
+    """
+    Partition requests around the head for the SCAN family in one pass.
+
+    Replaces separate filter-and-sort passes with a single ordering of all
+    requests, split at the head with two binary searches. Every engine
+    returns identical plain-int lists.
+
+    With a typecode, the NumPy engines return array.array partitions
+    instead, built straight from the sorted NumPy array, so no Python list
+    (or int object) per request is ever created: a compact SeekSequence
+    extends from them with a buffer copy. Without NumPy, or if a track does
+    not fit the typecode, lists are returned as usual.
+
+    Args:
+        requests: List of track numbers to service
+        head: Initial head position
+        disk_size: Total number of tracks
+        engine: One of SPLIT_ENGINES (default: chosen by _choose_engine())
+        typecode: Typecode of the compact sequence being built, if any
+
+    Returns:
+        Tuple of (number of requests at head, requests below head ascending,
+        requests above head ascending)
+    """
+    if engine is None:
+        engine = _choose_engine(requests, disk_size)
+
+    if typecode is not None and engine in ("numpy-sort", "numpy-counting"):
+        values = np.asarray(requests, dtype=np.int64)
+        if engine == "numpy-sort":
+            ordered = np.sort(values)
+        else:
+            ordered = np.repeat(np.arange(disk_size), np.bincount(values, minlength=disk_size))
+        low = int(np.searchsorted(ordered, head, "left"))
+        high = int(np.searchsorted(ordered, head, "right"))
+        below = _compact_array(ordered[:low], typecode)
+        above = _compact_array(ordered[high:], typecode)
+        if below is not None and above is not None:
+            return high - low, below, above
+
+    if engine == "sorted":
+        ordered = sorted(requests)
+    elif engine == "counting":
+        # One pass to count each track, one pass over the disk to emit them
+        counts = [0] * disk_size
+        for track in requests:
+            counts[track] += 1
+        ordered = []
+        for track, count in enumerate(counts):
+            if count:
+                ordered.extend([track] * count)
+    elif engine == "numpy-sort":
+        ordered = np.sort(np.asarray(requests, dtype=np.int64)).tolist()
+    elif engine == "numpy-counting":
+        counts = np.bincount(np.asarray(requests, dtype=np.int64), minlength=disk_size)
+        ordered = np.repeat(np.arange(disk_size), counts).tolist()
+    else:
+        raise ValueError(f"Unknown engine: {engine}. Valid options: {list(SPLIT_ENGINES)}")
+
+    low = bisect_left(ordered, head)
+    high = bisect_right(ordered, head, low)
+    return high - low, ordered[:low], ordered[high:]
+
+
+def fcfs(requests: list[int], head: int, disk_size: int, direction: str = None,
+         compact: bool = False) -> list[int]:
     """
     First Come First Serve (FCFS)
     
@@ -8,14 +146,20 @@ def fcfs(requests: list[int], head: int, disk_size: int, direction: str = None)
     Args:
         requests: List of track numbers to service
         head: Initial head position
-        disk_size: Total number of tracks (unused, kept for consistent API)
+        disk_size: Total number of tracks (only used to size compact sequences)
         direction: Unused for FCFS
+        compact: Return a SeekSequence (compact array) instead of a list
     
     Returns:
         Seek sequence starting with head, then requests in arrival order
     """
     # Start with initial head position
-    seek_sequence = [head]
+    seek_sequence = _new_sequence(head, disk_size, compact)
+    
+    # array.extend() only accepts arrays of its own typecode: feed any
+    # other array (e.g. "q" trace tracks into an "i" sequence) item by item
+    if compact and isinstance(requests, array) and requests.typecode != seek_sequence.typecode:
+        requests = iter(requests)
     
     # FCFS simply appends requests in their original order
     # No sorting, no optimization
@@ -24,7 +168,72 @@ def fcfs(requests: list[int], head: int, disk_size: int, direction: str = None)
     return seek_sequence
 
 
-def sstf(requests: list[int], head: int, disk_size: int, direction: str = None) -> list[int]:
+def _sstf_order(requests: list[int], head: int):
+    """
+    Yield (track, count) pairs in SSTF service order.
+    
+    The serviced tracks always form a contiguous block of the sorted
+    distinct tracks around the head, so the next closest request is either
+    the nearest unserviced track below or the nearest one above. Ties are
+    broken like sstf_reference(): the track that appears first in the
+    request list wins. Shared by sstf() and iter_sstf().
+    
+    Large inputs are collapsed with NumPy into compact arrays, so no Python
+    object per request is created (a block trace is never turned into a list).
+    """
+    # Collapse duplicates: the sorted distinct tracks, with the index of the
+    # first occurrence and the number of copies of each. Once the head
+    # reaches a track, every copy of it is at distance 0, so all copies are
+    # serviced back to back.
+    if np is not None and len(requests) >= NUMPY_MIN_REQUESTS:
+        distinct, first, counts = np.unique(np.asarray(requests, dtype=np.int64),
+                                            return_index=True, return_counts=True)
+        tracks, first_seen, copies = (_compact_array(values, "q") for values in (distinct, first, counts))
+    else:
+        occurrences = {}
+        for i, track in enumerate(requests):
+            entry = occurrences.get(track)
+            if entry is None:
+                occurrences[track] = [1, i]
+            else:
+                entry[0] += 1
+        tracks = sorted(occurrences)
+        copies = [occurrences[track][0] for track in tracks]
+        first_seen = [occurrences[track][1] for track in tracks]
+    
+    # Pointers to the nearest unserviced tracks below (left) and at/above (right) the head
+    right = bisect_left(tracks, head)
+    left = right - 1
+    current_head = head
+    
+    while left >= 0 or right < len(tracks):
+        if left < 0:
+            take_right = True
+        elif right >= len(tracks):
+            take_right = False
+        else:
+            left_distance = current_head - tracks[left]
+            right_distance = tracks[right] - current_head
+            if left_distance != right_distance:
+                take_right = right_distance < left_distance
+            else:
+                # Equal distance: first in the request list wins
+                take_right = first_seen[right] < first_seen[left]
+        
+        # Service the closest track (all of its copies)
+        if take_right:
+            chosen = right
+            right += 1
+        else:
+            chosen = left
+            left -= 1
+        
+        current_head = tracks[chosen]
+        yield current_head, copies[chosen]
+
+
+def sstf(requests: list[int], head: int, disk_size: int, direction: str = None,
+         compact: bool = False) -> list[int]:
     """
     Shortest Seek Time First (SSTF)
     
@@ -33,6 +242,40 @@ def sstf(requests: list[int], head: int, disk_size: int, direction: str = None)
     
     Warning: Can cause starvation for requests far from the head.
     
+    Runs in O(n log n) (see _sstf_order()); ties are broken like
+    sstf_reference(): the track that appears first in the request list wins.
+    
+    Args:
+        requests: List of track numbers to service
+        head: Initial head position
+        disk_size: Total number of tracks (only used to size compact sequences)
+        direction: Unused for SSTF
+        compact: Return a SeekSequence (compact array) instead of a list
+    
+    Returns:
+        Seek sequence starting with head, ordered by shortest seek time
+    """
+    # Start with initial head position
+    seek_sequence = _new_sequence(head, disk_size, compact)
+    append = seek_sequence.append
+    
+    # Service each track closest first (all of its copies back to back)
+    for track, count in _sstf_order(requests, head):
+        if count == 1:
+            append(track)
+        else:
+            seek_sequence.extend([track] * count)
+    
+    return seek_sequence
+
+
+def sstf_reference(requests: list[int], head: int, disk_size: int, direction: str = None) -> list[int]:
+    """
+    Shortest Seek Time First (SSTF) - reference implementation
+    
+    Straightforward O(n^2) version: rescans every pending request after each
+    movement. Kept for cross-checking the output of sstf().
+    
     Args:
         requests: List of track numbers to service
         head: Initial head position
@@ -66,7 +309,8 @@ def sstf(requests: list[int], head: int, disk_size: int, direction: str = None)
     return seek_sequence
 
 
-def scan(requests: list[int], head: int, disk_size: int, direction: str) -> list[int]:
+def scan(requests: list[int], head: int, disk_size: int, direction: str,
+         compact: bool = False) -> list[int]:
     """
     SCAN (Elevator Algorithm)
     
@@ -81,19 +325,22 @@ def scan(requests: list[int], head: int, disk_size: int, direction: str) -> list
         head: Initial head position
         disk_size: Total number of tracks (valid tracks: 0 to disk_size-1)
         direction: "left" (toward 0) or "right" (toward disk_size-1)
+        compact: Return a SeekSequence (compact array) instead of a list
     
     Returns:
         Seek sequence starting with head, including edge visits
     """
     # Start with initial head position
-    seek_sequence = [head]
+    seek_sequence = _new_sequence(head, disk_size, compact)
     
-    # Service any requests at current head position immediately
-    at_head = [r for r in requests if r == head]
+    # Service any requests at current head position immediately, and separate
+    # the rest into left and right of head (strict inequality)
+    n_at_head, below, above = _split_requests(requests, head, disk_size,
+                                              typecode=seek_sequence.typecode if compact else None)
+    at_head = [head] * n_at_head
     
-    # Separate remaining requests into left and right of head (strict inequality)
-    left = sorted([r for r in requests if r < head], reverse=True)   # Descending (closest first when going left)
-    right = sorted([r for r in requests if r > head])                # Ascending (closest first when going right)
+    left = below[::-1]   # Descending (closest first when going left)
+    right = above        # Ascending (closest first when going right)
     
     # Add requests at head position (no movement needed, but must be in sequence)
     seek_sequence.extend(at_head)
@@ -124,7 +371,8 @@ def scan(requests: list[int], head: int, disk_size: int, direction: str) -> list
     return seek_sequence
 
 
-def cscan(requests: list[int], head: int, disk_size: int, direction: str) -> list[int]:
+def cscan(requests: list[int], head: int, disk_size: int, direction: str,
+          compact: bool = False) -> list[int]:
     """
     Circular SCAN (C-SCAN)
     
@@ -141,19 +389,22 @@ def cscan(requests: list[int], head: int, disk_size: int, direction: str) -> lis
         head: Initial head position
         disk_size: Total number of tracks (valid tracks: 0 to disk_size-1)
         direction: "left" (toward 0) or "right" (toward disk_size-1)
+        compact: Return a SeekSequence (compact array) instead of a list
     
     Returns:
         Seek sequence starting with head, including both edge visits during wrap-around
     """
     # Start with initial head position
-    seek_sequence = [head]
+    seek_sequence = _new_sequence(head, disk_size, compact)
     
-    # Service any requests at current head position immediately
-    at_head = [r for r in requests if r == head]
+    # Service any requests at current head position immediately, and separate
+    # the rest into left and right of head (strict inequality)
+    n_at_head, below, above = _split_requests(requests, head, disk_size,
+                                              typecode=seek_sequence.typecode if compact else None)
+    at_head = [head] * n_at_head
     
-    # Separate remaining requests into left and right of head (strict inequality)
-    left = sorted([r for r in requests if r < head])                 # Ascending (for wrap-around)
-    right = sorted([r for r in requests if r > head])                # Ascending
+    left = below         # Ascending (for wrap-around)
+    right = above        # Ascending
     
     # Add requests at head position
     seek_sequence.extend(at_head)
@@ -175,7 +426,7 @@ def cscan(requests: list[int], head: int, disk_size: int, direction: str) -> lis
     
     else:  # direction == "left"
         # Move left: service left requests (descending order)
-        seek_sequence.extend(sorted(left, reverse=True))
+        seek_sequence.extend(left[::-1])
         
         # Hit left edge - safeguard against redundant visit
         if seek_sequence[-1] != 0:
@@ -186,12 +437,13 @@ def cscan(requests: list[int], head: int, disk_size: int, direction: str) -> lis
         if right:
             seek_sequence.append(disk_size - 1)
             # Continue from right edge toward left, service remaining right requests
-            seek_sequence.extend(sorted(right, reverse=True))
+            seek_sequence.extend(right[::-1])
     
     return seek_sequence
 
 
-def look(requests: list[int], head: int, disk_size: int, direction: str) -> list[int]:
+def look(requests: list[int], head: int, disk_size: int, direction: str,
+         compact: bool = False) -> list[int]:
     """
     LOOK Algorithm
     
@@ -201,21 +453,24 @@ def look(requests: list[int], head: int, disk_size: int, direction: str) -> list
     Args:
         requests: List of track numbers to service
         head: Initial head position
-        disk_size: Total number of tracks (unused, but kept for consistent API)
+        disk_size: Total number of tracks (only used to size compact sequences)
         direction: "left" (toward 0) or "right" (toward disk_size-1)
+        compact: Return a SeekSequence (compact array) instead of a list
     
     Returns:
         Seek sequence starting with head (no forced edge visits)
     """
     # Start with initial head position
-    seek_sequence = [head]
+    seek_sequence = _new_sequence(head, disk_size, compact)
     
-    # Service any requests at current head position immediately
-    at_head = [r for r in requests if r == head]
+    # Service any requests at current head position immediately, and separate
+    # the rest into left and right of head (strict inequality)
+    n_at_head, below, above = _split_requests(requests, head, disk_size,
+                                              typecode=seek_sequence.typecode if compact else None)
+    at_head = [head] * n_at_head
     
-    # Separate remaining requests into left and right of head (strict inequality)
-    left = sorted([r for r in requests if r < head], reverse=True)   # Descending
-    right = sorted([r for r in requests if r > head])                # Ascending
+    left = below[::-1]   # Descending
+    right = above        # Ascending
     
     # Add requests at head position
     seek_sequence.extend(at_head)
@@ -237,7 +492,8 @@ def look(requests: list[int], head: int, disk_size: int, direction: str) -> list
     return seek_sequence
 
 
-def clook(requests: list[int], head: int, disk_size: int, direction: str) -> list[int]:
+def clook(requests: list[int], head: int, disk_size: int, direction: str,
+          compact: bool = False) -> list[int]:
     """
     Circular LOOK (C-LOOK)
     
@@ -248,21 +504,24 @@ def clook(requests: list[int], head: int, disk_size: int, direction: str) -> lis
     Args:
         requests: List of track numbers to service
         head: Initial head position
-        disk_size: Total number of tracks (unused, but kept for consistent API)
+        disk_size: Total number of tracks (only used to size compact sequences)
         direction: "left" (toward 0) or "right" (toward disk_size-1)
+        compact: Return a SeekSequence (compact array) instead of a list
     
     Returns:
         Seek sequence starting with head (no forced edge visits, jump between last and first request)
     """
     # Start with initial head position
-    seek_sequence = [head]
+    seek_sequence = _new_sequence(head, disk_size, compact)
     
-    # Service any requests at current head position immediately
-    at_head = [r for r in requests if r == head]
+    # Service any requests at current head position immediately, and separate
+    # the rest into left and right of head (strict inequality)
+    n_at_head, below, above = _split_requests(requests, head, disk_size,
+                                              typecode=seek_sequence.typecode if compact else None)
+    at_head = [head] * n_at_head
     
-    # Separate remaining requests into left and right of head (strict inequality)
-    left = sorted([r for r in requests if r < head])                 # Ascending (for wrap-around)
-    right = sorted([r for r in requests if r > head])                # Ascending
+    left = below         # Ascending (for wrap-around)
+    right = above        # Ascending
     
     # Add requests at head position
     seek_sequence.extend(at_head)
@@ -277,11 +536,11 @@ def clook(requests: list[int], head: int, disk_size: int, direction: str) -> lis
     
     else:  # direction == "left"
         # Move left: service left requests (descending order)
-        seek_sequence.extend(sorted(left, reverse=True))
+        seek_sequence.extend(left[::-1])
         
         # Jump directly to largest request on right side
         # No edge visits - continue servicing from highest track going down
-        seek_sequence.extend(sorted(right, reverse=True))
+        seek_sequence.extend(right[::-1])
     
     return seek_sequence
 
@@ -296,9 +555,17 @@ ALGORITHMS = {
     "C-LOOK": clook,
 }
 
+# Algorithms whose output does not depend on the initial direction
+UNDIRECTED_ALGORITHMS = {"FCFS", "SSTF"}
+
+# Straightforward implementations kept for cross-checking the optimized ones
+REFERENCE_ALGORITHMS = {
+    "SSTF": sstf_reference,
+}
+
 
 def get_seek_sequence(algorithm: str, requests: list[int], head: int, 
-                      disk_size: int, direction: str = None) -> list[int]:
+                      disk_size: int, direction: str = None, compact: bool = False) -> list[int]:
     """
     Unified interface to get seek sequence from any algorithm.
     
@@ -308,9 +575,10 @@ def get_seek_sequence(algorithm: str, requests: list[int], head: int,
         head: Initial head position
         disk_size: Total number of tracks
         direction: "left" or "right" (required for SCAN, C-SCAN, LOOK, C-LOOK)
+        compact: Return a SeekSequence (compact integer array) instead of a list
     
     Returns:
-        Seek sequence as list of track numbers
+        Seek sequence as list of track numbers (or SeekSequence if compact)
     
     Raises:
         ValueError: If algorithm name is invalid
@@ -318,4 +586,196 @@ def get_seek_sequence(algorithm: str, requests: list[int], head: int,
     if algorithm not in ALGORITHMS:
         raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}")
     
-    return ALGORITHMS[algorithm](requests, head, disk_size, direction)
+    try:
+        return ALGORITHMS[algorithm](requests, head, disk_size, direction, compact=compact)
+    except OverflowError:
+        if not compact:
+            raise
+        # A track off the disk does not fit the typecode disk_size implies:
+        # store the sequence as 64-bit integers and leave validation to the caller
+        return SeekSequence(ALGORITHMS[algorithm](requests, head, disk_size, direction), "q")
+
+
+# Lazy variants: generators that yield the seek sequence one track at a
+# time, for consumers that only need a running value (stream_thm(),
+# iter_movements()) or one step at a time (the streaming animator).
+
+def _partition(requests: list[int], head: int) -> tuple[int, list[int], list[int]]:
+    """
+    Split requests around the head in one pass, without sorting.
+
+    Returns:
+        Tuple of (number of requests at head, requests below head,
+        requests above head), the last two in arrival order.
+    """
+    n_at_head = 0
+    below = []
+    above = []
+    for track in requests:
+        if track < head:
+            below.append(track)
+        elif track > head:
+            above.append(track)
+        else:
+            n_at_head += 1
+    return n_at_head, below, above
+
+
+def _ascending(tracks: list[int]):
+    """
+    Yield tracks in ascending order, sorting on demand.
+
+    The list is turned into a heap in place (O(n)) and each track costs
+    O(log n) when it is consumed, so the first track is available without
+    sorting the whole partition.
+    """
+    heapq.heapify(tracks)
+    while tracks:
+        yield heapq.heappop(tracks)
+
+
+def _descending(tracks: list[int]):
+    """Yield tracks in descending order, sorting on demand (see _ascending())."""
+    negated = [-track for track in tracks]
+    tracks.clear()
+    for track in _ascending(negated):
+        yield -track
+
+
+def iter_fcfs(requests: list[int], head: int, disk_size: int, direction: str = None):
+    """Lazy fcfs(): yields head, then the requests in arrival order (O(1) extra memory)."""
+    yield head
+    yield from requests
+
+
+def iter_sstf(requests: list[int], head: int, disk_size: int, direction: str = None):
+    """Lazy sstf(): yields head, then each track in shortest-seek order (O(distinct tracks) memory)."""
+    yield head
+    for track, count in _sstf_order(requests, head):
+        yield from repeat(track, count)
+
+
+def iter_scan(requests: list[int], head: int, disk_size: int, direction: str):
+    """
+    Lazy scan(): same sequence, edge visit included, sorted on demand.
+    
+    Copies the requests into heaps below and above the head: O(n) extra memory.
+    """
+    n_at_head, below, above = _partition(requests, head)
+    yield head
+    yield from repeat(head, n_at_head)
+    
+    last = head
+    if direction == "left":
+        for last in _descending(below):
+            yield last
+        if last != 0:
+            yield 0
+        yield from _ascending(above)
+    else:
+        for last in _ascending(above):
+            yield last
+        if last != disk_size - 1:
+            yield disk_size - 1
+        yield from _descending(below)
+
+
+def iter_cscan(requests: list[int], head: int, disk_size: int, direction: str):
+    """
+    Lazy cscan(): same sequence, edge visits included, sorted on demand.
+    
+    Copies the requests into heaps below and above the head: O(n) extra memory.
+    """
+    n_at_head, below, above = _partition(requests, head)
+    yield head
+    yield from repeat(head, n_at_head)
+    
+    last = head
+    if direction == "right":
+        for last in _ascending(above):
+            yield last
+        if last != disk_size - 1:
+            yield disk_size - 1
+        if below:
+            yield 0
+            yield from _ascending(below)
+    else:
+        for last in _descending(below):
+            yield last
+        if last != 0:
+            yield 0
+        if above:
+            yield disk_size - 1
+            yield from _descending(above)
+
+
+def iter_look(requests: list[int], head: int, disk_size: int, direction: str):
+    """
+    Lazy look(): same sequence, sorted on demand.
+    
+    Copies the requests into heaps below and above the head: O(n) extra memory.
+    """
+    n_at_head, below, above = _partition(requests, head)
+    yield head
+    yield from repeat(head, n_at_head)
+    
+    if direction == "left":
+        yield from _descending(below)
+        yield from _ascending(above)
+    else:
+        yield from _ascending(above)
+        yield from _descending(below)
+
+
+def iter_clook(requests: list[int], head: int, disk_size: int, direction: str):
+    """
+    Lazy clook(): same sequence, sorted on demand.
+    
+    Copies the requests into heaps below and above the head: O(n) extra memory.
+    """
+    n_at_head, below, above = _partition(requests, head)
+    yield head
+    yield from repeat(head, n_at_head)
+    
+    if direction == "right":
+        yield from _ascending(above)
+        yield from _ascending(below)
+    else:
+        yield from _descending(below)
+        yield from _descending(above)
+
+
+# Lazy counterparts of ALGORITHMS
+ITER_ALGORITHMS = {
+    "FCFS": iter_fcfs,
+    "SSTF": iter_sstf,
+    "SCAN": iter_scan,
+    "C-SCAN": iter_cscan,
+    "LOOK": iter_look,
+    "C-LOOK": iter_clook,
+}
+
+
+def iter_seek_sequence(algorithm: str, requests: list[int], head: int,
+                       disk_size: int, direction: str = None):
+    """
+    Lazy interface to any algorithm: yields the seek sequence track by track.
+    
+    Yields exactly the tracks get_seek_sequence() returns, without building
+    the sequence. Only FCFS runs in O(1) extra memory; SSTF keeps one entry
+    per distinct track, and the SCAN family copies the requests into two
+    heaps (O(n)), ordered on demand as the stream is consumed.
+    
+    Args:
+        algorithm, requests, head, disk_size, direction: As in get_seek_sequence().
+    
+    Returns:
+        Generator of track numbers, starting with head.
+    
+    Raises:
+        ValueError: If algorithm name is invalid
+    """
+    if algorithm not in ITER_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ITER_ALGORITHMS.keys())}")
+    
+    return ITER_ALGORITHMS[algorithm](requests, head, disk_size, direction)
@@ -1,46 +1,135 @@
+import os
+from collections import deque
+
+import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
+from matplotlib.animation import FuncAnimation, FFMpegWriter, PillowWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 
+# Import project modules
+from decimation import decimate_indices, frame_indices, stream_frames
 
-def animate_seek_sequence(
+
+# Number of most recent frames drawn by the animated path when the
+# traversed path is rendered as a static background
+DEFAULT_TRAIL_LENGTH = 50
+
+# Output formats supported by export_animation()
+EXPORT_FORMATS = ("gif", "mp4", "png")
+
+FIGURE_SIZE = (10, 6)
+
+
+class _Blitter:
+    """
+    Blit animated artists over a cached background of one axes.
+
+    Uses only public canvas methods (the pattern of Matplotlib's blitting
+    tutorial): the background is captured by a draw_event handler after
+    every full draw (first show, resize), and static artists added between
+    full draws are painted into it with paint() instead of redrawing the
+    figure.
+    """
+
+    def __init__(self, ax, artists):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.artists = artists
+        self.background = None
+        for artist in artists:
+            artist.set_animated(True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        """Capture the freshly drawn background, then draw the animated artists on it."""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+
+    def paint(self, artist) -> None:
+        """Draw a static artist into the cached background (no-op before the first draw)."""
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        self.ax.draw_artist(artist)
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+
+    def reset(self) -> None:
+        """Drop the background; the next full draw captures a new one."""
+        self.background = None
+        self.canvas.draw_idle()
+
+    def update(self) -> None:
+        """Show the current state of the animated artists."""
+        if self.background is None:
+            # The draw_event handler draws the animated artists
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self.background)
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+
+
+def _setup_animation(
+    fig,
     seek_sequence: list[int],
     disk_size: int,
-    movements: list[int],
-    algorithm_name: str = "Disk Scheduling",
-    interval_ms: int = 500
-) -> None:
+    algorithm_name: str,
+    static_background: bool,
+    trail_length: int,
+    max_points: int,
+    max_frames: int,
+    blit: bool = False
+):
     """
-    Animate disk head movement based on a seek sequence.
+    Draw the axes and plot elements of a seek animation onto a figure.
 
-    Creates a line plot that progressively draws the head movement path,
-    highlighting the current position at each step.
+    Shared by the interactive window and the headless exporters, so the
+    figure is built once per animation and only the plot elements change
+    from frame to frame.
 
     Args:
-        seek_sequence: Ordered list of track numbers visited by the disk head.
-                       First element is the initial head position.
-        disk_size: Total number of tracks on the disk (Y-axis range: 0 to disk_size-1).
-        movements: Absolute head movements between consecutive tracks (unused here,
-                   but available for future timing-based animation).
-        algorithm_name: Name of the algorithm (displayed in title).
-        interval_ms: Delay between animation frames in milliseconds.
+        fig: Matplotlib figure to draw on.
+        blit: Draw each frame by blitting the animated artists onto a
+              cached background (interactive window). Otherwise the caller
+              redraws the whole figure per frame (exporters).
+        (remaining arguments as in animate_seek_sequence)
 
     Returns:
-        None. Displays the animation in a matplotlib window.
+        Tuple of (init, update, frames): the init and per-frame update
+        functions, and the frames to pass to them (an int count or an
+        array of point indices).
     """
-    # Validate input - return silently if empty
-    if not seek_sequence:
-        return
-
     # Number of steps in the animation (including initial position)
     n_steps = len(seek_sequence)
 
     # X-axis: execution steps (0, 1, 2, ...)
-    steps = list(range(n_steps))
+    steps = np.arange(n_steps)
+
+    # Y-axis: track numbers, read through the buffer protocol
+    # (no copy for SeekSequence / array inputs)
+    tracks = np.asarray(seek_sequence)
+
+    # Level of detail: keep a bounded number of vertices; X stays the real step
+    if max_points is not None and n_steps > max_points:
+        keep = decimate_indices(tracks, max_points)
+        steps = keep
+        tracks = tracks[keep]
+
+    # Frames to draw: every point, or equal chunks within the frame budget
+    if max_frames is not None:
+        frames = frame_indices(len(tracks), max_frames)
+    else:
+        frames = len(tracks)
 
     # ─────────────────────────────────────────────────────────────
     # FIGURE SETUP
     # ─────────────────────────────────────────────────────────────
-    fig, ax = plt.subplots(figsize=(10, 6))
+    ax = fig.add_subplot()
 
     # Set axis limits
     ax.set_xlim(-0.5, n_steps - 0.5)
@@ -58,7 +147,21 @@ def animate_seek_sequence(
     # PLOT ELEMENTS (initialized empty, updated during animation)
     # ─────────────────────────────────────────────────────────────
 
-    # Line showing the path traveled so far
+    # Path already traversed, kept out of the animated artists: segments
+    # are moved into it as the head passes them (see update). The line is
+    # drawn by full redraws; when blitting, each batch of newly committed
+    # segments is painted into the cached background as a LineCollection,
+    # so a commit costs O(trail_length) whatever the length of the path.
+    if static_background:
+        traversed_style = dict(color='lightsteelblue', linewidth=1)
+        traversed, = ax.plot([], [], '-', label="Traversed Path", **traversed_style)
+        committed_segments = ax.add_collection(
+            LineCollection([], animated=True, **traversed_style))
+    committed = [0]  # Points up to this index are in the traversed line
+    since_commit = [0]  # Frames drawn after the committed point
+    recent = deque(maxlen=trail_length // 2 + 1)  # Latest frames, oldest first
+
+    # Line showing the path traveled so far (or its recent trail)
     line, = ax.plot([], [], 'b-o', linewidth=2, markersize=6, label="Seek Path")
 
     # Marker highlighting the current head position
@@ -71,12 +174,40 @@ def animate_seek_sequence(
     # Legend
     ax.legend(loc='upper right')
 
+    blitter = _Blitter(ax, [line, current_marker, track_text]) if blit else None
+
     # ─────────────────────────────────────────────────────────────
     # ANIMATION FUNCTIONS
     # ─────────────────────────────────────────────────────────────
 
+    def commit(frame: int) -> None:
+        """
+        Move the path up to a point into the traversed line.
+
+        When blitting, only the newly committed segments are drawn, straight
+        into the cached background.
+        """
+        start = committed[0]
+        committed[0] = frame
+        traversed.set_data(steps[:frame + 1], tracks[:frame + 1])
+        if blitter is not None:
+            committed_segments.set_segments(
+                [np.column_stack((steps[start:frame + 1], tracks[start:frame + 1]))])
+            blitter.paint(committed_segments)
+
+    def restart() -> None:
+        """Empty the traversed line (the animation went back to its start)."""
+        committed[0] = 0
+        since_commit[0] = 0
+        recent.clear()
+        traversed.set_data([], [])
+        if blitter is not None:
+            blitter.reset()
+
     def init():
         """Initialize animation with empty elements."""
+        if static_background:
+            restart()
         line.set_data([], [])
         current_marker.set_data([], [])
         track_text.set_text('')
@@ -87,48 +218,371 @@ def animate_seek_sequence(
         Update function called for each animation frame.
 
         Args:
-            frame: Current frame index (0 to n_steps - 1)
+            frame: Index of the current point (0 to number of points - 1)
 
         Returns:
             Tuple of artists to redraw.
         """
-        # Data up to current frame (inclusive)
-        x_data = steps[:frame + 1]
-        y_data = seek_sequence[:frame + 1]
+        # With a static background, the animated line only covers the path
+        # since the last commit; every trail_length frames (whatever the
+        # number of points per frame), the older half of it moves into the
+        # background
+        if static_background:
+            if recent and frame < recent[-1]:
+                restart()
+            recent.append(frame)
+            since_commit[0] += 1
+            if since_commit[0] > trail_length:
+                commit(recent[0])
+                since_commit[0] = len(recent) - 1
+            start = committed[0]
+        else:
+            start = 0
+
+        # Data up to current frame (inclusive); slices are views, not copies
+        x_data = steps[start:frame + 1]
+        y_data = tracks[start:frame + 1]
 
         # Update the line (path traveled so far)
         line.set_data(x_data, y_data)
 
         # Update current head position marker
         current_x = steps[frame]
-        current_y = seek_sequence[frame]
+        current_y = tracks[frame]
         current_marker.set_data([current_x], [current_y])
 
         # Update track annotation
         track_text.set_position((current_x + 0.15, current_y + 2))
         track_text.set_text(f"Track: {current_y}")
 
+        if blitter is not None:
+            blitter.update()
         return line, current_marker, track_text
 
+    return init, update, frames
+
+
+def animate_seek_sequence(
+    seek_sequence: list[int],
+    disk_size: int,
+    movements: list[int],
+    algorithm_name: str = "Disk Scheduling",
+    interval_ms: int = 500,
+    static_background: bool = False,
+    trail_length: int = DEFAULT_TRAIL_LENGTH,
+    max_points: int = None,
+    max_frames: int = None
+) -> None:
+    """
+    Animate disk head movement based on a seek sequence.
+
+    Creates a line plot that progressively draws the head movement path,
+    highlighting the current position at each step.
+
+    Coordinates live in two preallocated arrays and every frame hands
+    Matplotlib growing views of them, so no data is copied on the Python
+    side. Matplotlib still re-processes the whole drawn path each frame;
+    with static_background=True the path the head has already traversed
+    is drawn faintly as part of the blitted background, and the animated
+    line only covers up to trail_length recent frames. Every trail_length
+    frames the older segments are painted into the cached background
+    (only those segments are drawn), so per-frame cost no longer grows
+    with the sequence length and the future path is never shown.
+
+    For very long sequences, max_points limits the number of vertices
+    drawn (keeping direction reversals and extreme tracks, see
+    decimation.py) and max_frames makes the animation skip ahead in equal
+    chunks, so a run of any length plays in max_frames * interval_ms.
+
+    Args:
+        seek_sequence: Ordered track numbers visited by the disk head (list,
+                       SeekSequence or ndarray). First element is the initial
+                       head position.
+        disk_size: Total number of tracks on the disk (Y-axis range: 0 to disk_size-1).
+        movements: Absolute head movements between consecutive tracks (unused here,
+                   but available for future timing-based animation).
+        algorithm_name: Name of the algorithm (displayed in title).
+        interval_ms: Delay between animation frames in milliseconds.
+        static_background: Keep the traversed path in a static background and
+                           animate only a bounded trail (for long sequences).
+        trail_length: Most recent frames in the animated trail when
+                      static_background is True.
+        max_points: Maximum number of path vertices to draw (None = all).
+        max_frames: Maximum number of animation frames (None = one per point).
+
+    Returns:
+        None. Displays the animation in a matplotlib window.
+    """
+    # Validate input - return silently if empty
+    if len(seek_sequence) == 0:
+        return
+
+    fig = plt.figure(figsize=FIGURE_SIZE)
+    init, update, frames = _setup_animation(
+        fig, seek_sequence, disk_size, algorithm_name,
+        static_background, trail_length, max_points, max_frames, blit=True
+    )
+
     # ─────────────────────────────────────────────────────────────
     # RUN ANIMATION
     # ─────────────────────────────────────────────────────────────
 
-    # Create animation
-    # frames: iterate through each step (0 to n_steps - 1)
-    # interval: time between frames in milliseconds
-    # blit: optimize drawing by only redrawing changed elements
-    # repeat: whether to loop the animation
+    # A canvas timer steps through each point (or the chunked subset) every
+    # interval_ms, once; update() blits only the changed elements
+    frame_iter = iter(range(frames) if isinstance(frames, int) else frames)
+    timer = fig.canvas.new_timer(interval=interval_ms)
+
+    def next_frame():
+        frame = next(frame_iter, None)
+        if frame is None:
+            timer.stop()
+        else:
+            update(frame)
+
+    def start(event):
+        # Play from the first time the window is drawn
+        fig.canvas.mpl_disconnect(start_id)
+        timer.start()
+
+    timer.add_callback(next_frame)
+    start_id = fig.canvas.mpl_connect("draw_event", start)
+    fig.canvas.mpl_connect("close_event", lambda event: timer.stop())
+    init()
+
+    # Display the plot (blocks until window is closed)
+    plt.tight_layout()
+    plt.show()
+
+
+def animate_seek_stream(
+    tracks,
+    disk_size: int,
+    algorithm_name: str = "Disk Scheduling",
+    interval_ms: int = 500,
+    trail_length: int = DEFAULT_TRAIL_LENGTH,
+    every: int = 1,
+    n_steps: int = None
+) -> None:
+    """
+    Animate disk head movement from a stream of tracks.
+
+    Frames are pulled from decimation.stream_frames() as the animation
+    plays, so the seek sequence is never built: pass a generator from
+    algorithms.iter_seek_sequence() and only the trail of the last
+    trail_length steps is held in memory. Frames are not cached by
+    Matplotlib either.
+
+    Args:
+        tracks: Iterable of track numbers (first element is the initial
+                head position).
+        disk_size: Total number of tracks on the disk (Y-axis range: 0 to disk_size-1).
+        algorithm_name: Name of the algorithm (displayed in title).
+        interval_ms: Delay between animation frames in milliseconds.
+        trail_length: Number of recent steps drawn.
+        every: Advance this many steps per frame.
+        n_steps: Length of the sequence if known (fixes the X-axis);
+                 otherwise the axis is widened as the stream goes on.
+
+    Returns:
+        None. Displays the animation in a matplotlib window.
+    """
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+
+    ax.set_xlim(-0.5, (n_steps or max(trail_length, 2)) - 0.5)
+    ax.set_ylim(-5, disk_size + 4)  # Small padding for visibility
+
+    ax.set_xlabel("Execution Step", fontsize=12)
+    ax.set_ylabel("Track Number", fontsize=12)
+    ax.set_title(f"{algorithm_name} - Disk Head Movement", fontsize=14, fontweight='bold')
+    ax.grid(True, linestyle='--', alpha=0.6)
+
+    line, = ax.plot([], [], 'b-o', linewidth=2, markersize=6, label="Seek Path")
+    current_marker, = ax.plot([], [], 'ro', markersize=12, label="Current Head")
+    track_text = ax.text(0, 0, '', fontsize=10, ha='left', va='bottom',
+                         bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.8))
+    ax.legend(loc='upper right')
+
+    def update(frame):
+        """Draw one (steps, tracks) trail from the stream."""
+        steps, trail = frame
+        current_x, current_y = steps[-1], trail[-1]
+
+        # Unknown length: double the X-axis whenever the head runs off it
+        if n_steps is None and current_x > ax.get_xlim()[1]:
+            ax.set_xlim(-0.5, 2 * current_x)
+
+        line.set_data(steps, trail)
+        current_marker.set_data([current_x], [current_y])
+        track_text.set_position((current_x + 0.15, current_y + 2))
+        track_text.set_text(f"Track: {current_y}")
+        return line, current_marker, track_text
+
+    # Not blitted: the X-axis may change while the stream plays
     anim = FuncAnimation(
         fig,
         update,
-        frames=n_steps,
-        init_func=init,
+        frames=stream_frames(tracks, trail_length, every),
         interval=interval_ms,
-        blit=True,
+        cache_frame_data=False,
         repeat=False
     )
 
-    # Display the plot (blocks until window is closed)
+    plt.tight_layout()
+    plt.show()
+
+
+def export_animation(
+    seek_sequence: list[int],
+    disk_size: int,
+    path: str,
+    algorithm_name: str = "Disk Scheduling",
+    fmt: str = None,
+    fps: int = 5,
+    static_background: bool = False,
+    trail_length: int = DEFAULT_TRAIL_LENGTH,
+    max_points: int = None,
+    max_frames: int = None,
+    dpi: int = 100
+) -> str:
+    """
+    Render a seek animation to a file without opening a window.
+
+    Draws on an Agg canvas created directly (no pyplot backend or display
+    needed), so it is safe on render servers and in worker processes.
+
+    Args:
+        seek_sequence: Ordered track numbers visited by the disk head.
+        disk_size: Total number of tracks on the disk.
+        path: Output file (.gif / .mp4) or, for "png", a directory that
+              receives frame_00000.png, frame_00001.png, ...
+        algorithm_name: Name of the algorithm (displayed in title).
+        fmt: "gif", "mp4" or "png" (default: inferred from the extension of
+             path, "png" if it has none).
+        fps: Frames per second for GIF/MP4 output.
+        static_background, trail_length, max_points, max_frames:
+             As in animate_seek_sequence().
+        dpi: Output resolution.
+
+    Returns:
+        The path written to.
+
+    Raises:
+        ValueError: If the sequence is empty or the format is unknown.
+    """
+    if len(seek_sequence) == 0:
+        raise ValueError("Cannot export an empty seek sequence.")
+
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip(".").lower() or "png"
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}. Valid options: {list(EXPORT_FORMATS)}")
+
+    fig = Figure(figsize=FIGURE_SIZE)
+    FigureCanvasAgg(fig)
+    init, update, frames = _setup_animation(
+        fig, seek_sequence, disk_size, algorithm_name,
+        static_background, trail_length, max_points, max_frames
+    )
+    fig.tight_layout()
+
+    if fmt == "png":
+        # One image per frame, numbered in playback order
+        os.makedirs(path, exist_ok=True)
+        init()
+        frame_list = range(frames) if isinstance(frames, int) else frames
+        for i, frame in enumerate(frame_list):
+            update(frame)
+            fig.savefig(os.path.join(path, f"frame_{i:05d}.png"), dpi=dpi)
+        return path
+
+    writer = PillowWriter(fps=fps) if fmt == "gif" else FFMpegWriter(fps=fps)
+    anim = FuncAnimation(fig, update, frames=frames, init_func=init, repeat=False)
+    anim.save(path, writer=writer, dpi=dpi)
+    return path
+
+
+def plot_seek_sequences(
+    sequences: dict,
+    disk_size: int,
+    title: str = "Algorithm Comparison - Disk Head Movement",
+    max_points: int = None
+) -> None:
+    """
+    Overlay the paths of several seek sequences in one static plot.
+
+    Args:
+        sequences: Algorithm name -> seek sequence (list, SeekSequence or ndarray).
+        disk_size: Total number of tracks on the disk (Y-axis range: 0 to disk_size-1).
+        title: Plot title.
+        max_points: Maximum number of vertices drawn per path (None = all).
+
+    Returns:
+        None. Displays the plot in a matplotlib window.
+    """
+    if not sequences:
+        return
+
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+
+    longest = max(len(seek_sequence) for seek_sequence in sequences.values())
+    ax.set_xlim(-0.5, longest - 0.5)
+    ax.set_ylim(-5, disk_size + 4)  # Small padding for visibility
+
+    ax.set_xlabel("Execution Step", fontsize=12)
+    ax.set_ylabel("Track Number", fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+    ax.grid(True, linestyle='--', alpha=0.6)
+
+    for name, seek_sequence in sequences.items():
+        tracks = np.asarray(seek_sequence)
+        steps = np.arange(len(tracks))
+        if max_points is not None and len(tracks) > max_points:
+            steps = decimate_indices(tracks, max_points)
+            tracks = tracks[steps]
+        ax.plot(steps, tracks, '-o', linewidth=1.5, markersize=3 if len(tracks) > 100 else 5,
+                alpha=0.8, label=name)
+
+    ax.legend(loc='upper right')
+
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_head_sweep(sweep, head: int = None, title: str = "THM by Starting Head") -> None:
+    """
+    Show a closed_form.HeadSweep as a heatmap.
+
+    One row per (algorithm, direction), one column per evaluated starting
+    head; colour is THM. The optimal THM is drawn as an extra bottom row.
+
+    Args:
+        sweep: Result of closed_form.sweep_all_heads().
+        head: Current head position to mark with a vertical line (optional).
+        title: Plot title.
+
+    Returns:
+        None. Displays the plot in a matplotlib window.
+    """
+    values = np.vstack([sweep.thm, sweep.optimal])
+    labels = [algorithm if direction is None else f"{algorithm} ({direction})"
+              for algorithm, direction in sweep.rows] + ["Optimal"]
+    # Heads are evenly spaced (every track, or a sample of a large disk)
+    half_step = (sweep.heads[-1] - sweep.heads[0]) / max(1, len(sweep.heads) - 1) / 2 or 0.5
+
+    fig, ax = plt.subplots(figsize=FIGURE_SIZE)
+    image = ax.imshow(values, aspect="auto", interpolation="nearest", cmap="viridis",
+                      extent=(sweep.heads[0] - half_step, sweep.heads[-1] + half_step,
+                              len(labels) - 0.5, -0.5))
+    fig.colorbar(image, ax=ax, label="Total Head Movement")
+
+    ax.set_yticks(range(len(labels)))
+    ax.set_yticklabels(labels)
+    ax.set_xlabel("Starting Head Position", fontsize=12)
+    ax.set_title(title, fontsize=14, fontweight='bold')
+
+    if head is not None:
+        ax.axvline(head, color="red", linestyle="--", linewidth=1.5, label=f"Head {head}")
+        ax.legend(loc="upper right")
+
     plt.tight_layout()
     plt.show()
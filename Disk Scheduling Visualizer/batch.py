@@ -0,0 +1,281 @@
+import json
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# Import project modules
+from algorithms import get_seek_sequence, ALGORITHMS
+from metrics import calculate_thm, gap_to_optimal
+from latency import calculate_latency_metrics, LATENCY_SUMMARY_KEYS
+from cost_model import calculate_service_times
+from optimal import optimal_thm
+
+
+# Default number of workloads sent to a worker in one task
+DEFAULT_CHUNK_SIZE = 64
+
+# A chunk is also closed once it holds this many request tracks in total,
+# so a handful of huge traces does not end up in a single task
+MAX_CHUNK_REQUESTS = 1_000_000
+
+
+def _pack_requests(requests: list[int]) -> array:
+    """
+    Pack a request list into a compact integer array.
+
+    Arrays pickle as a single raw byte buffer instead of one object per
+    track, which keeps the cost of shipping workloads to workers low.
+    """
+    try:
+        return array("i", requests)
+    except OverflowError:
+        return array("q", requests)
+
+
+def parse_workloads(lines, head: int, disk_size: int, direction: str):
+    """
+    Parse workloads from text, one per line.
+
+    A line is either a JSON object with "requests" and optional "head",
+    "disk_size" and "direction" keys, or comma-separated track numbers
+    that use the given defaults for the other fields. Blank lines are
+    skipped.
+
+    Args:
+        lines: Iterable of lines (an open file, sys.stdin, a list).
+        head, disk_size, direction: Defaults for fields a line leaves out.
+
+    Yields:
+        (requests, head, disk_size, direction) tuples.
+
+    Raises:
+        ValueError: If a line is neither valid JSON nor a list of integers.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            data = json.loads(line)
+            yield (
+                data["requests"],
+                data.get("head", head),
+                data.get("disk_size", disk_size),
+                data.get("direction", direction),
+            )
+        else:
+            yield [int(x) for x in line.split(",") if x.strip()], head, disk_size, direction
+
+
+def validate_workload(requests: list[int], head: int, disk_size: int, direction: str) -> None:
+    """
+    Check a workload before it is scheduled.
+
+    Raises:
+        ValueError: If disk_size is not a positive integer, the head or a
+                    request lies outside [0, disk_size), a track is not an
+                    integer, or direction is not "left", "right" or None.
+    """
+    if not isinstance(disk_size, int) or isinstance(disk_size, bool) or disk_size <= 0:
+        raise ValueError(f"Disk size must be a positive integer, got {disk_size!r}.")
+    if not isinstance(head, int) or isinstance(head, bool) or not 0 <= head < disk_size:
+        raise ValueError(f"Head {head!r} is out of range. Must be between 0 and {disk_size - 1}.")
+    if direction not in ("left", "right", None):
+        raise ValueError(f"Direction must be 'left' or 'right', got {direction!r}.")
+    for track in requests:
+        if not isinstance(track, int) or isinstance(track, bool):
+            raise ValueError(f"Track {track!r} is not an integer.")
+        if not 0 <= track < disk_size:
+            raise ValueError(f"Track {track} is out of range. Must be between 0 and {disk_size - 1}.")
+
+
+def evaluate_workload(index: int, requests: list[int], head: int, disk_size: int,
+                      direction: str, algorithms: list[str], drive_model=None,
+                      include_sequence: bool = False) -> list[dict]:
+    """
+    Run every requested algorithm on one workload.
+
+    Args:
+        index: Workload number stored in each row.
+        requests, head, disk_size, direction: The workload.
+        algorithms: Algorithm names to run.
+        drive_model: cost_model.DriveModel for physical service time, or None.
+        include_sequence: Also store the seek sequence (as a list) in each row.
+
+    Returns:
+        One result row per algorithm (see evaluate_workloads()).
+    """
+    rows = []
+    best_thm = optimal_thm(requests, head)
+    for algorithm in algorithms:
+        start = time.perf_counter()
+        seek_sequence = get_seek_sequence(algorithm, requests, head, disk_size, direction,
+                                          compact=True)
+        thm = calculate_thm(seek_sequence)
+        elapsed = time.perf_counter() - start
+
+        row = {
+            "workload": index,
+            "algorithm": algorithm,
+            "thm": thm,
+            "optimal_thm": best_thm,
+            "gap": gap_to_optimal(thm, best_thm),
+            "steps": len(seek_sequence) - 1,
+            "seconds": elapsed,
+        }
+        latency = calculate_latency_metrics(requests, seek_sequence, disk_size)
+        row.update((key, latency[key]) for key in LATENCY_SUMMARY_KEYS)
+        if drive_model is not None:
+            row["service_ms"] = calculate_service_times(requests, seek_sequence, disk_size,
+                                                        drive_model)["total_ms"]
+        if include_sequence:
+            row["sequence"] = seek_sequence.tolist()
+        rows.append(row)
+    return rows
+
+
+def _evaluate_chunk(chunk: list[tuple], algorithms: list[str], drive_model=None) -> list[dict]:
+    """
+    Worker entry point: evaluate a chunk of workloads.
+
+    Args:
+        chunk: List of (index, requests, head, disk_size, direction) tuples.
+        algorithms: Algorithm names to run on each workload.
+        drive_model: cost_model.DriveModel for physical service time, or None.
+
+    Returns:
+        Result rows for every workload/algorithm pair in the chunk.
+    """
+    rows = []
+    for index, requests, head, disk_size, direction in chunk:
+        rows.extend(evaluate_workload(index, requests, head, disk_size, direction, algorithms,
+                                      drive_model))
+    return rows
+
+
+def _iter_chunks(workloads, chunk_size: int):
+    """
+    Group workloads into chunks, packing each request list once.
+
+    Yields:
+        Lists of (index, packed_requests, head, disk_size, direction) tuples.
+    """
+    chunk = []
+    chunk_requests = 0
+    for index, (requests, head, disk_size, direction) in enumerate(workloads):
+        packed = _pack_requests(requests)
+        chunk.append((index, packed, head, disk_size, direction))
+        chunk_requests += len(packed)
+
+        if len(chunk) >= chunk_size or chunk_requests >= MAX_CHUNK_REQUESTS:
+            yield chunk
+            chunk = []
+            chunk_requests = 0
+
+    if chunk:
+        yield chunk
+
+
+def evaluate_workloads(
+    workloads,
+    algorithms: list[str] = None,
+    max_workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    drive_model=None
+) -> list[dict]:
+    """
+    Evaluate scheduling algorithms over many workloads in parallel.
+
+    Workloads are consumed lazily and grouped into chunks; each chunk is one
+    task in a ProcessPoolExecutor, so a request list is pickled once per
+    chunk rather than once per algorithm. At most two chunks per worker are
+    in flight at any time, which bounds memory for very long iterables.
+
+    Args:
+        workloads: Iterable of (requests, head, disk_size, direction) tuples.
+        algorithms: Algorithm names to run (default: every entry in ALGORITHMS).
+        max_workers: Number of worker processes (default: os.cpu_count()).
+                     1 runs everything in the current process.
+        chunk_size: Maximum number of workloads per task.
+        drive_model: cost_model.DriveModel (e.g. DRIVE_PRESETS["HDD-7200"]);
+                     if given, each row also gets "service_ms", the physical
+                     time to run the sequence on that drive.
+
+    Returns:
+        Results table as a list of rows, ordered by workload then algorithm.
+        Each row is a dict with keys "workload" (index in the input),
+        "algorithm", "thm", "optimal_thm" (lowest THM any schedule can
+        reach), "gap" (percent above it), "steps", "seconds" (time to compute the
+        sequence and THM) and the wait statistics from
+        latency.calculate_latency_metrics() ("mean_wait", "p50_wait",
+        "p95_wait", "p99_wait", "max_wait", "starved").
+
+    Raises:
+        ValueError: If an algorithm name is invalid.
+    """
+    if algorithms is None:
+        algorithms = list(ALGORITHMS.keys())
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    rows = []
+    chunks = _iter_chunks(workloads, chunk_size)
+
+    if max_workers == 1:
+        # No pool: avoids process start-up cost for small jobs
+        for chunk in chunks:
+            rows.extend(_evaluate_chunk(chunk, algorithms, drive_model))
+    else:
+        max_in_flight = max_workers * 2
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = set()
+            for chunk in chunks:
+                if len(in_flight) >= max_in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        rows.extend(future.result())
+                in_flight.add(executor.submit(_evaluate_chunk, chunk, algorithms, drive_model))
+
+            for future in in_flight:
+                rows.extend(future.result())
+
+    # Chunks finish out of order; restore a stable table layout
+    order = {name: i for i, name in enumerate(algorithms)}
+    rows.sort(key=lambda row: (row["workload"], order[row["algorithm"]]))
+    return rows
+
+
+def format_results_table(rows: list[dict]) -> str:
+    """
+    Format result rows from evaluate_workloads() as a plain-text table.
+
+    Args:
+        rows: Result rows.
+
+    Returns:
+        Table with one line per row and a header line. A "Service (ms)"
+        column is added when the rows were computed with a drive model.
+    """
+    with_service = bool(rows) and "service_ms" in rows[0]
+
+    header = (f"{'Workload':>8}  {'Algorithm':<9}  {'THM':>12}  {'Gap %':>8}  {'Steps':>8}  "
+              f"{'Mean Wait':>12}  {'p95 Wait':>12}  {'Starved':>8}  {'Time (ms)':>10}")
+    if with_service:
+        header += f"  {'Service (ms)':>14}"
+
+    lines = [header]
+    for row in rows:
+        line = (
+            f"{row['workload']:>8}  {row['algorithm']:<9}  {row['thm']:>12}  "
+            f"{row['gap']:>8.1f}  {row['steps']:>8}  {row['mean_wait']:>12.1f}  {row['p95_wait']:>12.0f}  "
+            f"{row['starved']:>8}  {row['seconds'] * 1000:>10.3f}"
+        )
+        if with_service:
+            line += f"  {row['service_ms']:>14.2f}"
+        lines.append(line)
+    return "\n".join(lines)
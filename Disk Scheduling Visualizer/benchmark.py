@@ -0,0 +1,316 @@
+import argparse
+import gc
+import json
+import platform
+import random
+import time
+import tracemalloc
+
+# Import project modules
+from algorithms import get_seek_sequence, ALGORITHMS, UNDIRECTED_ALGORITHMS
+from metrics import calculate_thm, calculate_movements
+
+
+# Request counts benchmarked by default (10 to 10^7)
+SIZES = [10 ** k for k in range(1, 8)]
+
+# Default cap on the request count; the largest sizes take minutes
+DEFAULT_MAX_SIZE = 10 ** 5
+
+DEFAULT_DISK_SIZE = 10_000
+DEFAULT_SEED = 42
+
+# A result this much slower than the baseline is reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+METRIC_TARGETS = ["calculate_thm", "calculate_movements"]
+
+# Initial head directions benchmarked by default
+DIRECTIONS = ["left", "right"]
+
+
+# ═══════════════════════════════════════════════════════════════
+# REQUEST DISTRIBUTIONS
+# ═══════════════════════════════════════════════════════════════
+
+def _uniform(n: int, disk_size: int, rng: random.Random) -> list[int]:
+    """Tracks drawn uniformly from the whole disk."""
+    return [rng.randrange(disk_size) for _ in range(n)]
+
+
+def _clustered(n: int, disk_size: int, rng: random.Random) -> list[int]:
+    """Tracks grouped around a few hot spots."""
+    centers = [rng.randrange(disk_size) for _ in range(8)]
+    spread = max(1, disk_size // 50)
+    requests = []
+    for _ in range(n):
+        track = int(rng.gauss(rng.choice(centers), spread))
+        requests.append(min(max(track, 0), disk_size - 1))
+    return requests
+
+
+def _sequential(n: int, disk_size: int, rng: random.Random) -> list[int]:
+    """Runs of consecutive tracks starting at random positions."""
+    requests = []
+    while len(requests) < n:
+        start = rng.randrange(disk_size)
+        run = min(64, n - len(requests))
+        requests.extend((start + i) % disk_size for i in range(run))
+    return requests
+
+
+def _adversarial(n: int, disk_size: int, rng: random.Random) -> list[int]:
+    """
+    Requests alternating between the two ends of the disk.
+
+    Worst case for FCFS, and SSTF keeps one end waiting while it works
+    through the other.
+    """
+    last = disk_size - 1
+    return [i // 2 % disk_size if i % 2 == 0 else last - i // 2 % disk_size for i in range(n)]
+
+
+DISTRIBUTIONS = {
+    "uniform": _uniform,
+    "clustered": _clustered,
+    "sequential": _sequential,
+    "adversarial": _adversarial,
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════════════
+
+def _time_call(func, repeat: int) -> float:
+    """Return the best wall time of func() over repeat runs, with GC paused."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def _peak_memory(func) -> int:
+    """Return the peak bytes allocated while running func()."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(
+    sizes: list[int] = None,
+    distributions: list[str] = None,
+    targets: list[str] = None,
+    disk_size: int = DEFAULT_DISK_SIZE,
+    seed: int = DEFAULT_SEED,
+    measure_memory: bool = True,
+    progress=None,
+    directions: list[str] = None
+) -> list[dict]:
+    """
+    Time every algorithm and metric over a grid of sizes and distributions.
+
+    Each workload is generated from the seed, so runs are reproducible.
+    Timing and memory are measured in separate runs because tracemalloc
+    slows allocation-heavy code down.
+
+    Args:
+        sizes: Request counts (default: SIZES up to DEFAULT_MAX_SIZE).
+        distributions: Names from DISTRIBUTIONS (default: all).
+        targets: Algorithm names and/or "calculate_thm", "calculate_movements"
+                 (default: all).
+        disk_size: Number of tracks on the simulated disk.
+        seed: Random seed for workload generation.
+        measure_memory: Whether to record peak memory.
+        progress: Optional callable receiving each result row as it is produced.
+        directions: Initial head directions for SCAN, C-SCAN, LOOK and
+                    C-LOOK (default: DIRECTIONS). FCFS, SSTF and the metrics
+                    ignore the direction and are timed once.
+
+    Returns:
+        List of result rows with keys "target", "distribution", "size",
+        "direction" (None for direction-independent targets), "seconds",
+        "peak_bytes" (None if not measured) and "throughput" (requests per
+        second).
+    """
+    if sizes is None:
+        sizes = [size for size in SIZES if size <= DEFAULT_MAX_SIZE]
+    if distributions is None:
+        distributions = list(DISTRIBUTIONS.keys())
+    if targets is None:
+        targets = list(ALGORITHMS.keys()) + METRIC_TARGETS
+    if directions is None:
+        directions = DIRECTIONS
+
+    head = disk_size // 2
+    results = []
+
+    for distribution in distributions:
+        for size in sizes:
+            rng = random.Random(f"{seed}-{distribution}-{size}")
+            requests = DISTRIBUTIONS[distribution](size, disk_size, rng)
+            # Metrics are measured on the unsorted FCFS order (largest movements)
+            seek_sequence = get_seek_sequence("FCFS", requests, head, disk_size)
+
+            # Large inputs are slow enough that one run is representative
+            repeat = 5 if size <= 10_000 else 1
+
+            for target in targets:
+                if target in METRIC_TARGETS or target in UNDIRECTED_ALGORITHMS:
+                    target_directions = [None]
+                else:
+                    target_directions = directions
+
+                for direction in target_directions:
+                    if target == "calculate_thm":
+                        func = lambda: calculate_thm(seek_sequence)
+                    elif target == "calculate_movements":
+                        func = lambda: calculate_movements(seek_sequence)
+                    else:
+                        func = lambda: get_seek_sequence(target, requests, head, disk_size, direction)
+
+                    seconds = _time_call(func, repeat)
+                    row = {
+                        "target": target,
+                        "distribution": distribution,
+                        "size": size,
+                        "direction": direction,
+                        "seconds": seconds,
+                        "peak_bytes": _peak_memory(func) if measure_memory else None,
+                        "throughput": size / seconds if seconds > 0 else float("inf"),
+                    }
+                    results.append(row)
+                    if progress is not None:
+                        progress(row)
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════
+# BASELINES
+# ═══════════════════════════════════════════════════════════════
+
+def save_baseline(results: list[dict], path: str) -> None:
+    """Write benchmark results to a JSON baseline file."""
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def compare_to_baseline(results: list[dict], path: str,
+                        tolerance: float = DEFAULT_TOLERANCE) -> list[dict]:
+    """
+    Compare results against a saved baseline.
+
+    Args:
+        results: Rows from run_benchmarks().
+        path: Baseline JSON written by save_baseline().
+        tolerance: Allowed slowdown as a fraction (0.25 = 25% slower).
+
+    Returns:
+        Regressed rows, each with added "baseline_seconds" and "slowdown"
+        (ratio of current to baseline time). Rows missing from the baseline
+        are ignored; rows are matched on target, distribution, size and
+        direction.
+    """
+    with open(path) as f:
+        baseline = json.load(f)
+
+    def key(row):
+        return row["target"], row["distribution"], row["size"], row.get("direction")
+
+    previous = {key(row): row["seconds"] for row in baseline["results"]}
+
+    regressions = []
+    for row in results:
+        baseline_seconds = previous.get(key(row))
+        if not baseline_seconds:
+            continue
+        slowdown = row["seconds"] / baseline_seconds
+        if slowdown > 1 + tolerance:
+            regressions.append(dict(row, baseline_seconds=baseline_seconds, slowdown=slowdown))
+    return regressions
+
+
+def format_row(row: dict) -> str:
+    """Format one result row for console output."""
+    peak = "-" if row["peak_bytes"] is None else f"{row['peak_bytes'] / 1024:.1f} KiB"
+    direction = row.get("direction") or "-"
+    return (
+        f"{row['target']:<20} {row['distribution']:<12} {direction:<6} {row['size']:>9} "
+        f"{row['seconds'] * 1000:>11.3f} ms {peak:>14} {row['throughput']:>14.0f} req/s"
+    )
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command-line entry point.
+
+    Examples:
+        python benchmark.py --save baseline.json
+        python benchmark.py --compare baseline.json --max-size 1000000
+    """
+    parser = argparse.ArgumentParser(description="Benchmark disk scheduling algorithms and metrics.")
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")],
+                        help="comma-separated request counts (default: powers of ten up to --max-size)")
+    parser.add_argument("--max-size", type=int, default=DEFAULT_MAX_SIZE,
+                        help=f"largest default request count (default: {DEFAULT_MAX_SIZE})")
+    parser.add_argument("--distributions", type=lambda s: s.split(","),
+                        help=f"comma-separated subset of {list(DISTRIBUTIONS.keys())}")
+    parser.add_argument("--targets", type=lambda s: s.split(","),
+                        help="comma-separated algorithm names and/or metric functions")
+    parser.add_argument("--directions", type=lambda s: s.split(","),
+                        help=f"comma-separated initial head directions (default: {','.join(DIRECTIONS)})")
+    parser.add_argument("--disk-size", type=int, default=DEFAULT_DISK_SIZE)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory measurement")
+    parser.add_argument("--save", metavar="PATH", help="save results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare results against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed slowdown before flagging a regression (default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or [size for size in SIZES if size <= args.max_size]
+    results = run_benchmarks(
+        sizes=sizes,
+        distributions=args.distributions,
+        targets=args.targets,
+        disk_size=args.disk_size,
+        seed=args.seed,
+        measure_memory=not args.no_memory,
+        progress=lambda row: print(format_row(row), flush=True),
+        directions=args.directions,
+    )
+
+    if args.save:
+        save_baseline(results, args.save)
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        regressions = compare_to_baseline(results, args.compare, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) against {args.compare}:")
+            for row in regressions:
+                print(f"  {format_row(row)}  ({row['slowdown']:.2f}x baseline)")
+            raise SystemExit(1)
+        print(f"\nNo regressions against {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+import hashlib
+import os
+import sys
+from array import array
+from collections import OrderedDict
+
+# Import project modules
+from algorithms import get_seek_sequence, ALGORITHMS, UNDIRECTED_ALGORITHMS
+from sequence import SeekSequence
+
+
+DEFAULT_MAX_MEMORY_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+# On-disk entry layout: magic, one typecode byte, then the little-endian
+# array payload
+_MAGIC = b"DSQ1"
+_FILE_SUFFIX = ".seq"
+_TYPECODES = ("i", "q")
+
+# Part of every cache key: bump it whenever a scheduling algorithm changes
+# its output, so persisted entries from older code are never served
+# (they are left for disk eviction to remove)
+CACHE_VERSION = 1
+
+
+def cache_key(algorithm: str, requests: list[int], head: int,
+              disk_size: int, direction: str = None) -> str:
+    """
+    Stable content hash of get_seek_sequence() inputs.
+
+    Requests are hashed as little-endian 64-bit integers, so a list, an
+    array.array or a SeekSequence with the same tracks give the same key,
+    on any platform and across interpreter runs. CACHE_VERSION and the
+    on-disk format magic are hashed too, so either change invalidates
+    every existing entry. FCFS and SSTF ignore the direction, so it is
+    left out of their keys.
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    if algorithm in UNDIRECTED_ALGORITHMS:
+        direction = None
+    digest = hashlib.sha256(
+        f"v{CACHE_VERSION}|{_MAGIC.decode()}|{algorithm}|{head}|{disk_size}|{direction}|".encode()
+    )
+    packed = array("q", requests)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    digest.update(packed)
+    return digest.hexdigest()
+
+
+def _copy_sequence(seek_sequence: SeekSequence) -> SeekSequence:
+    """Return an independent copy (a single buffer copy, no per-item work)."""
+    copy = SeekSequence(typecode=seek_sequence.typecode)
+    copy.frombytes(memoryview(seek_sequence).cast("B"))
+    return copy
+
+
+class SeekSequenceCache:
+    """
+    Memoization layer for get_seek_sequence().
+
+    Results are kept in an in-memory LRU bounded by total bytes and, if a
+    directory is given, in a persistent on-disk store of compact binary
+    files, bounded by total size (least recently used files are evicted
+    first). Cached sequences are SeekSequence arrays; callers receive a
+    copy, so mutating a result never corrupts the cache.
+
+    Attributes:
+        hits: Lookups served from memory.
+        disk_hits: Lookups served from the on-disk store.
+        misses: Lookups that had to run the algorithm.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MAX_MEMORY_BYTES,
+        directory: str = None,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES
+    ):
+        """
+        Args:
+            max_memory_bytes: Budget for the in-memory LRU.
+            directory: Directory for the on-disk store (None = memory only).
+            max_disk_bytes: Budget for the on-disk store.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()  # key -> SeekSequence, oldest first
+        self._memory_bytes = 0
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, _, size in self._disk_files())
+
+    # ═══════════════════════════════════════════════════════════════
+    # PUBLIC API
+    # ═══════════════════════════════════════════════════════════════
+
+    def get_seek_sequence(self, algorithm: str, requests: list[int], head: int,
+                          disk_size: int, direction: str = None) -> SeekSequence:
+        """
+        Cached equivalent of get_seek_sequence(..., compact=True).
+
+        Raises:
+            ValueError: If algorithm name is invalid
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}")
+
+        key = cache_key(algorithm, requests, head, disk_size, direction)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return _copy_sequence(entry)
+
+        entry = self._load(key)
+        if entry is not None:
+            self.disk_hits += 1
+            self._remember(key, entry)
+            return _copy_sequence(entry)
+
+        self.misses += 1
+        entry = get_seek_sequence(algorithm, requests, head, disk_size, direction, compact=True)
+        self._remember(key, entry)
+        self._store(key, entry)
+        return _copy_sequence(entry)
+
+    def stats(self) -> dict:
+        """Return hit/miss counters and current memory/disk usage in bytes."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "memory_entries": len(self._entries),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes if self.directory is not None else 0,
+        }
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop every in-memory entry (and the on-disk store if disk=True)."""
+        self._entries.clear()
+        self._memory_bytes = 0
+        if disk and self.directory is not None:
+            for path, _, _ in self._disk_files():
+                os.remove(path)
+            self._disk_bytes = 0
+
+    # ═══════════════════════════════════════════════════════════════
+    # IN-MEMORY LRU
+    # ═══════════════════════════════════════════════════════════════
+
+    def _remember(self, key: str, entry: SeekSequence) -> None:
+        """Insert an entry and evict least recently used ones over budget."""
+        if entry.nbytes > self.max_memory_bytes:
+            return  # Would evict everything else and still not fit
+
+        self._entries[key] = entry
+        self._memory_bytes += entry.nbytes
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+
+    # ═══════════════════════════════════════════════════════════════
+    # ON-DISK STORE
+    # ═══════════════════════════════════════════════════════════════
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _FILE_SUFFIX)
+
+    def _disk_files(self) -> list[tuple[str, float, int]]:
+        """Return (path, mtime, size) of every entry in the on-disk store."""
+        files = []
+        for name in os.listdir(self.directory):
+            if name.endswith(_FILE_SUFFIX):
+                path = os.path.join(self.directory, name)
+                stat = os.stat(path)
+                files.append((path, stat.st_mtime, stat.st_size))
+        return files
+
+    def _load(self, key: str) -> SeekSequence | None:
+        """
+        Read an entry from disk, or return None if absent or unreadable.
+
+        An unreadable entry (truncated, corrupt or from another format) is
+        deleted, so the next store of the key replaces it.
+        """
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            if data[:len(_MAGIC)] != _MAGIC or len(data) <= len(_MAGIC):
+                raise ValueError("not a seek sequence file")
+            typecode = chr(data[len(_MAGIC)])
+            if typecode not in _TYPECODES:
+                raise ValueError(f"unsupported typecode {typecode!r}")
+            entry = SeekSequence(typecode=typecode)
+            entry.frombytes(data[len(_MAGIC) + 1:])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self._discard(path)
+            return None
+
+        if sys.byteorder == "big":
+            entry.byteswap()
+
+        # Touch the file so eviction treats it as recently used
+        os.utime(path)
+        return entry
+
+    def _discard(self, path: str) -> None:
+        """Delete an unreadable entry and stop counting it (no-op if already gone)."""
+        try:
+            size = os.stat(path).st_size
+            os.remove(path)
+        except OSError:
+            return
+        self._disk_bytes -= size
+
+    def _store(self, key: str, entry: SeekSequence) -> None:
+        """Write an entry to disk and evict old files over budget."""
+        if self.directory is None:
+            return
+
+        size = len(_MAGIC) + 1 + entry.nbytes
+        if size > self.max_disk_bytes:
+            return
+
+        payload = entry
+        if sys.byteorder == "big":
+            payload = _copy_sequence(entry)
+            payload.byteswap()
+
+        # Write to a temporary name first so readers never see partial files
+        path = self._path(key)
+        try:
+            replaced = os.stat(path).st_size
+        except FileNotFoundError:
+            replaced = 0
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(entry.typecode.encode())
+            f.write(payload)
+        os.replace(temp_path, path)
+        self._disk_bytes += size - replaced
+
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used files until the store fits its budget."""
+        files = sorted(self._disk_files(), key=lambda item: item[1])
+        total = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            os.remove(path)
+            total -= size
+        self._disk_bytes = total
+
+
+# Shared in-memory cache used by cached_seek_sequence()
+_default_cache = None
+
+
+def cached_seek_sequence(algorithm: str, requests: list[int], head: int,
+                         disk_size: int, direction: str = None) -> SeekSequence:
+    """
+    get_seek_sequence(..., compact=True) through a shared in-memory cache.
+
+    Use SeekSequenceCache directly for an on-disk store or custom limits.
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SeekSequenceCache()
+    return _default_cache.get_seek_sequence(algorithm, requests, head, disk_size, direction)
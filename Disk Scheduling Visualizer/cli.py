@@ -0,0 +1,164 @@
+import argparse
+import json
+import sys
+
+# Import project modules (none of these load tkinter or matplotlib)
+from algorithms import ALGORITHMS
+from batch import evaluate_workload, parse_workloads, validate_workload
+from cost_model import DRIVE_PRESETS
+
+
+def _parse_algorithms(text: str) -> list[str]:
+    """Parse --algorithms: "all" or a comma-separated list of names."""
+    if text.lower() == "all":
+        return list(ALGORITHMS.keys())
+    algorithms = [name.strip() for name in text.split(",") if name.strip()]
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise argparse.ArgumentTypeError(
+                f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}"
+            )
+    return algorithms
+
+
+def run(workloads, algorithms: list[str], out, drive_model=None, include_sequence: bool = False,
+        fmt: str = "ndjson") -> int:
+    """
+    Evaluate workloads and write one JSON result per workload/algorithm pair.
+
+    Results are written as soon as each workload finishes. Each workload
+    is validated first (see batch.validate_workload()). A workload that is
+    invalid or fails (or an exception in place of a workload, for a line
+    that could not be parsed) produces an {"workload": i, "error": text}
+    record and processing continues.
+
+    Args:
+        workloads: Iterable of (requests, head, disk_size, direction) tuples
+                   or exceptions.
+        algorithms: Algorithm names to run on each workload.
+        out: Text stream to write to.
+        drive_model: cost_model.DriveModel for a service_ms field, or None.
+        include_sequence: Add the full seek sequence to each record.
+        fmt: "ndjson" (one object per line, streamed) or "json" (one array).
+
+    Returns:
+        Number of workloads that failed.
+    """
+    failures = 0
+    first = True
+    if fmt == "json":
+        out.write("[")
+
+    for index, workload in enumerate(workloads):
+        try:
+            if isinstance(workload, Exception):
+                raise workload
+            requests, head, disk_size, direction = workload
+            validate_workload(requests, head, disk_size, direction)
+            records = evaluate_workload(index, requests, head, disk_size, direction, algorithms,
+                                        drive_model, include_sequence)
+            for record in records:
+                record.update(head=head, disk_size=disk_size, direction=direction)
+        except (ValueError, KeyError, TypeError, IndexError, OverflowError) as e:
+            failures += 1
+            records = [{"workload": index, "error": f"{type(e).__name__}: {e}"}]
+
+        for record in records:
+            if fmt == "json":
+                out.write(("" if first else ",") + "\n" + json.dumps(record))
+                first = False
+            else:
+                out.write(json.dumps(record) + "\n")
+        out.flush()
+
+    if fmt == "json":
+        out.write("\n]\n")
+    return failures
+
+
+def _parse_lines(lines, head: int, disk_size: int, direction: str):
+    """
+    Parse workload lines one at a time.
+
+    Yields a workload tuple per non-blank line, or the exception raised
+    while parsing it, so one bad line does not end the stream.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield next(parse_workloads([line], head, disk_size, direction))
+        except (ValueError, KeyError, TypeError, OverflowError) as e:
+            yield e
+
+
+def _input_lines(path: str):
+    """Yield the lines of a file, or of stdin for "-"."""
+    if path == "-":
+        yield from sys.stdin
+    else:
+        with open(path) as f:
+            yield from f
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command-line entry point: evaluate workloads without a GUI.
+
+    Workloads come from --requests, from a file (--workloads PATH), or
+    from stdin, one per line (JSON object or comma-separated tracks, see
+    batch.parse_workloads()).
+
+    Examples:
+        python cli.py --requests 82,170,43,140,24,16,190 --head 50
+        python cli.py --workloads traces.ndjson --algorithms SSTF,LOOK --drive HDD-7200
+        generate_workloads | python cli.py --sequence | jq .thm
+        python cli.py --workloads traces.ndjson --profile --cprofile SSTF
+    """
+    parser = argparse.ArgumentParser(description="Evaluate disk scheduling algorithms (NDJSON output).")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--requests", help="comma-separated request queue")
+    source.add_argument("--workloads", metavar="PATH", default="-",
+                        help="file with one workload per line, '-' for stdin (default)")
+    parser.add_argument("--head", type=int, default=50)
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--direction", choices=["left", "right"], default="right")
+    parser.add_argument("--algorithms", type=_parse_algorithms, default=list(ALGORITHMS.keys()),
+                        help=f"'all' (default) or comma-separated subset of {list(ALGORITHMS.keys())}")
+    parser.add_argument("--drive", choices=list(DRIVE_PRESETS.keys()),
+                        help="add service_ms for this drive model")
+    parser.add_argument("--sequence", action="store_true", help="include the full seek sequence")
+    parser.add_argument("--format", dest="fmt", choices=["ndjson", "json"], default="ndjson")
+    parser.add_argument("--profile", action="store_true",
+                        help="print a timing report of algorithms and metrics to stderr")
+    parser.add_argument("--cprofile", metavar="TARGET",
+                        help="run the first call of TARGET (e.g. SSTF) under cProfile, report to stderr")
+    args = parser.parse_args(argv)
+
+    if args.requests:
+        lines = [args.requests]
+    else:
+        lines = _input_lines(args.workloads)
+    workloads = _parse_lines(lines, args.head, args.disk_size, args.direction)
+
+    drive_model = DRIVE_PRESETS[args.drive] if args.drive else None
+    if args.profile or args.cprofile:
+        # Imported only when asked for (cProfile and pstats add start-up time)
+        import instrumentation
+        if args.cprofile:
+            instrumentation.attach_profiler(args.cprofile)
+        with instrumentation.instrumented():
+            failures = run(workloads, args.algorithms, sys.stdout, drive_model, args.sequence,
+                           args.fmt)
+        if args.profile:
+            print(instrumentation.format_report(), file=sys.stderr)
+        if args.cprofile:
+            print(instrumentation.profiler_report(args.cprofile), file=sys.stderr)
+    else:
+        failures = run(workloads, args.algorithms, sys.stdout, drive_model, args.sequence, args.fmt)
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
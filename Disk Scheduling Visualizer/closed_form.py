@@ -0,0 +1,514 @@
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+# Import project modules
+from lazy import lazy_import
+from metrics import NUMPY_MIN_LENGTH, gap_to_optimal
+
+# NumPy is optional (fall back to a pure Python pass) and is only imported on first use
+np = lazy_import("numpy")
+
+
+# Algorithms whose THM depends only on the extremes of the requests
+CLOSED_FORM_ALGORITHMS = ("SCAN", "C-SCAN", "LOOK", "C-LOOK")
+
+# Algorithms sweep_all_heads() evaluates: FCFS only shifts by the distance
+# from the head to the first request
+ALL_HEADS_ALGORITHMS = ("FCFS",) + CLOSED_FORM_ALGORITHMS
+
+
+class HeadSweep(NamedTuple):
+    """
+    THM of every algorithm for every head position (see sweep_all_heads()).
+
+    Row i of thm and steps belongs to rows[i], an (algorithm, direction)
+    pair; FCFS has a single row with direction None. Column j belongs to
+    head heads[j].
+    """
+    rows: list[tuple[str, str | None]]
+    heads: "np.ndarray"
+    thm: "np.ndarray"
+    steps: "np.ndarray"
+    optimal: "np.ndarray"
+
+
+class RequestSummary(NamedTuple):
+    """
+    Everything the SCAN family's THM depends on, relative to one head position.
+
+    Extremes of an empty side are None.
+    """
+    at_head: int
+    below: int
+    above: int
+    min_below: int | None
+    max_below: int | None
+    min_above: int | None
+    max_above: int | None
+
+
+def summarize_requests(requests: list[int], head: int) -> RequestSummary:
+    """
+    Count and bound the requests on each side of the head in one pass.
+
+    No sequence or sorted copy is built. Large inputs are reduced with
+    NumPy when it is installed.
+
+    Args:
+        requests: List of track numbers to service (list, array or ndarray)
+        head: Initial head position
+
+    Returns:
+        RequestSummary for this head position.
+    """
+    if np is not None and (isinstance(requests, np.ndarray) or len(requests) >= NUMPY_MIN_LENGTH):
+        return _numpy_summary(requests, head)
+
+    at_head = below = above = 0
+    min_below = max_below = min_above = max_above = None
+    for track in requests:
+        if track < head:
+            below += 1
+            if min_below is None or track < min_below:
+                min_below = track
+            if max_below is None or track > max_below:
+                max_below = track
+        elif track > head:
+            above += 1
+            if min_above is None or track < min_above:
+                min_above = track
+            if max_above is None or track > max_above:
+                max_above = track
+        else:
+            at_head += 1
+
+    return RequestSummary(at_head, below, above, min_below, max_below, min_above, max_above)
+
+
+def _numpy_summary(requests, head: int) -> RequestSummary:
+    """NumPy implementation of summarize_requests()."""
+    arr = np.asarray(requests)
+    below_mask = arr < head
+    above_mask = arr > head
+    below = int(np.count_nonzero(below_mask))
+    above = int(np.count_nonzero(above_mask))
+
+    min_below = max_below = min_above = max_above = None
+    if below:
+        below_tracks = arr[below_mask]
+        min_below, max_below = int(below_tracks.min()), int(below_tracks.max())
+    if above:
+        above_tracks = arr[above_mask]
+        min_above, max_above = int(above_tracks.min()), int(above_tracks.max())
+
+    return RequestSummary(len(arr) - below - above, below, above,
+                          min_below, max_below, min_above, max_above)
+
+
+def _summary_from_sorted(tracks: list[int], head: int) -> RequestSummary:
+    """Build a RequestSummary in O(log n) from requests sorted ascending."""
+    low = bisect_left(tracks, head)
+    high = bisect_right(tracks, head, low)
+    n = len(tracks)
+    return RequestSummary(
+        high - low, low, n - high,
+        tracks[0] if low else None,
+        tracks[low - 1] if low else None,
+        tracks[high] if high < n else None,
+        tracks[-1] if high < n else None,
+    )
+
+
+def _waypoints(algorithm: str, summary: RequestSummary, head: int, disk_size: int,
+               direction: str) -> tuple[list[int], int]:
+    """
+    Reduce a SCAN-family seek sequence to the points where the head turns or jumps.
+
+    Between consecutive waypoints the head moves monotonically, so the THM
+    is the sum of distances between them. Direction handling and edge
+    visits follow the functions in algorithms.py exactly.
+
+    Returns:
+        Tuple of (waypoints starting with head, number of edge visits added
+        to the sequence on top of the requests).
+    """
+    s = summary
+    last_edge = disk_size - 1
+    points = [head]
+    edges = 0
+
+    if algorithm == "SCAN":
+        if direction == "left":
+            if s.below:
+                points.append(s.min_below)
+            if points[-1] != 0:
+                points.append(0)
+                edges += 1
+            if s.above:
+                points.append(s.max_above)
+        else:
+            if s.above:
+                points.append(s.max_above)
+            if points[-1] != last_edge:
+                points.append(last_edge)
+                edges += 1
+            if s.below:
+                points.append(s.min_below)
+
+    elif algorithm == "C-SCAN":
+        if direction == "right":
+            if s.above:
+                points.append(s.max_above)
+            if points[-1] != last_edge:
+                points.append(last_edge)
+                edges += 1
+            if s.below:
+                points.extend((0, s.max_below))
+                edges += 1
+        else:
+            if s.below:
+                points.append(s.min_below)
+            if points[-1] != 0:
+                points.append(0)
+                edges += 1
+            if s.above:
+                points.extend((last_edge, s.min_above))
+                edges += 1
+
+    elif algorithm == "LOOK":
+        if direction == "left":
+            sides = ((s.below, s.min_below), (s.above, s.max_above))
+        else:
+            sides = ((s.above, s.max_above), (s.below, s.min_below))
+        points.extend(end for count, end in sides if count)
+
+    elif algorithm == "C-LOOK":
+        if direction == "right":
+            if s.above:
+                points.append(s.max_above)
+            if s.below:
+                points.extend((s.min_below, s.max_below))
+        else:
+            if s.below:
+                points.append(s.min_below)
+            if s.above:
+                points.extend((s.max_above, s.min_above))
+
+    else:
+        raise ValueError(f"No closed form for {algorithm}. Valid options: {list(CLOSED_FORM_ALGORITHMS)}")
+
+    return points, edges
+
+
+def thm_from_summary(algorithm: str, summary: RequestSummary, head: int,
+                     disk_size: int, direction: str) -> tuple[int, int]:
+    """
+    Compute THM and step count in O(1) from a precomputed summary.
+
+    Args:
+        algorithm: One of CLOSED_FORM_ALGORITHMS
+        summary: summarize_requests(requests, head)
+        head: Initial head position
+        disk_size: Total number of tracks
+        direction: "left" or "right"
+
+    Returns:
+        Tuple of (thm, steps), equal to calculate_thm(sequence) and
+        len(sequence) - 1 for the sequence get_seek_sequence() would build.
+
+    Raises:
+        ValueError: If the algorithm has no closed form
+    """
+    points, edges = _waypoints(algorithm, summary, head, disk_size, direction)
+    thm = 0
+    for i in range(1, len(points)):
+        thm += abs(points[i] - points[i - 1])
+    steps = summary.at_head + summary.below + summary.above + edges
+    return thm, steps
+
+
+def optimal_from_summary(summary: RequestSummary, head: int) -> tuple[int, str]:
+    """
+    Minimal THM over all schedules, and the first direction of a path achieving it.
+
+    Visiting a set of points on a line from a start point without
+    returning costs at least the span of the points plus the shorter of
+    the two distances from the start to an end of the span (that end has
+    to be walked to and back). LOOK in that direction achieves this bound.
+
+    Returns:
+        Tuple of (minimal thm, "left" or "right").
+    """
+    lowest = summary.min_below if summary.below else head
+    highest = summary.max_above if summary.above else head
+    to_low, to_high = head - lowest, highest - head
+    if to_low <= to_high:
+        return (highest - lowest) + to_low, "left"
+    return (highest - lowest) + to_high, "right"
+
+
+def closed_form_thm(algorithm: str, requests: list[int], head: int,
+                    disk_size: int, direction: str) -> tuple[int, int]:
+    """
+    THM and step count of a SCAN-family run without building its seek sequence.
+
+    Example:
+        closed_form_thm("LOOK", [82, 170, 43, 140, 24, 16, 190], 50, 200, "right")
+        -> (314, 7)
+
+    Returns:
+        Tuple of (thm, steps).
+
+    Raises:
+        ValueError: If the algorithm has no closed form
+    """
+    return thm_from_summary(algorithm, summarize_requests(requests, head), head, disk_size, direction)
+
+
+def sweep_thm(
+    requests: list[int],
+    disk_size: int,
+    heads=None,
+    algorithms: list[str] = None,
+    directions: tuple[str, ...] = ("left", "right")
+):
+    """
+    Evaluate closed-form THM over many head/direction/algorithm combinations.
+
+    The requests are sorted once; each head then costs two binary searches
+    and each combination O(1), so tens of thousands of combinations are
+    evaluated per second.
+
+    Args:
+        requests: List of track numbers to service
+        disk_size: Total number of tracks
+        heads: Head positions to try (default: every track on the disk)
+        algorithms: Subset of CLOSED_FORM_ALGORITHMS (default: all)
+        directions: Directions to try
+
+    Yields:
+        Dicts with keys "algorithm", "head", "direction", "thm", "steps"
+        and "gap" (percent above the optimal THM for that head, see
+        optimal_from_summary()), in head, then direction, then algorithm order.
+
+    Raises:
+        ValueError: If an algorithm has no closed form
+    """
+    if algorithms is None:
+        algorithms = CLOSED_FORM_ALGORITHMS
+    for algorithm in algorithms:
+        if algorithm not in CLOSED_FORM_ALGORITHMS:
+            raise ValueError(f"No closed form for {algorithm}. Valid options: {list(CLOSED_FORM_ALGORITHMS)}")
+    if heads is None:
+        heads = range(disk_size)
+
+    tracks = sorted(requests)
+    for head in heads:
+        summary = _summary_from_sorted(tracks, head)
+        best_thm = optimal_from_summary(summary, head)[0]
+        for direction in directions:
+            for algorithm in algorithms:
+                thm, steps = thm_from_summary(algorithm, summary, head, disk_size, direction)
+                yield {
+                    "algorithm": algorithm,
+                    "head": head,
+                    "direction": direction,
+                    "thm": thm,
+                    "steps": steps,
+                    "gap": gap_to_optimal(thm, best_thm),
+                }
+
+
+def _head_summaries(tracks: "np.ndarray", disk_size: int) -> dict:
+    """
+    RequestSummary fields for every head in [0, disk_size), as arrays.
+
+    Counts come from prefix sums of a per-track histogram, and the nearest
+    request below/above each head from running maxima/minima of the
+    occupied tracks, in O(n + disk_size).
+
+    Args:
+        tracks: Requests on the disk (int64 ndarray, any order).
+        disk_size: Total number of tracks.
+
+    Returns:
+        Dict of arrays "at_head", "below", "above", "max_below", "min_above"
+        (the last two only meaningful where below/above are non-zero).
+    """
+    heads = np.arange(disk_size)
+    counts = np.bincount(tracks, minlength=disk_size)
+    at_or_below = np.cumsum(counts)
+    occupied = counts > 0
+
+    # Highest occupied track <= head, lowest occupied track >= head
+    up_to = np.maximum.accumulate(np.where(occupied, heads, -1))
+    down_to = np.minimum.accumulate(np.where(occupied, heads, disk_size)[::-1])[::-1]
+
+    return {
+        "at_head": counts,
+        "below": at_or_below - counts,
+        "above": len(tracks) - at_or_below,
+        "max_below": np.concatenate(([-1], up_to[:-1])),
+        "min_above": np.concatenate((down_to[1:], [disk_size])),
+    }
+
+
+def _sampled_head_summaries(requests: "np.ndarray", heads: "np.ndarray") -> dict:
+    """
+    _head_summaries() for selected heads only, by binary search.
+
+    Costs O(n log n + len(heads) log n) and no memory proportional to the
+    disk size.
+    """
+    tracks = np.sort(requests)
+    n = len(tracks)
+    low = np.searchsorted(tracks, heads, side="left")
+    high = np.searchsorted(tracks, heads, side="right")
+    return {
+        "at_head": high - low,
+        "below": low,
+        "above": n - high,
+        # Placeholders where a side is empty (masked out by the callers)
+        "max_below": tracks[np.maximum(low - 1, 0)] if n else heads,
+        "min_above": tracks[np.minimum(high, n - 1)] if n else heads,
+    }
+
+
+def _all_heads_row(algorithm: str, direction: str, s: dict, heads: "np.ndarray",
+                   lowest: int, highest: int, last_edge: int) -> tuple:
+    """
+    Vectorized thm_from_summary() over all heads: (thm, edge visits) arrays.
+
+    Follows the waypoints of _waypoints() for each algorithm. lowest and
+    highest are the smallest and largest request (the far end of the
+    below and above sides for every head).
+    """
+    has_below = s["below"] > 0
+    has_above = s["above"] > 0
+    # Turning point of the first sweep (the head itself if that side is empty)
+    low_turn = np.where(has_below, lowest, heads)
+    high_turn = np.where(has_above, highest, heads)
+    no_edges = np.zeros(len(heads), dtype=np.int64)
+
+    if algorithm == "SCAN":
+        if direction == "left":
+            return heads + np.where(has_above, highest, 0), (low_turn != 0).astype(np.int64)
+        return ((last_edge - heads) + np.where(has_below, last_edge - lowest, 0),
+                (high_turn != last_edge).astype(np.int64))
+
+    if algorithm == "C-SCAN":
+        if direction == "right":
+            thm = (last_edge - heads) + np.where(has_below, last_edge + s["max_below"], 0)
+            return thm, (high_turn != last_edge) + has_below.astype(np.int64)
+        thm = heads + np.where(has_above, last_edge + (last_edge - s["min_above"]), 0)
+        return thm, (low_turn != 0) + has_above.astype(np.int64)
+
+    if algorithm == "LOOK":
+        if direction == "left":
+            return (heads - low_turn) + np.where(has_above, highest - low_turn, 0), no_edges
+        return (high_turn - heads) + np.where(has_below, high_turn - lowest, 0), no_edges
+
+    if algorithm == "C-LOOK":
+        if direction == "right":
+            wrap = (high_turn - lowest) + (s["max_below"] - lowest)
+            return (high_turn - heads) + np.where(has_below, wrap, 0), no_edges
+        wrap = (highest - low_turn) + (highest - s["min_above"])
+        return (heads - low_turn) + np.where(has_above, wrap, 0), no_edges
+
+    raise ValueError(f"No closed form for {algorithm}. Valid options: {list(CLOSED_FORM_ALGORITHMS)}")
+
+
+def sweep_all_heads(
+    requests: list[int],
+    disk_size: int,
+    algorithms: list[str] = None,
+    directions: tuple[str, ...] = ("left", "right"),
+    max_heads: int = None
+) -> HeadSweep:
+    """
+    THM for every head position in [0, disk_size) at once, for plotting.
+
+    Replaces disk_size x directions x algorithms calls to
+    get_seek_sequence() with a few vectorized passes over the requests
+    and the disk: the SCAN family is evaluated from per-head summaries
+    built with prefix sums (a counting sort, so O(n + disk_size) in
+    total), and FCFS is its fixed path plus the distance from the head to
+    the first request.
+
+    With max_heads, a larger disk is sampled instead: at most max_heads
+    evenly spaced heads (always including both edges) are evaluated by
+    binary search over the sorted requests, so neither time nor memory
+    grows with the disk size.
+
+    Args:
+        requests: List of track numbers to service
+        disk_size: Total number of tracks
+        algorithms: Subset of ALL_HEADS_ALGORITHMS (default: all)
+        directions: Directions to evaluate (FCFS ignores them)
+        max_heads: Most head positions to evaluate (default: every track)
+
+    Returns:
+        HeadSweep with the evaluated heads, int64 arrays thm and steps of
+        shape (len(rows), len(heads)) and optimal (minimal THM per head).
+
+    Raises:
+        ValueError: If an algorithm is not supported or a request is off the disk
+        ImportError: If NumPy is not installed
+    """
+    if np is None:
+        raise ImportError("sweep_all_heads() requires NumPy; use sweep_thm() instead.")
+    if algorithms is None:
+        algorithms = ALL_HEADS_ALGORITHMS
+    for algorithm in algorithms:
+        if algorithm not in ALL_HEADS_ALGORITHMS:
+            raise ValueError(f"Cannot sweep {algorithm}. Valid options: {list(ALL_HEADS_ALGORITHMS)}")
+
+    requests = np.asarray(requests, dtype=np.int64)
+    n = len(requests)
+    lowest = int(requests.min()) if n else 0
+    highest = int(requests.max()) if n else 0
+    if lowest < 0 or highest >= disk_size:
+        raise ValueError(f"Requests must lie on the disk (0 to {disk_size - 1}).")
+
+    if max_heads is not None and disk_size > max_heads:
+        heads = np.unique(np.linspace(0, disk_size - 1, max(2, max_heads)).astype(np.int64))
+        summaries = _sampled_head_summaries(requests, heads)
+    else:
+        heads = np.arange(disk_size, dtype=np.int64)
+        summaries = _head_summaries(requests, disk_size)
+    n_heads = len(heads)
+
+    rows, thm_rows, step_rows = [], [], []
+    for algorithm in algorithms:
+        if algorithm == "FCFS":
+            rows.append((algorithm, None))
+            if n:
+                path = int(np.abs(np.diff(requests)).sum())
+                thm_rows.append(np.abs(heads - requests[0]) + path)
+            else:
+                thm_rows.append(np.zeros(n_heads, dtype=np.int64))
+            step_rows.append(np.full(n_heads, n, dtype=np.int64))
+            continue
+        for direction in directions:
+            thm, edges = _all_heads_row(algorithm, direction, summaries, heads,
+                                        lowest, highest, disk_size - 1)
+            rows.append((algorithm, direction))
+            thm_rows.append(thm)
+            step_rows.append(n + edges)
+
+    # optimal_from_summary(), vectorized: span plus the nearer end, once
+    if n:
+        low_end = np.minimum(heads, lowest)
+        high_end = np.maximum(heads, highest)
+        optimal = (high_end - low_end) + np.minimum(heads - low_end, high_end - heads)
+    else:
+        optimal = np.zeros(n_heads, dtype=np.int64)
+
+    shape = (len(rows), n_heads)
+    return HeadSweep(
+        rows,
+        heads,
+        np.array(thm_rows, dtype=np.int64).reshape(shape),
+        np.array(step_rows, dtype=np.int64).reshape(shape),
+        optimal,
+    )
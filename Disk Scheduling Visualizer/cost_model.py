@@ -0,0 +1,235 @@
+import math
+from typing import NamedTuple
+
+# Import project modules
+from lazy import lazy_import
+from metrics import NUMPY_MIN_LENGTH
+from latency import service_positions
+
+# NumPy is optional (fall back to pure Python loops) and is only imported on first use
+np = lazy_import("numpy")
+
+
+# Default size of one request when computing transfer time
+DEFAULT_REQUEST_BYTES = 4096
+
+
+class DriveModel(NamedTuple):
+    """
+    Mechanical timing model of a hard drive.
+
+    The seek time for a move of d tracks on a disk of disk_size tracks is
+
+        settle_ms + seek_sqrt_ms * sqrt(f) + seek_linear_ms * f,
+        where f = d / (disk_size - 1) is the fraction of a full stroke,
+
+    and 0 for d = 0: short seeks are dominated by acceleration (square
+    root) and long seeks by coasting at full speed (linear). Subclass and
+    override seek_ms(), rotation_ms() or transfer_ms() to plug in a
+    different model.
+
+    Attributes:
+        name: Display name.
+        rpm: Spindle speed in revolutions per minute.
+        settle_ms: Head settle time after any non-zero seek.
+        seek_sqrt_ms: Square-root term of a full-stroke seek.
+        seek_linear_ms: Linear term of a full-stroke seek.
+        transfer_mb_per_s: Sustained media transfer rate (MB = 10**6 bytes).
+        sectors_per_track: Sectors in one revolution (for sector offsets).
+    """
+    name: str
+    rpm: int
+    settle_ms: float
+    seek_sqrt_ms: float
+    seek_linear_ms: float
+    transfer_mb_per_s: float
+    sectors_per_track: int = 1000
+
+    @property
+    def revolution_ms(self) -> float:
+        """Time for one full revolution of the platter."""
+        return 60_000 / self.rpm
+
+    def seek_ms(self, distances, disk_size: int):
+        """
+        Seek time for each head movement.
+
+        Args:
+            distances: Absolute movements in tracks (list or ndarray).
+            disk_size: Total number of tracks.
+
+        Returns:
+            Seek times in ms (float64 ndarray for ndarray input, else a list).
+        """
+        stroke = max(1, disk_size - 1)
+        if np is not None and isinstance(distances, np.ndarray):
+            fraction = distances / stroke
+            times = self.settle_ms + self.seek_sqrt_ms * np.sqrt(fraction) + self.seek_linear_ms * fraction
+            return np.where(distances > 0, times, 0.0)
+
+        return [
+            self.settle_ms + self.seek_sqrt_ms * math.sqrt(d / stroke) + self.seek_linear_ms * d / stroke
+            if d > 0 else 0.0
+            for d in distances
+        ]
+
+    def rotation_ms(self, wait_fraction):
+        """Rotational latency for a wait of the given fraction of a revolution."""
+        return wait_fraction * self.revolution_ms
+
+    def transfer_ms(self, nbytes: int) -> float:
+        """Time to read or write nbytes once the head is on the sector."""
+        return nbytes / (self.transfer_mb_per_s * 1000)
+
+
+# Typical drives; seek curves fit to track-to-track, average and
+# full-stroke seek times from datasheets of each class
+DRIVE_PRESETS = {
+    "HDD-7200": DriveModel("HDD-7200", rpm=7200, settle_ms=1.0,
+                           seek_sqrt_ms=7.5, seek_linear_ms=9.5, transfer_mb_per_s=160),
+    "HDD-10K": DriveModel("HDD-10K", rpm=10_000, settle_ms=0.6,
+                          seek_sqrt_ms=3.1, seek_linear_ms=6.3, transfer_mb_per_s=200),
+    "HDD-15K": DriveModel("HDD-15K", rpm=15_000, settle_ms=0.4,
+                          seek_sqrt_ms=3.0, seek_linear_ms=4.1, transfer_mb_per_s=250),
+}
+
+
+def calculate_service_times(
+    requests: list[int],
+    seek_sequence: list[int],
+    disk_size: int,
+    model: DriveModel = DRIVE_PRESETS["HDD-7200"],
+    sector_offsets: list[int] = None,
+    request_bytes: int = DEFAULT_REQUEST_BYTES
+) -> dict:
+    """
+    Convert a seek sequence into physical service times.
+
+    Every step costs its seek time. Steps that service a request also pay
+    rotational latency and the transfer of request_bytes; pure head moves
+    (disk edges, C-SCAN jumps) only seek. Without sector_offsets each
+    request waits half a revolution on average. With them, the platter
+    position is tracked exactly: after a transfer the head sits just past
+    the sector it read, and the platter keeps turning while the head seeks.
+
+    Works on the output of any algorithm. Uses NumPy over the movements
+    array when it is installed and the sequence is long enough.
+
+    Args:
+        requests: Track numbers in their original arrival order.
+        seek_sequence: Sequence produced for these requests, starting at the head.
+        disk_size: Total number of tracks.
+        model: Drive timing model (see DRIVE_PRESETS).
+        sector_offsets: Sector within its track of each request, in request
+                        order (0 to model.sectors_per_track - 1), or None.
+        request_bytes: Size of each request.
+
+    Returns:
+        Dict with:
+            "total_ms": time to run the whole sequence
+            "seek_ms", "rotation_ms", "transfer_ms": breakdown of total_ms
+            "step_ms": time of each step of the sequence (len(seek_sequence) - 1)
+            "request_ms": service time of each request (seek, rotation and
+                          transfer of the step that services it)
+            "completion_ms": time each request finishes
+        Per-step and per-request values are in sequence / request order;
+        float64 ndarrays on the NumPy path and lists otherwise.
+
+    Raises:
+        ValueError: If the sequence does not service every request.
+    """
+    if np is not None and (isinstance(requests, np.ndarray) or len(seek_sequence) >= NUMPY_MIN_LENGTH):
+        return _numpy_service_times(requests, seek_sequence, disk_size, model,
+                                    sector_offsets, request_bytes)
+
+    positions = service_positions(requests, seek_sequence)
+    n_steps = max(0, len(seek_sequence) - 1)
+    movements = [abs(seek_sequence[i] - seek_sequence[i - 1]) for i in range(1, len(seek_sequence))]
+    seek = model.seek_ms(movements, disk_size)
+    transfer_time = model.transfer_ms(request_bytes)
+    revolution = model.revolution_ms
+
+    # Sector (as a fraction of a revolution) serviced at each step, None for pure moves
+    targets = [None] * n_steps
+    for i, step in enumerate(positions):
+        targets[step - 1] = 0.5 if sector_offsets is None else sector_offsets[i] / model.sectors_per_track
+
+    rotation = [0.0] * n_steps
+    transfer = [0.0] * n_steps
+    angle = 0.0  # Platter position under the head, as a fraction of a revolution
+    for i in range(n_steps):
+        angle = (angle + seek[i] / revolution) % 1.0
+        if targets[i] is None:
+            continue
+        if sector_offsets is None:
+            wait = 0.5
+        else:
+            wait = (targets[i] - angle) % 1.0
+            angle = (targets[i] + transfer_time / revolution) % 1.0
+        rotation[i] = model.rotation_ms(wait)
+        transfer[i] = transfer_time
+
+    step_ms = [seek[i] + rotation[i] + transfer[i] for i in range(n_steps)]
+    elapsed = [0.0] * (n_steps + 1)
+    for i in range(n_steps):
+        elapsed[i + 1] = elapsed[i] + step_ms[i]
+
+    return {
+        "total_ms": elapsed[-1],
+        "seek_ms": sum(seek),
+        "rotation_ms": sum(rotation),
+        "transfer_ms": sum(transfer),
+        "step_ms": step_ms,
+        "request_ms": [step_ms[step - 1] for step in positions],
+        "completion_ms": [elapsed[step] for step in positions],
+    }
+
+
+def _numpy_service_times(requests, seek_sequence, disk_size: int, model: DriveModel,
+                         sector_offsets, request_bytes: int) -> dict:
+    """NumPy implementation of calculate_service_times()."""
+    positions = np.asarray(service_positions(requests, seek_sequence), dtype=np.int64)
+    tracks = np.asarray(seek_sequence, dtype=np.int64)
+    n_steps = max(0, len(tracks) - 1)
+
+    seek = model.seek_ms(np.abs(np.diff(tracks)), disk_size)
+    transfer_time = model.transfer_ms(request_bytes)
+    revolution = model.revolution_ms
+
+    serviced = np.zeros(n_steps, dtype=bool)
+    serviced[positions - 1] = True
+
+    if sector_offsets is None:
+        wait = np.where(serviced, 0.5, 0.0)
+    else:
+        # Target sector of each servicing step
+        target = np.zeros(n_steps)
+        target[positions - 1] = np.asarray(sector_offsets) / model.sectors_per_track
+
+        # The platter position is known exactly when a transfer ends, so the
+        # position on arrival at a step is the end of the last service plus
+        # the seek time since then
+        cumulative_seek = np.cumsum(seek) / revolution
+        step_index = np.arange(1, n_steps + 1)
+        last_service = np.maximum.accumulate(np.where(serviced, step_index, 0))
+        previous = np.concatenate(([0], last_service))[:n_steps]
+        previous_step = np.maximum(previous - 1, 0)
+        end_angle = np.where(previous > 0, target[previous_step] + transfer_time / revolution, 0.0)
+        seek_before_previous = np.where(previous > 0, cumulative_seek[previous_step], 0.0)
+        arrival = end_angle + cumulative_seek - seek_before_previous
+        wait = np.where(serviced, np.mod(target - arrival, 1.0), 0.0)
+
+    rotation = model.rotation_ms(wait)
+    transfer = np.where(serviced, transfer_time, 0.0)
+    step_ms = seek + rotation + transfer
+    elapsed = np.concatenate(([0.0], np.cumsum(step_ms)))
+
+    return {
+        "total_ms": float(elapsed[-1]),
+        "seek_ms": float(seek.sum()),
+        "rotation_ms": float(rotation.sum()),
+        "transfer_ms": float(transfer.sum()),
+        "step_ms": step_ms,
+        "request_ms": step_ms[positions - 1],
+        "completion_ms": elapsed[positions],
+    }
@@ -0,0 +1,142 @@
+from collections import deque
+from itertools import islice
+
+import numpy as np
+
+
+def turning_points(tracks) -> np.ndarray:
+    """
+    Find the steps where the head reverses direction.
+
+    Steps with no movement are ignored, so a pause between two moves in
+    opposite directions counts as one reversal at the point the head stops.
+
+    Args:
+        tracks: Track numbers in order of access (list, SeekSequence or ndarray).
+
+    Returns:
+        Sorted int64 array of step indices at which the direction changes.
+    """
+    tracks = np.asarray(tracks)
+    if len(tracks) < 3:
+        return np.empty(0, dtype=np.int64)
+
+    signs = np.sign(np.diff(tracks.astype(np.int64, copy=False)))
+    moving = np.flatnonzero(signs)
+    if len(moving) < 2:
+        return np.empty(0, dtype=np.int64)
+
+    # A reversal sits at the end of a move whose sign differs from the next move
+    changes = signs[moving[:-1]] != signs[moving[1:]]
+    return moving[:-1][changes] + 1
+
+
+def _bucket_extremes(tracks: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Min/max-per-column decimation (M4).
+
+    Splits the steps into max_points // 4 equal columns and keeps the first,
+    last, lowest and highest point of each, which preserves the drawn
+    envelope of the path at that horizontal resolution.
+    """
+    n = len(tracks)
+    n_buckets = max(1, max_points // 4)
+    starts = np.linspace(0, n, n_buckets, endpoint=False).astype(np.int64)
+    starts = np.unique(starts)
+    ends = np.append(starts[1:], n) - 1
+
+    positions = np.arange(n)
+    lengths = np.diff(np.append(starts, n))
+
+    lows = np.minimum.reduceat(tracks, starts)
+    highs = np.maximum.reduceat(tracks, starts)
+    # First index in each bucket where the extreme value occurs
+    low_idx = np.minimum.reduceat(np.where(tracks == np.repeat(lows, lengths), positions, n), starts)
+    high_idx = np.minimum.reduceat(np.where(tracks == np.repeat(highs, lengths), positions, n), starts)
+
+    return np.unique(np.concatenate([starts, ends, low_idx, high_idx]))
+
+
+def decimate_indices(tracks, max_points: int) -> np.ndarray:
+    """
+    Choose at most max_points step indices that keep the shape of a path.
+
+    Always keeps the first and last step. If every direction reversal fits
+    in the budget, all of them are kept (which also keeps every extreme
+    track) and the rest of the budget is spread evenly over the remaining
+    steps. Otherwise the path falls back to min/max-per-column decimation,
+    which keeps the lowest and highest track in every column.
+
+    Args:
+        tracks: Track numbers in order of access (list, SeekSequence or ndarray).
+        max_points: Maximum number of points to return (at least 4).
+
+    Returns:
+        Sorted int64 array of step indices to draw.
+    """
+    tracks = np.asarray(tracks)
+    n = len(tracks)
+    max_points = max(4, max_points)
+    if n <= max_points:
+        return np.arange(n)
+
+    keep = np.concatenate([[0], turning_points(tracks), [n - 1]])
+    if len(keep) > max_points:
+        return _bucket_extremes(tracks, max_points)
+
+    # Fill the remaining budget with evenly spaced steps
+    spare = max_points - len(keep)
+    if spare > 0:
+        filler = np.linspace(0, n - 1, spare + 2).astype(np.int64)[1:-1]
+        keep = np.concatenate([keep, filler])
+    return np.unique(keep)
+
+
+def frame_indices(n_points: int, max_frames: int) -> np.ndarray:
+    """
+    Pick the points at which animation frames are drawn.
+
+    Steps through the points in equal chunks so an animation of any length
+    has at most max_frames frames; the last point is always included.
+
+    Args:
+        n_points: Number of points in the (possibly decimated) path.
+        max_frames: Maximum number of frames.
+
+    Returns:
+        Sorted int64 array of point indices, one per frame.
+    """
+    if n_points <= max_frames:
+        return np.arange(n_points)
+
+    return np.unique(np.linspace(0, n_points - 1, max(2, max_frames)).astype(np.int64))
+
+
+def stream_frames(tracks, trail_length: int, every: int = 1):
+    """
+    Animation frames read from a stream of tracks, one step at a time.
+
+    The streaming counterpart of frame_indices(): instead of indexing a
+    built sequence, it consumes any iterable (e.g. a generator from
+    algorithms.iter_seek_sequence()) and keeps only the last trail_length
+    points, so memory does not grow with the length of the run.
+
+    Args:
+        tracks: Iterable of track numbers in order of access.
+        trail_length: Number of most recent points included in each frame.
+        every: Emit a frame every this many steps (the last step always
+               gets a frame).
+
+    Yields:
+        (steps, tracks) tuples of the trail ending at the current step.
+    """
+    trail = deque(maxlen=trail_length)
+    iterator = iter(tracks)
+    step = -1
+    while True:
+        chunk = list(islice(iterator, every))
+        if not chunk:
+            return
+        trail.extend(enumerate(chunk, step + 1))
+        step += len(chunk)
+        yield tuple(zip(*trail))
@@ -1,10 +1,90 @@
+import multiprocessing
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 # Import project modules
 from algorithms import get_seek_sequence, ALGORITHMS
-from metrics import calculate_thm, calculate_movements
-from animator import animate_seek_sequence
+from metrics import calculate_seek_metrics, gap_to_optimal
+from latency import calculate_latency_metrics, format_latency_summary, LATENCY_SUMMARY_KEYS
+from optimal import optimal_thm
+from closed_form import sweep_all_heads
+from lazy import preload
+
+# animator (and with it Matplotlib) is imported on first use: it takes
+# longer to load than the rest of the application together
+
+
+# Sequences longer than this are animated with a static background path
+# and level-of-detail decimation
+LONG_SEQUENCE_STEPS = 1000
+
+# Vertices drawn and total playback time for long sequences
+LOD_MAX_POINTS = 4000
+LOD_TIME_BUDGET_MS = 60_000
+
+# How often the Tk loop checks the worker processes for messages
+WORKER_POLL_MS = 50
+
+# Longest seek sequence written out in full in the results box
+MAX_DISPLAY_STEPS = 2000
+
+# Worker job name for the all-heads sweep (not an algorithm)
+HEAD_SWEEP = "Head Sweep"
+
+# Heatmap columns: larger disks are sampled at this many evenly spaced heads
+SWEEP_MAX_HEADS = 2000
+
+
+def _simulation_worker(conn, algorithm: str, requests: list[int], head: int,
+                       disk_size: int, direction: str) -> None:
+    """
+    Compute a seek sequence and its metrics in a separate process.
+
+    Runs outside the Tk process so the window stays responsive and the
+    computation can be cancelled by terminating the process. Messages sent
+    back through conn:
+        ("progress", text)  - the current phase
+        ("result", dict)    - seek_sequence, movements, thm, optimal_thm,
+                              latency and seconds (for HEAD_SWEEP: sweep,
+                              a closed_form.HeadSweep, and seconds)
+        ("error", text)     - the exception message if anything failed
+
+    Args:
+        conn: Sending end of a multiprocessing Pipe.
+        algorithm: Algorithm name, or HEAD_SWEEP to evaluate every head.
+        requests, head, disk_size, direction: Simulation inputs.
+    """
+    try:
+        start = time.perf_counter()
+        if algorithm == HEAD_SWEEP:
+            conn.send(("progress", "Sweeping head positions..."))
+            sweep = sweep_all_heads(requests, disk_size, max_heads=SWEEP_MAX_HEADS)
+            conn.send(("result", {"sweep": sweep, "seconds": time.perf_counter() - start}))
+            return
+
+        conn.send(("progress", "Computing seek sequence..."))
+        seek_sequence = get_seek_sequence(algorithm, requests, head, disk_size, direction,
+                                          compact=True)
+
+        conn.send(("progress", "Calculating head movement..."))
+        thm, movements = calculate_seek_metrics(seek_sequence)
+
+        conn.send(("progress", "Calculating wait times..."))
+        latency = calculate_latency_metrics(requests, seek_sequence, disk_size)
+
+        conn.send(("result", {
+            "seek_sequence": seek_sequence,
+            "movements": movements,
+            "thm": thm,
+            "optimal_thm": optimal_thm(requests, head),
+            "latency": {key: latency[key] for key in LATENCY_SUMMARY_KEYS},
+            "seconds": time.perf_counter() - start,
+        }))
+    except Exception as e:
+        conn.send(("error", str(e)))
+    finally:
+        conn.close()
 
 
 class DiskSchedulerGUI:
@@ -17,6 +97,9 @@ class DiskSchedulerGUI:
         movements: Stored movements from last simulation.
         disk_size_value: Stored disk size from last simulation.
         algorithm_name: Stored algorithm name from last simulation.
+        thm_value: Total head movement computed with the last simulation.
+        optimal_thm_value: Lowest THM any schedule can reach for the same inputs.
+        workers: Algorithm -> (process, connection) for running computations.
     """
 
     def __init__(self, root: tk.Tk):
@@ -28,7 +111,7 @@ class DiskSchedulerGUI:
         """
         self.root = root
         self.root.title("Disk Scheduling Visualizer")
-        self.root.geometry("550x550")
+        self.root.geometry("550x665")
         self.root.resizable(False, False)
 
         # ─────────────────────────────────────────────────────────
@@ -39,16 +122,29 @@ class DiskSchedulerGUI:
         self.movements = None
         self.disk_size_value = None
         self.algorithm_name = None
+        self.thm_value = None
+        self.optimal_thm_value = None
+
+        # Background computation (see _start_workers)
+        self.workers = {}
+        self.job = None             # "run", "compare" or "sweep" while workers are active
+        self.job_head = None
+        self.job_disk_size = None
+        self.job_results = {}       # Algorithm -> result dict, or error text
 
         # ─────────────────────────────────────────────────────────
         # BUILD GUI
         # ─────────────────────────────────────────────────────────
         self._create_input_frame()
         self._create_button_frame()
+        self._create_progress_frame()  # Progress bar and Cancel button
         self._create_slider_frame()  # Animation speed slider
         self._create_result_frame()
         self._setup_keyboard_shortcuts()  # Keyboard bindings
 
+        # Stop any running workers when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
     # ═══════════════════════════════════════════════════════════════
     # GUI CONSTRUCTION
     # ═══════════════════════════════════════════════════════════════
@@ -120,37 +216,80 @@ class DiskSchedulerGUI:
         self.algorithm_dropdown.grid(row=4, column=1, pady=5, padx=5)
 
     def _create_button_frame(self) -> None:
-        """Create the button section."""
+        """Create the button section (two rows of equally wide buttons)."""
         # Frame for buttons
         button_frame = ttk.Frame(self.root, padding=(15, 10))
         button_frame.pack(fill="x", padx=15)
+        for column in range(3):
+            button_frame.columnconfigure(column, weight=1, uniform="buttons")
 
         # Run Simulation button
         self.run_btn = ttk.Button(
             button_frame,
             text="Run Simulation",
             command=self._on_run_simulation,
-            width=18
+            width=14
         )
-        self.run_btn.pack(side="left", padx=5)
+        self.run_btn.grid(row=0, column=0, sticky="ew", padx=5, pady=3)
 
         # Calculate THM button
         self.thm_btn = ttk.Button(
             button_frame,
             text="Calculate THM",
             command=self._on_calculate_thm,
-            width=18
+            width=14
         )
-        self.thm_btn.pack(side="left", padx=5)
+        self.thm_btn.grid(row=0, column=1, sticky="ew", padx=5, pady=3)
 
         # Show Animation button
         self.animate_btn = ttk.Button(
             button_frame,
             text="Show Animation",
             command=self._on_show_animation,
-            width=18
+            width=14
+        )
+        self.animate_btn.grid(row=0, column=2, sticky="ew", padx=5, pady=3)
+
+        # Compare All button (every algorithm on the current inputs)
+        self.compare_btn = ttk.Button(
+            button_frame,
+            text="Compare All",
+            command=self._on_compare_all,
+            width=14
+        )
+        self.compare_btn.grid(row=1, column=0, sticky="ew", padx=5, pady=3)
+
+        # Head Sweep button (THM heatmap over every starting head)
+        self.sweep_btn = ttk.Button(
+            button_frame,
+            text="Head Sweep",
+            command=self._on_head_sweep,
+            width=14
+        )
+        self.sweep_btn.grid(row=1, column=1, sticky="ew", padx=5, pady=3)
+
+    def _create_progress_frame(self) -> None:
+        """
+        Create the progress section shown while a simulation is running.
+        
+        Holds an indeterminate progress bar and a Cancel button that
+        terminates the worker processes.
+        """
+        progress_frame = ttk.Frame(self.root, padding=(15, 0))
+        progress_frame.pack(fill="x", padx=15)
+
+        self.progress_bar = ttk.Progressbar(progress_frame, mode="indeterminate", length=380)
+        self.progress_bar.pack(side="left", padx=5)
+
+        # Cancel button (enabled only while busy)
+        self.cancel_btn = ttk.Button(
+            progress_frame,
+            text="Cancel",
+            command=self._on_cancel,
+            width=12,
+            state="disabled"
         )
-        self.animate_btn.pack(side="left", padx=5)
+        self.cancel_btn.pack(side="left", padx=5)
 
     def _create_slider_frame(self) -> None:
         """
@@ -247,14 +386,23 @@ class DiskSchedulerGUI:
         self.thm_label = ttk.Label(result_frame, text="—", font=("Helvetica", 12, "bold"))
         self.thm_label.grid(row=1, column=1, sticky="w", pady=5, padx=5)
 
+        # ─────────────────────────────────────────────────────────
+        # WAIT TIME DISPLAY
+        # ─────────────────────────────────────────────────────────
+        ttk.Label(result_frame, text="Wait (tracks):").grid(
+            row=2, column=0, sticky="w", pady=5
+        )
+        self.latency_label = ttk.Label(result_frame, text="—")
+        self.latency_label.grid(row=2, column=1, sticky="w", pady=5, padx=5)
+
         # ─────────────────────────────────────────────────────────
         # STATUS DISPLAY
         # ─────────────────────────────────────────────────────────
         ttk.Label(result_frame, text="Status:").grid(
-            row=2, column=0, sticky="w", pady=5
+            row=3, column=0, sticky="w", pady=5
         )
         self.status_label = ttk.Label(result_frame, text="Ready", foreground="gray")
-        self.status_label.grid(row=2, column=1, sticky="w", pady=5, padx=5)
+        self.status_label.grid(row=3, column=1, sticky="w", pady=5, padx=5)
 
     # ═══════════════════════════════════════════════════════════════
     # INPUT VALIDATION
@@ -344,9 +492,14 @@ class DiskSchedulerGUI:
         """
         Handle "Run Simulation" button click.
         
-        Validates inputs, computes seek sequence using algorithms.py,
-        and stores the result internally.
+        Validates inputs and starts computing the seek sequence (and its THM)
+        in a worker process. The result is stored and displayed by
+        _on_worker_result once the worker finishes.
         """
+        # Ignore while a computation is already running (e.g. Enter key)
+        if self.workers:
+            return
+
         # Validate inputs
         result = self._validate_inputs()
         if result is None:
@@ -356,23 +509,237 @@ class DiskSchedulerGUI:
         algorithm = self.algorithm_var.get()
 
         # ─────────────────────────────────────────────────────────
-        # COMPUTE SEEK SEQUENCE (via algorithms.py)
+        # COMPUTE SEEK SEQUENCE (via algorithms.py, in a worker)
         # ─────────────────────────────────────────────────────────
-        try:
-            self.seek_sequence = get_seek_sequence(algorithm, requests, head, disk_size, direction)
-            self.movements = calculate_movements(self.seek_sequence)
-            self.disk_size_value = disk_size
-            self.algorithm_name = algorithm
-        except Exception as e:
-            self.status_label.config(text="Error: Algorithm failed", foreground="red")
-            messagebox.showerror("Algorithm Error", f"Failed to compute seek sequence:\n{e}")
+        self._start_workers("run", [algorithm], requests, head, disk_size, direction)
+
+    def _on_compare_all(self) -> None:
+        """
+        Handle "Compare All" button click.
+        
+        Runs every algorithm in ALGORITHMS on the current inputs, each in its
+        own worker process, and opens a comparison window when all finish.
+        """
+        if self.workers:
             return
 
+        result = self._validate_inputs()
+        if result is None:
+            return
+
+        requests, head, disk_size, direction = result
+        self._start_workers("compare", list(ALGORITHMS.keys()), requests, head, disk_size, direction)
+
+    def _on_head_sweep(self) -> None:
+        """
+        Handle "Head Sweep" button click.
+
+        Computes THM for every starting head and direction in a worker
+        process and shows it as a heatmap with the current head marked
+        (see _show_head_sweep).
+        """
+        if self.workers:
+            return
+
+        result = self._validate_inputs()
+        if result is None:
+            return
+
+        requests, head, disk_size, direction = result
+        self._start_workers("sweep", [HEAD_SWEEP], requests, head, disk_size, direction)
+
+    def _on_calculate_thm(self) -> None:
+        """
+        Handle "Calculate THM" button click.
+        
+        Displays the Total Head Movement computed by metrics.py in the
+        simulation worker.
+        """
+        if self.workers:
+            return
+
+        # Check if simulation has been run
+        if self.seek_sequence is None:
+            self.status_label.config(text="Error: No simulation data", foreground="red")
+            messagebox.showwarning("Warning", "Please run simulation first.")
+            return
+
+        # Update display (Blue → THM calculated)
+        gap = gap_to_optimal(self.thm_value, self.optimal_thm_value)
+        self.thm_label.config(
+            text=f"{self.thm_value} tracks (optimal {self.optimal_thm_value}, +{gap:.1f}%)"
+        )
+        self.status_label.config(text="THM calculated", foreground="blue")
+
+    def _on_cancel(self) -> None:
+        """
+        Handle "Cancel" button click.
+        
+        Terminates the worker processes; the previous results are kept.
+        """
+        if not self.workers:
+            return
+
+        self._stop_workers()
+        self.status_label.config(text="Computation cancelled", foreground="gray")
+
+    def _on_close(self) -> None:
+        """Stop any running workers and close the window."""
+        self._stop_workers()
+        self.root.destroy()
+
+    # ═══════════════════════════════════════════════════════════════
+    # BACKGROUND WORKERS
+    # ═══════════════════════════════════════════════════════════════
+
+    def _start_workers(self, job: str, algorithms: list[str], requests: list[int],
+                       head: int, disk_size: int, direction: str) -> None:
+        """
+        Launch one _simulation_worker process per algorithm and start polling.
+
+        Args:
+            job: "run" (single simulation), "compare" (Compare All) or
+                 "sweep" (Head Sweep).
+            algorithms: Algorithms to compute concurrently ([HEAD_SWEEP]
+                        for a sweep).
+            requests, head, disk_size, direction: Simulation inputs.
+        """
+        self.job = job
+        self.job_head = head
+        self.job_disk_size = disk_size
+        self.job_results = {}
+
+        # Load NumPy once here rather than in every forked worker
+        preload("numpy")
+
+        for algorithm in algorithms:
+            receive_conn, send_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(
+                target=_simulation_worker,
+                args=(send_conn, algorithm, requests, head, disk_size, direction),
+                daemon=True
+            )
+            process.start()
+            send_conn.close()  # Only the worker writes to the pipe
+            self.workers[algorithm] = (process, receive_conn)
+
+        self._set_busy(True)
+        if job in ("run", "sweep"):
+            self.status_label.config(text=f"Running {algorithms[0]}...", foreground="purple")
+        else:
+            self.status_label.config(text=f"Comparing 0/{len(algorithms)} algorithms...",
+                                     foreground="purple")
+        self.root.after(WORKER_POLL_MS, self._poll_workers)
+
+    def _poll_workers(self) -> None:
+        """
+        Handle messages from the workers; reschedules itself until all are done.
+        
+        Runs on the Tk main loop via root.after, so all widget updates
+        happen on the GUI thread.
+        """
+        if not self.workers:
+            return  # Cancelled since the last poll
+
+        for algorithm, (process, conn) in list(self.workers.items()):
+            try:
+                while conn.poll():
+                    kind, payload = conn.recv()
+                    if kind == "progress":
+                        if self.job in ("run", "sweep"):
+                            self.status_label.config(text=payload, foreground="purple")
+                    else:  # "result" or "error"
+                        self.job_results[algorithm] = payload
+                        self._close_worker(algorithm)
+                        break
+            except EOFError:
+                # Pipe closed without a result: the worker died
+                self.job_results[algorithm] = "Worker exited unexpectedly"
+                self._close_worker(algorithm)
+
+        if self.workers:
+            if self.job == "compare":
+                total = len(self.workers) + len(self.job_results)
+                self.status_label.config(
+                    text=f"Comparing {len(self.job_results)}/{total} algorithms...",
+                    foreground="purple"
+                )
+            self.root.after(WORKER_POLL_MS, self._poll_workers)
+            return
+
+        # Every worker has finished
+        self._set_busy(False)
+        if self.job == "run":
+            algorithm, result = next(iter(self.job_results.items()))
+            if isinstance(result, str):
+                self.status_label.config(text="Error: Algorithm failed", foreground="red")
+                messagebox.showerror("Algorithm Error", f"Failed to compute seek sequence:\n{result}")
+            else:
+                self._on_worker_result(algorithm, result)
+        elif self.job == "sweep":
+            result = self.job_results[HEAD_SWEEP]
+            if isinstance(result, str):
+                self.status_label.config(text="Error: Head sweep failed", foreground="red")
+                messagebox.showerror("Head Sweep Error", f"Failed to sweep head positions:\n{result}")
+            else:
+                self._show_head_sweep(result["sweep"], self.job_head)
+        else:
+            self.status_label.config(text="Comparison complete", foreground="green")
+            self._show_comparison(self.job_results, self.job_disk_size)
+
+    def _close_worker(self, algorithm: str) -> None:
+        """Terminate (if still running) and forget the worker for one algorithm."""
+        process, conn = self.workers.pop(algorithm)
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        conn.close()
+
+    def _stop_workers(self) -> None:
+        """Terminate every worker and restore the idle state."""
+        for algorithm in list(self.workers):
+            self._close_worker(algorithm)
+        self._set_busy(False)
+
+    def _set_busy(self, busy: bool) -> None:
+        """Enable/disable controls and the progress bar while workers run."""
+        state = "disabled" if busy else "normal"
+        self.run_btn.config(state=state)
+        self.thm_btn.config(state=state)
+        self.animate_btn.config(state=state)
+        self.compare_btn.config(state=state)
+        self.sweep_btn.config(state=state)
+        self.cancel_btn.config(state="normal" if busy else "disabled")
+
+        if busy:
+            self.progress_bar.start(15)
+        else:
+            self.progress_bar.stop()
+
+    def _on_worker_result(self, algorithm: str, result: dict) -> None:
+        """
+        Store and display a finished simulation.
+
+        Args:
+            algorithm: Algorithm that produced the result.
+            result: Dict from _simulation_worker with seek_sequence,
+                    movements, thm, optimal_thm, latency and seconds.
+        """
+        self.seek_sequence = result["seek_sequence"]
+        self.movements = result["movements"]
+        self.thm_value = result["thm"]
+        self.optimal_thm_value = result["optimal_thm"]
+        self.disk_size_value = self.job_disk_size
+        self.algorithm_name = algorithm
+
         # ─────────────────────────────────────────────────────────
         # UPDATE DISPLAY
         # ─────────────────────────────────────────────────────────
-        # Format seek sequence for display
-        seq_str = " → ".join(str(t) for t in self.seek_sequence)
+        # Format seek sequence for display (truncated for very long runs)
+        shown = self.seek_sequence[:MAX_DISPLAY_STEPS]
+        seq_str = " → ".join(str(t) for t in shown)
+        if len(self.seek_sequence) > MAX_DISPLAY_STEPS:
+            seq_str += f" → … ({len(self.seek_sequence) - MAX_DISPLAY_STEPS} more)"
         
         # Update sequence text widget
         self.sequence_text.configure(state="normal")
@@ -383,29 +750,114 @@ class DiskSchedulerGUI:
         # Reset THM display (user must click Calculate THM)
         self.thm_label.config(text="—")
 
+        # Wait statistics (head movement before each request is serviced)
+        self.latency_label.config(text=format_latency_summary(result["latency"]))
+
         # Update status
         self.status_label.config(text=f"Simulation complete ({algorithm})", foreground="green")
 
-    def _on_calculate_thm(self) -> None:
+    # ═══════════════════════════════════════════════════════════════
+    # COMPARISON WINDOW
+    # ═══════════════════════════════════════════════════════════════
+
+    def _show_comparison(self, results: dict, disk_size: int) -> None:
         """
-        Handle "Calculate THM" button click.
-        
-        Calculates Total Head Movement using metrics.py and displays result.
+        Open a window comparing every algorithm's result.
+
+        Shows a table of THM, gap to the optimal schedule, step count, wait
+        statistics and compute time
+        (click a heading to sort by it) and a button that overlays all paths in one plot.
+
+        Args:
+            results: Algorithm -> result dict from _simulation_worker, or
+                     error text if that algorithm failed.
+            disk_size: Disk size used for the comparison.
         """
-        # Check if simulation has been run
-        if self.seek_sequence is None:
-            self.status_label.config(text="Error: No simulation data", foreground="red")
-            messagebox.showwarning("Warning", "Please run simulation first.")
-            return
+        window = tk.Toplevel(self.root)
+        window.title("Algorithm Comparison")
+        window.resizable(False, False)
+
+        # ─────────────────────────────────────────────────────────
+        # RESULTS TABLE
+        # ─────────────────────────────────────────────────────────
+        columns = ("algorithm", "thm", "gap", "steps", "mean_wait", "p95_wait", "starved", "time")
+        headings = {"algorithm": "Algorithm", "thm": "THM", "gap": "Gap %", "steps": "Steps",
+                    "mean_wait": "Mean Wait",
+                    "p95_wait": "p95 Wait", "starved": "Starved", "time": "Time (ms)"}
+        table = ttk.Treeview(window, columns=columns, show="headings", height=len(results))
+        for column in columns:
+            table.heading(column, text=headings[column],
+                          command=lambda c=column: sort_by(c))
+            table.column(column, width=80, anchor="w" if column == "algorithm" else "e")
+        table.pack(fill="both", expand=True, padx=15, pady=10)
+
+        # Best (lowest THM) first; failed algorithms last
+        def thm_key(item):
+            name, result = item
+            return float("inf") if isinstance(result, str) else result["thm"]
+
+        for algorithm, result in sorted(results.items(), key=thm_key):
+            if isinstance(result, str):
+                table.insert("", tk.END, values=(algorithm, "Error") + ("—",) * (len(columns) - 2))
+            else:
+                latency = result["latency"]
+                table.insert("", tk.END, values=(
+                    algorithm,
+                    result["thm"],
+                    f"{gap_to_optimal(result['thm'], result['optimal_thm']):.1f}",
+                    len(result["seek_sequence"]) - 1,
+                    f"{latency['mean_wait']:.1f}",
+                    f"{latency['p95_wait']:.0f}",
+                    latency["starved"],
+                    f"{result['seconds'] * 1000:.2f}",
+                ))
+
+        # Clicking the same heading again reverses the order
+        sort_state = {"column": "thm", "descending": False}
+
+        def sort_by(column):
+            descending = sort_state["column"] == column and not sort_state["descending"]
+            sort_state.update(column=column, descending=descending)
+
+            def value(item):
+                text = table.set(item, column)
+                try:
+                    return (0, float(text))
+                except ValueError:
+                    return (1 if column != "algorithm" else 0, text)
+
+            items = sorted(table.get_children(""), key=value, reverse=descending)
+            for index, item in enumerate(items):
+                table.move(item, "", index)
+
+        # ─────────────────────────────────────────────────────────
+        # OVERLAY PLOT
+        # ─────────────────────────────────────────────────────────
+        sequences = {
+            algorithm: result["seek_sequence"]
+            for algorithm, result in results.items()
+            if not isinstance(result, str)
+        }
+        def plot_overlay():
+            from animator import plot_seek_sequences
+            plot_seek_sequences(sequences, disk_size, max_points=LOD_MAX_POINTS)
+
+        ttk.Button(
+            window,
+            text="Plot Overlay",
+            command=plot_overlay,
+            width=18
+        ).pack(pady=(0, 10))
 
-        # ─────────────────────────────────────────────────────────
-        # CALCULATE THM (via metrics.py)
-        # ─────────────────────────────────────────────────────────
-        thm = calculate_thm(self.seek_sequence)
+    def _show_head_sweep(self, sweep, head: int) -> None:
+        """Plot a finished head sweep (Matplotlib is loaded on first use)."""
+        from animator import plot_head_sweep
 
-        # Update display (Blue → THM calculated)
-        self.thm_label.config(text=f"{thm} tracks")
-        self.status_label.config(text="THM calculated", foreground="blue")
+        self.status_label.config(
+            text=f"Head sweep: {len(sweep.rows)} schedules x {len(sweep.heads)} heads",
+            foreground="green"
+        )
+        plot_head_sweep(sweep, head)
 
     def _on_show_animation(self) -> None:
         """
@@ -414,6 +866,9 @@ class DiskSchedulerGUI:
         Triggers animation using animator.py with the stored seek sequence.
         Uses the current slider value for animation interval.
         """
+        if self.workers:
+            return
+
         # Check if simulation has been run
         if self.seek_sequence is None:
             self.status_label.config(text="Error: No simulation data", foreground="red")
@@ -423,19 +878,27 @@ class DiskSchedulerGUI:
         # Get animation speed from slider
         interval_ms = self.speed_var.get()
 
+        # Long sequences: bounded vertices and a fixed playback time
+        long_sequence = len(self.seek_sequence) > LONG_SEQUENCE_STEPS
+
         # Update status (Purple → Animation in progress)
         self.status_label.config(text="Showing animation...", foreground="purple")
         self.root.update()
 
         # ─────────────────────────────────────────────────────────
-        # SHOW ANIMATION (via animator.py)
+        # SHOW ANIMATION (via animator.py, loaded on first use)
         # ─────────────────────────────────────────────────────────
+        from animator import animate_seek_sequence
+
         animate_seek_sequence(
             seek_sequence=self.seek_sequence,
             disk_size=self.disk_size_value,
             movements=self.movements,
             algorithm_name=self.algorithm_name,
-            interval_ms=interval_ms  # Read from slider
+            interval_ms=interval_ms,  # Read from slider
+            static_background=long_sequence,
+            max_points=LOD_MAX_POINTS if long_sequence else None,
+            max_frames=LOD_TIME_BUDGET_MS // interval_ms if long_sequence else None
         )
 
         # Update status after animation window closes
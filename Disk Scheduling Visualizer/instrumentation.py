@@ -0,0 +1,348 @@
+import cProfile
+import functools
+import io
+import math
+import os
+import pstats
+import sys
+import time
+from contextlib import contextmanager
+
+# Import project modules
+from algorithms import ALGORITHMS
+
+
+# Functions wrapped by enable(), by module. Algorithms are wrapped through
+# ALGORITHMS, which covers every get_seek_sequence() call.
+FUNCTION_TARGETS = {
+    "metrics": ("calculate_thm", "calculate_movements", "calculate_seek_metrics", "stream_thm"),
+    "animator": ("animate_seek_sequence", "animate_seek_stream", "export_animation",
+                 "plot_seek_sequences", "plot_head_sweep"),
+}
+
+HOOK_STAGES = ("pre", "post")
+
+PERCENTILES = (50, 95, 99)
+
+# Latency histogram resolution: buckets per doubling of the call time
+# (each bucket is about 19% wide)
+BUCKETS_PER_OCTAVE = 4
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+# ═══════════════════════════════════════════════════════════════
+# STATISTICS
+# ═══════════════════════════════════════════════════════════════
+
+def _size_bucket(size: int) -> int:
+    """Lower bound of the power-of-ten bucket holding an input size (0, 1, 10, 100, ...)."""
+    return 0 if size <= 0 else 10 ** (len(str(size)) - 1)
+
+
+class TimingStats:
+    """
+    Call count, cumulative time and latency histogram of one target.
+
+    Call times go into logarithmic buckets (BUCKETS_PER_OCTAVE per
+    doubling), so memory stays constant however many calls are recorded
+    and percentiles are accurate to the bucket width.
+
+    Attributes:
+        calls: Completed calls.
+        total: Cumulative seconds.
+        minimum, maximum: Fastest and slowest call in seconds.
+        histogram: Bucket index -> calls.
+        sizes: Input-size bucket (see _size_bucket()) -> [calls, seconds].
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+        self.histogram = {}
+        self.sizes = {}
+
+    def record(self, seconds: float, size: int = None) -> None:
+        """Add one call of the given duration and input size (None if unknown)."""
+        self.calls += 1
+        self.total += seconds
+        self.minimum = min(self.minimum, seconds)
+        self.maximum = max(self.maximum, seconds)
+
+        bucket = math.floor(math.log2(seconds) * BUCKETS_PER_OCTAVE) if seconds > 0 else None
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+        if size is not None:
+            entry = self.sizes.setdefault(_size_bucket(size), [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def percentile(self, p: float) -> float:
+        """
+        Approximate p-th percentile of the call time (nearest rank).
+
+        Returns the geometric middle of the bucket holding the rank, clamped
+        to the observed minimum and maximum.
+        """
+        if not self.calls:
+            return 0.0
+        rank = max(1, math.ceil(p / 100 * self.calls))
+        seen = 0
+        # The zero-duration bucket (None) sorts first
+        for bucket in sorted(self.histogram, key=lambda b: -math.inf if b is None else b):
+            seen += self.histogram[bucket]
+            if seen >= rank:
+                if bucket is None:
+                    return 0.0
+                middle = 2 ** ((bucket + 0.5) / BUCKETS_PER_OCTAVE)
+                return min(max(middle, self.minimum), self.maximum)
+        return self.maximum
+
+
+# ═══════════════════════════════════════════════════════════════
+# REGISTRY
+# ═══════════════════════════════════════════════════════════════
+
+_hooks = {stage: [] for stage in HOOK_STAGES}
+_stats = {}
+_patched = []        # (namespace, key, original) for every replaced function
+_profilers = {}      # target -> [calls left, cProfile.Profile]
+_profiling = False   # a cProfile session is running (they cannot nest)
+
+
+def add_hook(stage: str, callback) -> None:
+    """
+    Register a callback run around every instrumented call.
+
+    "pre" callbacks receive (target, args, kwargs) before the call; "post"
+    callbacks receive (target, args, kwargs, result, seconds) after it.
+    Hooks only run while instrumentation is enabled.
+
+    Raises:
+        ValueError: If the stage is invalid.
+    """
+    if stage not in HOOK_STAGES:
+        raise ValueError(f"Unknown hook stage: {stage}. Valid options: {list(HOOK_STAGES)}")
+    _hooks[stage].append(callback)
+
+
+def remove_hook(stage: str, callback) -> None:
+    """Unregister a callback added with add_hook() (no-op if absent)."""
+    if callback in _hooks.get(stage, ()):
+        _hooks[stage].remove(callback)
+
+
+def _input_size(args: tuple) -> int | None:
+    """Length of the first argument (requests or seek sequence), if it has one."""
+    try:
+        return len(args[0])
+    except (IndexError, TypeError):
+        return None
+
+
+def _claim_profiler(target: str) -> cProfile.Profile | None:
+    """Return the profiler armed for this call by attach_profiler(), if any."""
+    armed = _profilers.get(target)
+    if _profiling or armed is None or armed[0] <= 0:
+        return None
+    armed[0] -= 1
+    return armed[1]
+
+
+def _wrap(target: str, func):
+    """Return func timed under the target name, with hooks and optional cProfile."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        global _profiling
+        for hook in _hooks["pre"]:
+            hook(target, args, kwargs)
+
+        profiler = _claim_profiler(target)
+        start = time.perf_counter()
+        if profiler is None:
+            result = func(*args, **kwargs)
+        else:
+            _profiling = True
+            try:
+                result = profiler.runcall(func, *args, **kwargs)
+            finally:
+                _profiling = False
+        seconds = time.perf_counter() - start
+
+        _stats.setdefault(target, TimingStats()).record(seconds, _input_size(args))
+        for hook in _hooks["post"]:
+            hook(target, args, kwargs, result, seconds)
+        return result
+
+    return wrapper
+
+
+def _project_modules():
+    """Imported modules that live in this directory."""
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if path and os.path.dirname(os.path.abspath(path)) == HERE:
+            yield module
+
+
+def _patch(namespace: dict, key: str, replacement) -> None:
+    """Replace namespace[key], remembering the original for disable()."""
+    _patched.append((namespace, key, namespace[key]))
+    namespace[key] = replacement
+
+
+def is_enabled() -> bool:
+    """Whether instrumentation is currently enabled."""
+    return bool(_patched)
+
+
+def enable() -> None:
+    """
+    Start instrumenting algorithms, metrics and animator functions.
+
+    Entries of ALGORITHMS and the functions in FUNCTION_TARGETS are
+    replaced by timed wrappers. Project modules that imported a target by
+    name (from metrics import calculate_thm) are rebound too. Modules in
+    FUNCTION_TARGETS that are not imported yet (the animator is imported on
+    first use) are left alone, so enable() never loads Matplotlib.
+
+    While disabled nothing is wrapped, so instrumentation costs nothing.
+    Times are recorded in the calling process only (run batch evaluation
+    with max_workers=1 to instrument it).
+    """
+    if is_enabled():
+        return
+
+    for name, func in list(ALGORITHMS.items()):
+        _patch(ALGORITHMS, name, _wrap(name, func))
+
+    modules = list(_project_modules())
+    for module_name, functions in FUNCTION_TARGETS.items():
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for name in functions:
+            original = getattr(module, name)
+            wrapper = _wrap(name, original)
+            for other in modules:
+                if other.__dict__.get(name) is original:
+                    _patch(other.__dict__, name, wrapper)
+
+
+def disable() -> None:
+    """Restore every original function. Collected statistics are kept."""
+    while _patched:
+        namespace, key, original = _patched.pop()
+        namespace[key] = original
+
+
+def reset() -> None:
+    """Discard collected statistics and cProfile sessions."""
+    _stats.clear()
+    _profilers.clear()
+
+
+@contextmanager
+def instrumented():
+    """Enable instrumentation for the duration of a with block."""
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def attach_profiler(target: str, calls: int = 1) -> None:
+    """
+    Run the next calls of a target under cProfile.
+
+    The target is an algorithm name (e.g. "SSTF") or a function name from
+    FUNCTION_TARGETS. Profiles of several calls accumulate; read them with
+    profiler_report(). A call made while another one is being profiled is
+    not profiled separately (it shows up in the outer profile).
+    """
+    _profilers[target] = [calls, cProfile.Profile()]
+
+
+# ═══════════════════════════════════════════════════════════════
+# REPORTS
+# ═══════════════════════════════════════════════════════════════
+
+def report() -> list[dict]:
+    """
+    Collected statistics, slowest target (by cumulative time) first.
+
+    Returns:
+        One row per target with keys "target", "calls", "total", "mean",
+        "min", "max", "p50", "p95", "p99" (seconds) and "sizes", a list of
+        {"size", "calls", "total"} rows per power-of-ten input-size bucket.
+    """
+    rows = []
+    for target, stats in _stats.items():
+        row = {
+            "target": target,
+            "calls": stats.calls,
+            "total": stats.total,
+            "mean": stats.total / stats.calls,
+            "min": stats.minimum,
+            "max": stats.maximum,
+        }
+        for p in PERCENTILES:
+            row[f"p{p}"] = stats.percentile(p)
+        row["sizes"] = [
+            {"size": size, "calls": calls, "total": total}
+            for size, (calls, total) in sorted(stats.sizes.items())
+        ]
+        rows.append(row)
+    return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+
+def format_report(rows: list[dict] = None) -> str:
+    """
+    Format report() as a plain-text table.
+
+    Each target is followed by its input-size buckets (calls and mean time).
+    """
+    if rows is None:
+        rows = report()
+
+    header = (f"{'Target':<24}  {'Calls':>8}  {'Total (ms)':>11}  {'Mean (ms)':>10}"
+              + "".join(f"  {f'p{p} (ms)':>10}" for p in PERCENTILES)
+              + f"  {'Max (ms)':>10}")
+    lines = [header]
+    for row in rows:
+        lines.append(
+            f"{row['target']:<24}  {row['calls']:>8}  {row['total'] * 1000:>11.3f}"
+            f"  {row['mean'] * 1000:>10.3f}"
+            + "".join(f"  {row[f'p{p}'] * 1000:>10.3f}" for p in PERCENTILES)
+            + f"  {row['max'] * 1000:>10.3f}"
+        )
+        for bucket in row["sizes"]:
+            mean = bucket["total"] / bucket["calls"]
+            lines.append(f"    n >= {bucket['size']:<15}  {bucket['calls']:>8}"
+                         f"  {bucket['total'] * 1000:>11.3f}  {mean * 1000:>10.3f}")
+    return "\n".join(lines)
+
+
+def profiler_report(target: str, sort: str = "cumulative", limit: int = 20) -> str:
+    """
+    cProfile statistics collected for a target by attach_profiler().
+
+    Returns:
+        The pstats listing (top `limit` functions by `sort`), or an empty
+        string if no profiled call of the target has run.
+    """
+    armed = _profilers.get(target)
+    if armed is None:
+        return ""
+    stream = io.StringIO()
+    try:
+        pstats.Stats(armed[1], stream=stream).sort_stats(sort).print_stats(limit)
+    except TypeError:
+        # pstats raises TypeError for a profiler that never ran
+        return ""
+    return stream.getvalue()
@@ -0,0 +1,233 @@
+import math
+from collections import deque
+
+# Import project modules
+from lazy import lazy_import
+from metrics import NUMPY_MIN_LENGTH
+
+# NumPy is optional (fall back to pure Python loops) and is only imported on first use
+np = lazy_import("numpy")
+
+
+# Percentiles reported by calculate_latency_metrics()
+PERCENTILES = (50, 95, 99)
+
+# Scalar fields of calculate_latency_metrics(), in display order
+LATENCY_SUMMARY_KEYS = ("mean_wait", "p50_wait", "p95_wait", "p99_wait", "max_wait", "starved")
+
+
+def default_starvation_threshold(disk_size: int, seek_time_per_track: float = 1.0) -> float:
+    """
+    Wait beyond which a request counts as starved.
+
+    A full sweep out to one edge and back (2 * (disk_size - 1) tracks) is
+    the longest a request waits under SCAN, so anything that waits longer
+    was passed over by the scheduler.
+    """
+    return 2 * (disk_size - 1) * seek_time_per_track
+
+
+def _nearest_rank(sorted_waits, percentile: float):
+    """Nearest-rank percentile of an ascending sequence."""
+    rank = max(1, math.ceil(percentile / 100 * len(sorted_waits)))
+    return sorted_waits[rank - 1]
+
+
+def _match_positions(requests: list[int], seek_sequence: list[int]) -> list[int]:
+    """
+    Find the step at which each request is serviced.
+
+    The initial head position (step 0) is never a service. Repeated visits
+    to a track are matched to requests for that track first-come,
+    first-served; extra visits (disk edges, C-SCAN jumps) are skipped.
+
+    Raises:
+        ValueError: If the sequence does not visit every request.
+    """
+    pending = {}
+    for i, track in enumerate(requests):
+        pending.setdefault(track, deque()).append(i)
+
+    positions = [0] * len(requests)
+    matched = 0
+    for step in range(1, len(seek_sequence)):
+        waiting = pending.get(seek_sequence[step])
+        if waiting:
+            positions[waiting.popleft()] = step
+            matched += 1
+
+    if matched != len(requests):
+        raise ValueError("Seek sequence does not service every request.")
+    return positions
+
+
+def _numpy_match_positions(requests, seek_sequence) -> "np.ndarray":
+    """
+    NumPy implementation of _match_positions().
+
+    Sorting both sides stably by track lines up the k-th request for a
+    track with the k-th visit to it.
+    """
+    visits = np.asarray(seek_sequence, dtype=np.int64)[1:]
+    tracks = np.asarray(requests, dtype=np.int64)
+
+    visit_order = np.argsort(visits, kind="stable")
+    sorted_visits = visits[visit_order]
+    request_order = np.argsort(tracks, kind="stable")
+    sorted_tracks = tracks[request_order]
+
+    # Rank of each request among the requests for the same track
+    rank = np.arange(len(sorted_tracks)) - np.searchsorted(sorted_tracks, sorted_tracks, "left")
+    target = np.searchsorted(sorted_visits, sorted_tracks, "left") + rank
+    if len(target) and (target[-1] >= len(sorted_visits) or
+                        not np.array_equal(sorted_visits[np.minimum(target, len(sorted_visits) - 1)],
+                                           sorted_tracks)):
+        raise ValueError("Seek sequence does not service every request.")
+
+    positions = np.empty(len(tracks), dtype=np.int64)
+    positions[request_order] = visit_order[target] + 1
+    return positions
+
+
+def service_positions(requests: list[int], seek_sequence: list[int]):
+    """
+    Step of the seek sequence that services each request, in request order.
+
+    Returns an int64 ndarray on the NumPy path and a list otherwise.
+
+    Raises:
+        ValueError: If the sequence does not visit every request.
+    """
+    if np is not None and len(requests) > 0 and (
+            isinstance(requests, np.ndarray) or len(seek_sequence) >= NUMPY_MIN_LENGTH):
+        return _numpy_match_positions(requests, seek_sequence)
+    return _match_positions(requests, seek_sequence)
+
+
+def calculate_latency_metrics(
+    requests: list[int],
+    seek_sequence: list[int],
+    disk_size: int,
+    seek_time_per_track: float = 1.0,
+    service_time: float = 0.0,
+    starvation_threshold: float = None
+) -> dict:
+    """
+    Per-request completion and wait statistics for a seek sequence.
+
+    All requests are taken to arrive at time 0 (a static queue). The head
+    takes seek_time_per_track per track moved and service_time per request
+    serviced, so with the defaults a request's wait is the head movement
+    that happens before it is serviced.
+
+    Uses NumPy when it is installed and the input is long enough.
+
+    Args:
+        requests: Track numbers in their original arrival order.
+        seek_sequence: Sequence produced for these requests (list,
+                       SeekSequence or ndarray), starting at the head.
+        disk_size: Total number of tracks (for the starvation threshold).
+        seek_time_per_track: Time to move the head by one track.
+        service_time: Time to service one request once the head is there.
+        starvation_threshold: Wait beyond which a request counts as starved
+                              (default: default_starvation_threshold()).
+
+    Returns:
+        Dict with:
+            "positions": step of the sequence that services each request
+            "completion_times": time each request finishes
+            "waits": time each request waits before its service starts
+            "mean_wait", "p50_wait", "p95_wait", "p99_wait", "max_wait":
+                summary of waits (nearest-rank percentiles)
+            "starved": number of requests waiting longer than the threshold
+            "starvation_threshold": the threshold used
+        Per-request values are in the original request order; they are
+        int64/float64 ndarrays on the NumPy path and lists otherwise.
+
+    Raises:
+        ValueError: If the sequence does not service every request.
+    """
+    if starvation_threshold is None:
+        starvation_threshold = default_starvation_threshold(disk_size, seek_time_per_track)
+
+    if np is not None and len(requests) > 0 and (
+            isinstance(requests, np.ndarray) or len(seek_sequence) >= NUMPY_MIN_LENGTH):
+        return _numpy_latency_metrics(requests, seek_sequence, seek_time_per_track,
+                                      service_time, starvation_threshold)
+
+    positions = _match_positions(requests, seek_sequence)
+
+    # Head movement before each step, and requests serviced up to it
+    distance_at = [0] * len(seek_sequence)
+    for step in range(1, len(seek_sequence)):
+        distance_at[step] = distance_at[step - 1] + abs(seek_sequence[step] - seek_sequence[step - 1])
+    services_at = [0] * len(seek_sequence)
+    for step in positions:
+        services_at[step] = 1
+    for step in range(1, len(seek_sequence)):
+        services_at[step] += services_at[step - 1]
+
+    completion_times = [distance_at[step] * seek_time_per_track + services_at[step] * service_time
+                        for step in positions]
+    waits = [time - service_time for time in completion_times]
+
+    sorted_waits = sorted(waits)
+    metrics = {
+        "positions": positions,
+        "completion_times": completion_times,
+        "waits": waits,
+        "mean_wait": sum(waits) / len(waits) if waits else 0.0,
+        "max_wait": sorted_waits[-1] if waits else 0.0,
+        "starved": sum(1 for wait in waits if wait > starvation_threshold),
+        "starvation_threshold": starvation_threshold,
+    }
+    for percentile in PERCENTILES:
+        metrics[f"p{percentile}_wait"] = _nearest_rank(sorted_waits, percentile) if waits else 0.0
+    return metrics
+
+
+def _numpy_latency_metrics(requests, seek_sequence, seek_time_per_track: float,
+                           service_time: float, starvation_threshold: float) -> dict:
+    """NumPy implementation of calculate_latency_metrics()."""
+    positions = _numpy_match_positions(requests, seek_sequence)
+
+    # Cumulative head movement at each step (step 0 = 0)
+    tracks = np.asarray(seek_sequence, dtype=np.int64)
+    distance_at = np.zeros(len(tracks), dtype=np.int64)
+    np.cumsum(np.abs(np.diff(tracks)), out=distance_at[1:])
+
+    # Requests serviced up to and including each request's step
+    completed = np.empty(len(positions), dtype=np.int64)
+    completed[np.argsort(positions)] = np.arange(1, len(positions) + 1)
+
+    completion_times = distance_at[positions] * seek_time_per_track + completed * service_time
+    waits = completion_times - service_time
+    sorted_waits = np.sort(waits)
+
+    metrics = {
+        "positions": positions,
+        "completion_times": completion_times,
+        "waits": waits,
+        "mean_wait": float(waits.mean()),
+        "max_wait": float(sorted_waits[-1]),
+        "starved": int(np.count_nonzero(waits > starvation_threshold)),
+        "starvation_threshold": starvation_threshold,
+    }
+    for percentile in PERCENTILES:
+        metrics[f"p{percentile}_wait"] = float(_nearest_rank(sorted_waits, percentile))
+    return metrics
+
+
+def format_latency_summary(metrics: dict) -> str:
+    """
+    One-line summary of the wait statistics from calculate_latency_metrics().
+
+    Example:
+        "mean 120.4 · p50 98 · p95 301 · p99 340 · max 352 · 0 starved"
+    """
+    def number(value):
+        return f"{value:.0f}" if float(value).is_integer() else f"{value:.1f}"
+
+    return (f"mean {metrics['mean_wait']:.1f} · p50 {number(metrics['p50_wait'])} · "
+            f"p95 {number(metrics['p95_wait'])} · p99 {number(metrics['p99_wait'])} · "
+            f"max {number(metrics['max_wait'])} · {metrics['starved']} starved")
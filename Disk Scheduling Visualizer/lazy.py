@@ -0,0 +1,51 @@
+import importlib
+import importlib.util
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    After loading, the module's attributes are copied onto the stand-in,
+    so later lookups such as np.asarray cost the same as on the module.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__["_lazy_name"] = name
+
+    def _load(self):
+        """Import the module (once) and return it."""
+        module = importlib.import_module(self._lazy_name)
+        self.__dict__.update(module.__dict__)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._lazy_name!r}>"
+
+
+def lazy_import(name: str) -> LazyModule | None:
+    """
+    Return a lazily imported module, or None if it is not installed.
+
+    Only the module's location is looked up here (no code runs), so an
+    optional heavy dependency can be tested with "is not None" at import
+    time without paying for the import itself.
+    """
+    if importlib.util.find_spec(name) is None:
+        return None
+    return LazyModule(name)
+
+
+def preload(*names: str) -> None:
+    """
+    Import modules now if they are installed.
+
+    Used before forking worker processes, so every worker inherits the
+    loaded modules instead of importing them again.
+    """
+    for name in names:
+        if importlib.util.find_spec(name) is not None:
+            importlib.import_module(name)
@@ -1,3 +1,45 @@
+from itertools import tee
+from operator import sub
+
+from lazy import lazy_import
+
+# NumPy is optional (fall back to pure Python loops) and is only imported on first use
+np = lazy_import("numpy")
+
+
+# Below this length the pure-Python loop beats NumPy's conversion overhead
+NUMPY_MIN_LENGTH = 64
+
+
+def _use_numpy(seek_sequence: list[int]) -> bool:
+    """Return True if the NumPy path should be used for this sequence."""
+    if np is None:
+        return False
+    if len(seek_sequence) >= NUMPY_MIN_LENGTH:
+        return True
+    # ndarrays always stay in NumPy so results come back as Python ints.
+    # Checked by name: touching np would import NumPy for short lists.
+    return type(seek_sequence).__name__ == "ndarray"
+
+
+def _as_track_array(seek_sequence: list[int]) -> "np.ndarray":
+    """
+    View a seek sequence as an int64 NumPy array, without copying if possible.
+
+    int64 ndarrays and buffer-protocol objects such as array('q') are
+    wrapped in place; narrower or unsigned ones are widened (their
+    differences could overflow or wrap around) and lists converted.
+    """
+    return np.asarray(seek_sequence).astype(np.int64, copy=False)
+
+
+def _numpy_seek_metrics(seek_sequence: list[int]) -> tuple[int, "np.ndarray"]:
+    """NumPy implementation of calculate_seek_metrics()."""
+    movements = np.diff(_as_track_array(seek_sequence))
+    np.abs(movements, out=movements)
+    return int(movements.sum()), movements
+
+
 def calculate_thm(seek_sequence: list[int]) -> int:
     """
     Calculate Total Head Movement (THM) from a seek sequence.
@@ -22,6 +64,10 @@ def calculate_thm(seek_sequence: list[int]) -> int:
     if len(seek_sequence) <= 1:
         return 0
     
+    # Vectorized path for long sequences
+    if _use_numpy(seek_sequence):
+        return _numpy_seek_metrics(seek_sequence)[0]
+    
     # Sum of absolute differences between consecutive positions
     total = 0
     for i in range(1, len(seek_sequence)):
@@ -56,6 +102,10 @@ def calculate_movements(seek_sequence: list[int]) -> list[int]:
     if len(seek_sequence) <= 1:
         return []
     
+    # Vectorized path for long sequences
+    if _use_numpy(seek_sequence):
+        return _numpy_seek_metrics(seek_sequence)[1].tolist()
+    
     # Calculate absolute difference for each consecutive pair
     movements = []
     for i in range(1, len(seek_sequence)):
@@ -63,3 +113,74 @@ def calculate_movements(seek_sequence: list[int]) -> list[int]:
         movements.append(movement)
     
     return movements
+
+
+def gap_to_optimal(thm: int, optimal_thm: int) -> float:
+    """
+    How much longer a schedule is than the optimal one, in percent.
+
+    Args:
+        thm: Total head movement of the schedule.
+        optimal_thm: Minimal THM for the same requests (see optimal.py).
+
+    Returns:
+        Percentage above the optimum; 0.0 when the optimum is 0.
+
+    Example:
+        gap_to_optimal(314, 208) -> 50.96...
+    """
+    if optimal_thm == 0:
+        return 0.0
+    return (thm - optimal_thm) / optimal_thm * 100
+
+
+def calculate_seek_metrics(seek_sequence: list[int]) -> tuple[int, list[int]]:
+    """
+    Calculate THM and per-step movements in a single pass.
+
+    Uses NumPy when it is installed and the sequence is long enough,
+    otherwise falls back to calculate_thm() / calculate_movements().
+
+    Args:
+        seek_sequence: Track numbers in order of access (list, SeekSequence,
+                       array.array or ndarray). First element is the initial
+                       head position.
+
+    Returns:
+        Tuple of (thm, movements). thm is a Python int. movements is an
+        int64 ndarray on the NumPy path and a list otherwise.
+
+    Example:
+        calculate_seek_metrics([50, 82, 170, 43]) -> (247, [32, 88, 127])
+    """
+    if len(seek_sequence) <= 1 or not _use_numpy(seek_sequence):
+        movements = calculate_movements(seek_sequence)
+        return sum(movements), movements
+
+    return _numpy_seek_metrics(seek_sequence)
+
+
+def iter_movements(tracks):
+    """
+    Lazy calculate_movements(): yield each head movement as it is consumed.
+
+    Works on any iterable of tracks, e.g. a generator from
+    algorithms.iter_seek_sequence(); only the previous track is kept.
+
+    Example:
+        list(iter_movements(iter([50, 82, 170, 43]))) -> [32, 88, 127]
+    """
+    previous, current = tee(tracks)
+    next(current, None)
+    # tee only buffers the one track by which the two iterators differ
+    return map(abs, map(sub, current, previous))
+
+
+def stream_thm(tracks) -> int:
+    """
+    calculate_thm() over a stream of tracks, in O(1) memory.
+
+    Example:
+        stream_thm(iter_seek_sequence("FCFS", [82, 170, 43], 50, 200)) -> 247
+    """
+    return sum(iter_movements(tracks))
@@ -0,0 +1,38 @@
+# Import project modules
+from algorithms import get_seek_sequence
+from closed_form import optimal_from_summary, summarize_requests
+
+
+def optimal_thm(requests: list[int], head: int) -> int:
+    """
+    Minimal total head movement that services every request.
+
+    O(n) time and O(1) extra memory: no sequence is built.
+
+    Example:
+        optimal_thm([82, 170, 43, 140, 24, 16, 190], 50) -> 208
+    """
+    return optimal_from_summary(summarize_requests(requests, head), head)[0]
+
+
+def optimal_schedule(requests: list[int], head: int, disk_size: int,
+                     compact: bool = False) -> tuple[int, list[int]]:
+    """
+    Offline optimal schedule: the seek sequence with minimal THM.
+
+    In one dimension the optimal covering path turns at most once, so
+    instead of a DP over the sorted tracks the optimum reduces to LOOK
+    started towards the closer end of the requests. Runs in O(n log n)
+    time and O(n) memory (the sequence itself).
+
+    Args:
+        requests: List of track numbers to service
+        head: Initial head position
+        disk_size: Total number of tracks (only used to size compact sequences)
+        compact: Return a SeekSequence (compact array) instead of a list
+
+    Returns:
+        Tuple of (minimal THM, seek sequence starting with head)
+    """
+    thm, direction = optimal_from_summary(summarize_requests(requests, head), head)
+    return thm, get_seek_sequence("LOOK", requests, head, disk_size, direction, compact=compact)
@@ -0,0 +1,248 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Import project modules
+from algorithms import get_seek_sequence, ALGORITHMS
+from metrics import calculate_thm
+from cost_model import calculate_service_times
+from sequence import SeekSequence
+
+
+# Striping layouts supported by stripe_requests()
+LAYOUTS = ("raid0", "raid10")
+
+
+def _check_layout(layout: str, n_disks: int) -> None:
+    """Raise ValueError for an unknown layout or a disk count it cannot use."""
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout: {layout}. Valid options: {list(LAYOUTS)}")
+    if n_disks < 1:
+        raise ValueError("An array needs at least one disk.")
+    if layout == "raid10" and (n_disks < 2 or n_disks % 2):
+        raise ValueError("RAID-10 needs an even number of disks (mirrored pairs).")
+
+
+def member_disk_size(logical_size: int, n_disks: int, chunk_size: int, layout: str = "raid0") -> int:
+    """
+    Number of tracks each member disk needs to hold a logical volume.
+
+    Args:
+        logical_size: Tracks in the logical volume.
+        n_disks: Disks in the array.
+        chunk_size: Stripe unit in tracks (consecutive logical tracks per disk).
+        layout: "raid0" or "raid10".
+
+    Returns:
+        Tracks per member disk (whole stripes).
+    """
+    _check_layout(layout, n_disks)
+    data_disks = n_disks if layout == "raid0" else n_disks // 2
+    return math.ceil(logical_size / (data_disks * chunk_size)) * chunk_size
+
+
+def stripe_requests(
+    requests: list[int],
+    n_disks: int,
+    chunk_size: int,
+    layout: str = "raid0",
+    writes: list[bool] = None,
+    logical_size: int = None
+) -> list[list[int]]:
+    """
+    Split a logical request stream into one physical request list per disk.
+
+    RAID-0 deals chunk_size consecutive logical tracks to each disk in
+    turn. RAID-10 stripes the same way over mirrored pairs (disks 2k and
+    2k + 1): a write goes to both disks of its pair and a read to one,
+    alternating between the two so reads are balanced across mirrors.
+    Each disk keeps the requests in their original arrival order.
+
+    Args:
+        requests: Logical track numbers in arrival order.
+        n_disks: Disks in the array.
+        chunk_size: Stripe unit in tracks.
+        layout: "raid0" or "raid10".
+        writes: Per request, True for a write (RAID-10 only; default all reads).
+        logical_size: Tracks in the logical volume; if given, requests must
+                      lie in [0, logical_size).
+
+    Returns:
+        List of n_disks physical request lists.
+
+    Raises:
+        ValueError: If the layout or disk count is invalid, or a request is
+                    negative or beyond the logical volume.
+    """
+    _check_layout(layout, n_disks)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1.")
+
+    members = [[] for _ in range(n_disks)]
+    data_disks = n_disks if layout == "raid0" else n_disks // 2
+    next_mirror = [0] * data_disks  # RAID-10: mirror that serves the next read
+
+    for i, track in enumerate(requests):
+        if track < 0:
+            raise ValueError(f"Track {track} is out of range. Tracks cannot be negative.")
+        if logical_size is not None and track >= logical_size:
+            raise ValueError(f"Track {track} is out of range. Must be between 0 and {logical_size - 1}.")
+        chunk, offset = divmod(track, chunk_size)
+        stripe, column = divmod(chunk, data_disks)
+        physical = stripe * chunk_size + offset
+
+        if layout == "raid0":
+            members[column].append(physical)
+        elif writes is not None and writes[i]:
+            members[2 * column].append(physical)
+            members[2 * column + 1].append(physical)
+        else:
+            members[2 * column + next_mirror[column]].append(physical)
+            next_mirror[column] ^= 1
+
+    return members
+
+
+def _schedule_member(job: tuple) -> dict:
+    """
+    Worker entry point: schedule one member disk.
+
+    Args:
+        job: (disk, algorithm, requests, head, disk_size, direction, drive_model)
+
+    Returns:
+        Per-disk result row (all zeros for a member with no requests: an
+        idle disk does not move, even under SCAN/C-SCAN).
+    """
+    disk, algorithm, requests, head, disk_size, direction, drive_model = job
+    if not requests:
+        row = {"disk": disk, "requests": 0, "thm": 0, "steps": 0}
+        if drive_model is not None:
+            row["service_ms"] = 0.0
+        return row
+
+    seek_sequence = get_seek_sequence(algorithm, requests, head, disk_size, direction, compact=True)
+    row = {
+        "disk": disk,
+        "requests": len(requests),
+        "thm": calculate_thm(seek_sequence),
+        "steps": len(seek_sequence) - 1,
+    }
+    if drive_model is not None:
+        row["service_ms"] = calculate_service_times(requests, seek_sequence, disk_size,
+                                                    drive_model)["total_ms"]
+    return row
+
+
+def simulate_array(
+    requests: list[int],
+    algorithm: str,
+    head: int,
+    logical_size: int,
+    n_disks: int,
+    chunk_size: int,
+    layout: str = "raid0",
+    direction: str = None,
+    writes: list[bool] = None,
+    drive_model=None,
+    max_workers: int = None
+) -> dict:
+    """
+    Simulate a striped disk array with every member scheduled independently.
+
+    Requests are striped with stripe_requests(), then each member disk runs
+    the same policy from its own head (all heads start at the same
+    physical track) in a ProcessPoolExecutor. Members work in parallel,
+    so the array finishes when its slowest member does.
+
+    Args:
+        requests: Logical track numbers in arrival order.
+        algorithm: Name of a policy in ALGORITHMS.
+        head: Initial head position on every member disk.
+        logical_size: Tracks in the logical volume.
+        n_disks: Disks in the array.
+        chunk_size: Stripe unit in tracks.
+        layout: "raid0" or "raid10".
+        direction: "left" or "right" (for SCAN, C-SCAN, LOOK, C-LOOK).
+        writes: Per request, True for a write (RAID-10 mirrors writes).
+        drive_model: cost_model.DriveModel; if given, load is measured in
+                     service time (ms) instead of tracks.
+        max_workers: Number of worker processes (default: one per disk, at
+                     most os.cpu_count()). 1 runs in the current process.
+
+    Returns:
+        Dict with:
+            "disks": per-disk rows with "disk", "requests", "thm", "steps"
+                     (and "service_ms" with a drive model)
+            "disk_size": tracks per member disk
+            "total_thm": sum of THM over all members
+            "makespan": load of the busiest member (THM, or ms with a drive model)
+            "imbalance": makespan / mean member load (1.0 = perfectly balanced)
+
+    Raises:
+        ValueError: If the algorithm, layout or disk count is invalid, the
+                    head is not on the member disks or a request is not on
+                    the logical volume.
+    """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}")
+
+    disk_size = member_disk_size(logical_size, n_disks, chunk_size, layout)
+    if not 0 <= head < disk_size:
+        raise ValueError(f"Head {head} is out of range. Member disks have tracks 0 to {disk_size - 1}.")
+    members = stripe_requests(requests, n_disks, chunk_size, layout, writes, logical_size)
+
+    # Compact arrays: pickle as raw bytes when sent to a worker
+    jobs = [
+        (disk, algorithm, SeekSequence.for_disk(disk_size, member), head, disk_size, direction,
+         drive_model)
+        for disk, member in enumerate(members)
+    ]
+
+    if max_workers is None:
+        max_workers = min(n_disks, os.cpu_count() or 1)
+    if max_workers == 1:
+        disks = [_schedule_member(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            disks = list(executor.map(_schedule_member, jobs))
+
+    load_key = "thm" if drive_model is None else "service_ms"
+    loads = [row[load_key] for row in disks]
+    makespan = max(loads)
+    mean_load = sum(loads) / len(loads)
+
+    return {
+        "disks": disks,
+        "disk_size": disk_size,
+        "total_thm": sum(row["thm"] for row in disks),
+        "makespan": makespan,
+        "imbalance": makespan / mean_load if mean_load else 1.0,
+    }
+
+
+def format_array_report(result: dict) -> str:
+    """
+    Format the output of simulate_array() as a plain-text table.
+
+    Returns:
+        One line per member disk followed by the aggregate figures.
+    """
+    with_service = "service_ms" in result["disks"][0]
+    header = f"{'Disk':>4}  {'Requests':>9}  {'THM':>12}  {'Steps':>8}"
+    if with_service:
+        header += f"  {'Service (ms)':>14}"
+
+    lines = [header]
+    for row in result["disks"]:
+        line = f"{row['disk']:>4}  {row['requests']:>9}  {row['thm']:>12}  {row['steps']:>8}"
+        if with_service:
+            line += f"  {row['service_ms']:>14.2f}"
+        lines.append(line)
+
+    unit = " ms" if with_service else " tracks"
+    lines.append(f"Total THM: {result['total_thm']}")
+    lines.append(f"Makespan: {result['makespan']:.2f}{unit}" if with_service
+                 else f"Makespan: {result['makespan']}{unit}")
+    lines.append(f"Imbalance: {result['imbalance']:.3f}")
+    return "\n".join(lines)
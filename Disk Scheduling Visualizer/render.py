@@ -0,0 +1,156 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Import project modules
+from algorithms import get_seek_sequence, ALGORITHMS
+from batch import parse_workloads
+from sequence import SeekSequence
+
+
+# Level-of-detail limits applied to long sequences when rendering
+RENDER_MAX_POINTS = 4000
+RENDER_MAX_FRAMES = 300
+LONG_SEQUENCE_STEPS = 1000
+
+
+def _render_job(job: tuple) -> list[str]:
+    """
+    Worker entry point: export the animations of one workload.
+
+    Every algorithm in the job shares the workload, so its requests are
+    sent to the worker once.
+
+    Args:
+        job: (fmt, fps, requests, head, disk_size, direction, outputs) where
+             outputs is a list of (output_path, algorithm) pairs.
+
+    Returns:
+        The paths written to, in the order of outputs.
+    """
+    # Imported here so the parent process never loads Matplotlib
+    from animator import export_animation
+
+    fmt, fps, requests, head, disk_size, direction, outputs = job
+    paths = []
+    for path, algorithm in outputs:
+        seek_sequence = get_seek_sequence(algorithm, requests, head, disk_size, direction,
+                                          compact=True)
+
+        # No static background: export does not blit, so a background path
+        # would be redrawn on every frame instead of once
+        long_sequence = len(seek_sequence) > LONG_SEQUENCE_STEPS
+        paths.append(export_animation(
+            seek_sequence,
+            disk_size,
+            path,
+            algorithm_name=algorithm,
+            fmt=fmt,
+            fps=fps,
+            max_points=RENDER_MAX_POINTS if long_sequence else None,
+            max_frames=RENDER_MAX_FRAMES if long_sequence else None,
+        ))
+    return paths
+
+
+def render_batch(
+    workloads,
+    output_dir: str,
+    algorithms: list[str] = None,
+    fmt: str = "gif",
+    fps: int = 5,
+    max_workers: int = None
+) -> list[str]:
+    """
+    Render animations for many algorithm/workload combinations in parallel.
+
+    Each combination is rendered headlessly in a worker process, named
+    <workload index>_<algorithm>.<fmt> inside output_dir (a directory for
+    the "png" frame-sequence format).
+
+    Args:
+        workloads: Iterable of (requests, head, disk_size, direction) tuples.
+        output_dir: Directory that receives the rendered files.
+        algorithms: Algorithm names to render (default: every entry in ALGORITHMS).
+        fmt: "gif", "mp4" or "png".
+        fps: Frames per second for GIF/MP4 output.
+        max_workers: Number of worker processes (default: os.cpu_count()).
+
+    Returns:
+        Paths written, in workload then algorithm order.
+
+    Raises:
+        ValueError: If an algorithm name is invalid.
+    """
+    if algorithms is None:
+        algorithms = list(ALGORITHMS.keys())
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ALGORITHMS.keys())}")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    workloads = list(workloads)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    # One job per workload; with fewer workloads than workers, one per
+    # algorithm instead so every worker has something to render
+    split = len(workloads) < max_workers
+
+    jobs = []
+    for index, (requests, head, disk_size, direction) in enumerate(workloads):
+        # Compact array: pickles as raw bytes when sent to a worker
+        requests = SeekSequence.for_disk(disk_size, requests)
+        outputs = []
+        for algorithm in algorithms:
+            name = f"{index:04d}_{algorithm}" + ("" if fmt == "png" else f".{fmt}")
+            outputs.append((os.path.join(output_dir, name), algorithm))
+        groups = [[output] for output in outputs] if split else [outputs]
+        jobs.extend((fmt, fps, requests, head, disk_size, direction, group) for group in groups)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return [path for paths in executor.map(_render_job, jobs) for path in paths]
+
+
+def _read_workloads(path: str, head: int, disk_size: int, direction: str):
+    """Read workloads from a file, one per line (see batch.parse_workloads())."""
+    with open(path) as f:
+        yield from parse_workloads(f, head, disk_size, direction)
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command-line entry point for batch rendering.
+
+    Examples:
+        python render.py --requests 82,170,43,140,24,16,190 --head 50 --out-dir renders
+        python render.py --workloads traces.ndjson --format mp4 --workers 16 --out-dir renders
+    """
+    parser = argparse.ArgumentParser(description="Render disk scheduling animations headlessly.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--requests", help="comma-separated request queue")
+    source.add_argument("--workloads", metavar="PATH",
+                        help="file with one workload per line (JSON object or comma-separated tracks)")
+    parser.add_argument("--head", type=int, default=50)
+    parser.add_argument("--disk-size", type=int, default=200)
+    parser.add_argument("--direction", choices=["left", "right"], default="right")
+    parser.add_argument("--algorithms", type=lambda s: s.split(","),
+                        help=f"comma-separated subset of {list(ALGORITHMS.keys())}")
+    parser.add_argument("--format", dest="fmt", choices=["gif", "mp4", "png"], default="gif")
+    parser.add_argument("--fps", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out-dir", required=True)
+    args = parser.parse_args(argv)
+
+    if args.requests:
+        requests = [int(x) for x in args.requests.split(",") if x.strip()]
+        workloads = [(requests, args.head, args.disk_size, args.direction)]
+    else:
+        workloads = _read_workloads(args.workloads, args.head, args.disk_size, args.direction)
+
+    for path in render_batch(workloads, args.out_dir, args.algorithms, args.fmt, args.fps, args.workers):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
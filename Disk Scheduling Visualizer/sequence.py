@@ -0,0 +1,71 @@
+from array import array
+
+
+# Largest disk that fits every track in a 32-bit signed integer
+_INT32_DISK_LIMIT = 2 ** 31
+
+
+def typecode_for(disk_size: int | None) -> str:
+    """
+    Pick the smallest array typecode that can hold every track on a disk.
+
+    Args:
+        disk_size: Total number of tracks, or None if unknown.
+
+    Returns:
+        "i" (4 bytes per track) when disk_size fits in 32 bits, else "q".
+    """
+    if disk_size is not None and disk_size <= _INT32_DISK_LIMIT:
+        return "i"
+    return "q"
+
+
+class SeekSequence(array):
+    """
+    Compact seek sequence stored as a typed integer array.
+
+    A subclass of array.array, so it supports indexing, slicing, len(),
+    iteration, append() and extend() like a list, while storing 4 bytes per
+    track (typecode "i") instead of a pointer plus a boxed int. It exposes
+    the buffer protocol, so np.asarray() and memoryview() read it without
+    copying.
+    """
+
+    def __new__(cls, values=(), typecode: str = "i"):
+        return super().__new__(cls, typecode, values)
+
+    @classmethod
+    def for_disk(cls, disk_size: int | None, values=()) -> "SeekSequence":
+        """
+        Create a sequence using the smallest typecode that fits disk_size.
+
+        Values outside the disk that do not fit that typecode (invalid
+        tracks, left for the caller to report) are stored as 64-bit
+        integers instead of raising OverflowError.
+        """
+        typecode = typecode_for(disk_size)
+        try:
+            return cls(values, typecode)
+        except OverflowError:
+            if typecode == "q":
+                raise
+            return cls(values, "q")
+
+    def __reduce__(self):
+        # __new__ takes (values, typecode), the reverse of array(typecode, values)
+        return (self.__class__, (list(self), self.typecode))
+
+    def __reduce_ex__(self, protocol: int):
+        # Protocol 3+ pickles the raw buffer (array's reconstructor handles
+        # subclasses); older protocols rebuild from a list via __reduce__
+        if protocol < 3:
+            return self.__reduce__()
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the underlying buffer in bytes."""
+        return len(self) * self.itemsize
+
+    def __repr__(self) -> str:
+        return f"SeekSequence({self.tolist()!r}, typecode={self.typecode!r})"
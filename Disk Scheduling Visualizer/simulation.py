@@ -0,0 +1,324 @@
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+
+# Event kinds. Arrivals sort before completions at the same timestamp, so a
+# request that arrives exactly when the head frees up is already pending.
+_ARRIVAL = 0
+_COMPLETION = 1
+
+
+class _PendingRequests:
+    """
+    Set of requests that have arrived but not been serviced yet.
+
+    Distinct pending tracks are kept in a sorted list for O(log n) nearest
+    neighbour lookups; requests on the same track queue up in arrival order.
+
+    Attributes:
+        disk_size: Total number of tracks.
+        tracks: Sorted list of distinct pending tracks.
+        queues: Track -> deque of (arrival_time, arrival_id), oldest first.
+        order: Tracks in global arrival order (only kept for FCFS).
+    """
+
+    def __init__(self, disk_size: int, fifo: bool = False):
+        self.disk_size = disk_size
+        self.tracks = []
+        self.queues = {}
+        self.order = deque() if fifo else None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, track: int, arrival_time: float, arrival_id: int) -> None:
+        """Add a request that arrived at arrival_time."""
+        if track < 0 or track >= self.disk_size:
+            raise ValueError(f"Track {track} is out of range. Must be between 0 and {self.disk_size - 1}.")
+
+        queue = self.queues.get(track)
+        if queue is None:
+            queue = self.queues[track] = deque()
+            insort(self.tracks, track)
+        queue.append((arrival_time, arrival_id))
+
+        if self.order is not None:
+            self.order.append(track)
+        self.size += 1
+
+    def pop(self, track: int) -> float:
+        """Remove the oldest request on a track and return its arrival time."""
+        queue = self.queues[track]
+        arrival_time, _ = queue.popleft()
+        if not queue:
+            del self.queues[track]
+            del self.tracks[bisect_left(self.tracks, track)]
+
+        if self.order is not None:
+            # FIFO order restricted to one track is that track's queue order,
+            # so the oldest request overall is also the oldest on its track
+            self.order.popleft()
+        self.size -= 1
+        return arrival_time
+
+    def oldest_arrival(self, track: int) -> tuple[float, int]:
+        """Return (arrival_time, arrival_id) of the oldest request on a track."""
+        return self.queues[track][0]
+
+    def oldest_track(self) -> int:
+        """Return the track of the oldest pending request (FCFS only)."""
+        return self.order[0]
+
+    def at_or_above(self, track: int) -> int | None:
+        """Return the smallest pending track >= track, or None."""
+        i = bisect_left(self.tracks, track)
+        return self.tracks[i] if i < len(self.tracks) else None
+
+    def at_or_below(self, track: int) -> int | None:
+        """Return the largest pending track <= track, or None."""
+        i = bisect_right(self.tracks, track)
+        return self.tracks[i - 1] if i > 0 else None
+
+    def lowest(self) -> int:
+        """Return the smallest pending track."""
+        return self.tracks[0]
+
+    def highest(self) -> int:
+        """Return the largest pending track."""
+        return self.tracks[-1]
+
+
+# ═══════════════════════════════════════════════════════════════
+# ONLINE POLICIES
+# ═══════════════════════════════════════════════════════════════
+# Each policy looks only at the currently pending requests and returns
+# (next_track, serve). serve is False for pure head movements such as the
+# edge visits of SCAN and C-SCAN; the policy is asked again once the head
+# gets there, so requests that arrive on the way are taken into account.
+
+def _online_fcfs(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """FCFS: service the oldest pending request."""
+    return pending.oldest_track(), True
+
+
+def _online_sstf(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """SSTF: service the closest pending request; the oldest wins ties."""
+    below = pending.at_or_below(head)
+    above = pending.at_or_above(head)
+
+    if below is None:
+        return above, True
+    if above is None:
+        return below, True
+
+    below_distance = head - below
+    above_distance = above - head
+    if below_distance != above_distance:
+        return (above if above_distance < below_distance else below), True
+
+    # Equal distance: whichever request arrived first
+    if pending.oldest_arrival(above) < pending.oldest_arrival(below):
+        return above, True
+    return below, True
+
+
+def _online_scan(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """SCAN: sweep to the disk edge, then reverse."""
+    if state["direction"] == "right":
+        track = pending.at_or_above(head)
+        if track is not None:
+            return track, True
+
+        # MUST visit the edge before reversing
+        edge = pending.disk_size - 1
+        if head != edge:
+            return edge, False
+
+        state["direction"] = "left"
+        return pending.at_or_below(head), True
+
+    else:  # direction == "left"
+        track = pending.at_or_below(head)
+        if track is not None:
+            return track, True
+
+        if head != 0:
+            return 0, False
+
+        state["direction"] = "right"
+        return pending.at_or_above(head), True
+
+
+def _online_cscan(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """C-SCAN: sweep to the edge, jump to the opposite edge, keep direction."""
+    if state["direction"] == "right":
+        track = pending.at_or_above(head)
+        if track is not None:
+            return track, True
+
+        edge = pending.disk_size - 1
+        if head != edge:
+            return edge, False
+
+        # Jump counts as movement; nothing is serviced on the way
+        return 0, False
+
+    else:  # direction == "left"
+        track = pending.at_or_below(head)
+        if track is not None:
+            return track, True
+
+        if head != 0:
+            return 0, False
+
+        return pending.disk_size - 1, False
+
+
+def _online_look(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """LOOK: like SCAN, but reverse at the last request instead of the edge."""
+    if state["direction"] == "right":
+        track = pending.at_or_above(head)
+        if track is not None:
+            return track, True
+
+        state["direction"] = "left"
+        return pending.at_or_below(head), True
+
+    else:  # direction == "left"
+        track = pending.at_or_below(head)
+        if track is not None:
+            return track, True
+
+        state["direction"] = "right"
+        return pending.at_or_above(head), True
+
+
+def _online_clook(pending: _PendingRequests, head: int, state: dict) -> tuple[int, bool]:
+    """C-LOOK: like C-SCAN, but jump straight to the farthest request."""
+    if state["direction"] == "right":
+        track = pending.at_or_above(head)
+        if track is not None:
+            return track, True
+        return pending.lowest(), True
+
+    else:  # direction == "left"
+        track = pending.at_or_below(head)
+        if track is not None:
+            return track, True
+        return pending.highest(), True
+
+
+# Dictionary mapping algorithm names to online policies (same keys as ALGORITHMS)
+ONLINE_POLICIES = {
+    "FCFS": _online_fcfs,
+    "SSTF": _online_sstf,
+    "SCAN": _online_scan,
+    "C-SCAN": _online_cscan,
+    "LOOK": _online_look,
+    "C-LOOK": _online_clook,
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# SIMULATION ENGINE
+# ═══════════════════════════════════════════════════════════════
+
+def simulate(
+    arrivals,
+    algorithm: str,
+    head: int,
+    disk_size: int,
+    direction: str = None,
+    seek_time_per_track: float = 1.0,
+    service_time: float = 0.0
+):
+    """
+    Discrete-event simulation of a scheduler with timed request arrivals.
+
+    Requests become visible to the policy only once they have arrived. The
+    head services one request at a time; whenever it becomes free, the
+    policy picks the next track from the currently pending set. Moving the
+    head costs seek_time_per_track per track, and each serviced request
+    adds service_time.
+
+    The arrival iterable is consumed lazily and results are yielded as they
+    complete, so memory is bounded by the number of pending requests rather
+    than the length of the trace.
+
+    Args:
+        arrivals: Iterable of (arrival_time, track) pairs in non-decreasing
+                  time order.
+        algorithm: Name of algorithm ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+        head: Initial head position
+        disk_size: Total number of tracks (valid tracks: 0 to disk_size-1)
+        direction: "left" or "right" initial sweep direction (default "right")
+        seek_time_per_track: Time to move the head by one track
+        service_time: Time to service a request once the head is on its track
+
+    Yields:
+        (time, track, wait) for each serviced request, in completion order.
+        time is the completion time and wait is time minus arrival time.
+
+    Raises:
+        ValueError: If the algorithm name is invalid, a track is out of
+                    range, or arrival times decrease.
+    """
+    if algorithm not in ONLINE_POLICIES:
+        raise ValueError(f"Unknown algorithm: {algorithm}. Valid options: {list(ONLINE_POLICIES.keys())}")
+
+    select = ONLINE_POLICIES[algorithm]
+    pending = _PendingRequests(disk_size, fifo=(algorithm == "FCFS"))
+    state = {"direction": direction or "right"}
+
+    # Event queue: (time, kind, event_id, payload). At most the next
+    # arrival and the current service are queued at any time.
+    events = []
+    arrival_iter = iter(arrivals)
+    event_id = 0
+    last_arrival_time = None
+    busy = False
+
+    def schedule_next_arrival() -> None:
+        nonlocal event_id, last_arrival_time
+        for arrival_time, track in arrival_iter:
+            if last_arrival_time is not None and arrival_time < last_arrival_time:
+                raise ValueError(
+                    f"Arrivals must be in time order: {arrival_time} after {last_arrival_time}"
+                )
+            last_arrival_time = arrival_time
+            heapq.heappush(events, (arrival_time, _ARRIVAL, event_id, track))
+            event_id += 1
+            return
+
+    schedule_next_arrival()
+
+    while events:
+        now, kind, current_id, payload = heapq.heappop(events)
+
+        if kind == _ARRIVAL:
+            pending.add(payload, now, current_id)
+            schedule_next_arrival()
+        else:  # kind == _COMPLETION
+            track, arrival_time = payload
+            head = track
+            busy = False
+            if arrival_time is not None:
+                yield now, track, now - arrival_time
+
+        # Dispatch once every event at this timestamp has been handled
+        if busy or not pending or (events and events[0][0] == now):
+            continue
+
+        track, serve = select(pending, head, state)
+        finish = now + abs(track - head) * seek_time_per_track
+        if serve:
+            arrival_time = pending.pop(track)
+            finish += service_time
+        else:
+            arrival_time = None
+
+        heapq.heappush(events, (finish, _COMPLETION, event_id, (track, arrival_time)))
+        event_id += 1
+        busy = True
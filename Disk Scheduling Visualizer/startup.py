@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+# Wall-clock budgets in seconds, measured from process start
+STARTUP_BUDGETS = {
+    "first_window": 1.0,
+    "first_result": 1.5,
+    "cli_first_result": 1.0,
+}
+
+# Modules that must not be loaded before the user asks for an animation
+DEFERRED_MODULES = ["matplotlib"]
+
+DEFAULT_REPEAT = 3
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Probes that are skipped (not failed) when there is no display to draw on
+DISPLAY_PROBES = {"first_window"}
+
+# Each probe runs in a fresh interpreter, prints the deferred modules it
+# ended up loading as JSON, and exits without interpreter teardown
+_PROBE_EXIT = """
+import json, os, sys
+print(json.dumps(sorted(m for m in {deferred!r} if m in sys.modules)), flush=True)
+os._exit(0)
+"""
+
+PROBES = {
+    # Import the GUI and draw its main window
+    "first_window": """
+import tkinter as tk
+import gui
+root = tk.Tk()
+gui.DiskSchedulerGUI(root)
+root.update()
+""",
+    # Import the GUI and compute one simulation the way the Run button does
+    "first_result": """
+import multiprocessing
+import gui
+from lazy import preload
+preload("numpy")
+receive_conn, send_conn = multiprocessing.Pipe(duplex=False)
+process = multiprocessing.Process(target=gui._simulation_worker,
+                                  args=(send_conn, "SSTF", [82, 170, 43, 140, 24, 16, 190], 50, 200, "right"))
+process.start()
+send_conn.close()
+while receive_conn.recv()[0] == "progress":
+    pass
+process.join()
+""",
+    # Evaluate one workload through the headless CLI
+    "cli_first_result": """
+import cli
+cli.main(["--requests", "82,170,43,140,24,16,190", "--head", "50"])
+""",
+}
+
+
+def _needs_display(name: str, stderr: str) -> bool:
+    """Whether a failed probe only failed for lack of a display."""
+    return name in DISPLAY_PROBES and "TclError" in stderr and "display" in stderr.lower()
+
+
+def _run_probe(name: str) -> tuple[float, list[str], str | None] | None:
+    """
+    Run one probe in a new interpreter.
+
+    Returns:
+        (wall-clock seconds, deferred modules that were loaded, error), where
+        error is the probe's stderr if it exited with a nonzero status and
+        None otherwise; or None if the probe cannot run here (the window
+        probe with no display).
+    """
+    code = PROBES[name] + _PROBE_EXIT.format(deferred=DEFERRED_MODULES)
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", code], cwd=HERE,
+                               capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if completed.returncode != 0:
+        if _needs_display(name, completed.stderr):
+            return None
+        error = completed.stderr.strip() or f"exit status {completed.returncode}"
+        return elapsed, [], error
+    return elapsed, json.loads(completed.stdout.strip().splitlines()[-1]), None
+
+
+def measure_startup(probes: list[str] = None, repeat: int = DEFAULT_REPEAT) -> list[dict]:
+    """
+    Measure time-to-first-window and time-to-first-result.
+
+    Every measurement starts a new Python process, so it includes
+    interpreter start-up and all imports. The best of `repeat` runs is
+    kept (the first run also warms the OS file cache).
+
+    Returns:
+        One row per probe with keys "probe", "seconds" (None if the probe
+        could not run here or failed), "budget", "loaded" (deferred modules
+        that were imported) and "error" (stderr of a failed run, or None).
+    """
+    if probes is None:
+        probes = list(PROBES.keys())
+
+    rows = []
+    for name in probes:
+        runs = [_run_probe(name) for _ in range(repeat)]
+        runs = [run for run in runs if run is not None]
+        errors = [error for _, _, error in runs if error is not None]
+        passed = [seconds for seconds, _, error in runs if error is None]
+        rows.append({
+            "probe": name,
+            "seconds": min(passed) if passed else None,
+            "budget": STARTUP_BUDGETS[name],
+            "loaded": sorted({module for _, loaded, _ in runs for module in loaded}),
+            "error": errors[0] if errors else None,
+        })
+    return rows
+
+
+def check_budgets(rows: list[dict]) -> list[str]:
+    """
+    Check start-up measurements against STARTUP_BUDGETS.
+
+    Returns:
+        One message per violation: a probe that failed, a probe over
+        budget, or a deferred module (Matplotlib) imported before it was
+        needed.
+    """
+    problems = []
+    for row in rows:
+        if row["error"] is not None:
+            problems.append(f"{row['probe']}: probe failed:\n{row['error']}")
+        if row["seconds"] is not None and row["seconds"] > row["budget"]:
+            problems.append(f"{row['probe']}: {row['seconds']:.3f}s exceeds budget {row['budget']:.3f}s")
+        for module in row["loaded"]:
+            problems.append(f"{row['probe']}: imported {module} at start-up")
+    return problems
+
+
+def main(argv: list[str] = None) -> None:
+    """
+    Command-line entry point for the start-up benchmark.
+
+    Examples:
+        python startup.py
+        python startup.py --check            # exit 1 if over budget (for CI)
+        python startup.py --probes cli_first_result --repeat 10
+    """
+    parser = argparse.ArgumentParser(description="Measure application start-up time.")
+    parser.add_argument("--probes", type=lambda s: s.split(","),
+                        help=f"comma-separated subset of {list(PROBES.keys())}")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--check", action="store_true",
+                        help="exit with status 1 if a budget is exceeded")
+    args = parser.parse_args(argv)
+
+    rows = measure_startup(args.probes, args.repeat)
+    for row in rows:
+        if row["error"] is not None:
+            seconds = "FAILED"
+        elif row["seconds"] is None:
+            seconds = "skipped"
+        else:
+            seconds = f"{row['seconds'] * 1000:.0f} ms"
+        print(f"{row['probe']:<18} {seconds:>10}   (budget {row['budget'] * 1000:.0f} ms)")
+
+    if args.check:
+        problems = check_budgets(rows)
+        for problem in problems:
+            print(f"FAIL {problem}")
+        if problems:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
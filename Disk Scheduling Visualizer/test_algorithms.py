@@ -0,0 +1,18 @@
+from array import array
+
+import pytest
+
+from algorithms import ALGORITHMS, get_seek_sequence
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("typecode", ["i", "q"])
+@pytest.mark.parametrize("disk_size", [200, 2 ** 32])
+def test_compact_accepts_arrays_of_any_typecode(algorithm, typecode, disk_size):
+    """Array requests give the same compact sequence as a list, whatever the typecodes."""
+    expected = get_seek_sequence(algorithm, REQUESTS, 53, disk_size, "left")
+    result = get_seek_sequence(algorithm, array(typecode, REQUESTS), 53, disk_size, "left", compact=True)
+    assert list(result) == expected
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from cache import SeekSequenceCache, cache_key
+
+
+REQUESTS = [98, 183, 37, 122, 14, 124, 65, 67]
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: data[:-3],             # truncated payload
+    lambda data: data[:4],              # header only
+    lambda data: data[:4] + b"x" + data[5:],  # invalid typecode
+    lambda data: b"junk",               # wrong magic
+])
+def test_corrupt_entry_is_a_miss(tmp_path, damage):
+    """An unreadable on-disk entry is deleted and recomputed, not raised."""
+    cache = SeekSequenceCache(directory=str(tmp_path))
+    expected = list(cache.get_seek_sequence("SCAN", REQUESTS, 53, 200, "left"))
+
+    path = os.path.join(tmp_path, cache_key("SCAN", REQUESTS, 53, 200, "left") + ".seq")
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(damage(data))
+
+    fresh = SeekSequenceCache(directory=str(tmp_path))
+    assert list(fresh.get_seek_sequence("SCAN", REQUESTS, 53, 200, "left")) == expected
+    assert fresh.stats()["misses"] == 1
+    assert fresh.stats()["disk_bytes"] == os.path.getsize(path) == len(data)
+
+    # The rewritten entry is served from disk again
+    again = SeekSequenceCache(directory=str(tmp_path))
+    assert list(again.get_seek_sequence("SCAN", REQUESTS, 53, 200, "left")) == expected
+    assert again.stats()["disk_hits"] == 1
+
+
+def test_direction_ignored_for_undirected_algorithms():
+    """FCFS and SSTF share one entry whatever the direction."""
+    for algorithm in ("FCFS", "SSTF"):
+        keys = {cache_key(algorithm, REQUESTS, 53, 200, direction) for direction in ("left", "right", None)}
+        assert len(keys) == 1
+    assert cache_key("SCAN", REQUESTS, 53, 200, "left") != cache_key("SCAN", REQUESTS, 53, 200, "right")
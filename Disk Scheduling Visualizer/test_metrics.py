@@ -0,0 +1,26 @@
+import os
+import subprocess
+import sys
+
+from metrics import calculate_movements, calculate_thm
+from sequence import SeekSequence
+
+
+def test_short_sequence_does_not_import_numpy():
+    """Metrics of a short list stay in pure Python and leave NumPy unloaded."""
+    code = ("import sys, metrics; "
+            "assert metrics.calculate_thm([50, 82, 170, 43]) == 247; "
+            "print('numpy' in sys.modules)")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.stdout.strip() == "False"
+
+
+def test_int32_sequence_does_not_overflow():
+    """Movements across the whole int32 range are exact on the NumPy path."""
+    low, high = -2 ** 31, 2 ** 31 - 1
+    tracks = [low, high] * 50
+    seek_sequence = SeekSequence(tracks, "i")
+    step = high - low
+    assert calculate_thm(seek_sequence) == step * (len(tracks) - 1)
+    assert calculate_movements(seek_sequence) == [step] * (len(tracks) - 1)
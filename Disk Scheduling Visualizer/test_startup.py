@@ -0,0 +1,16 @@
+import startup
+
+
+def test_startup_within_budget():
+    """Every start-up probe runs, stays within budget and defers Matplotlib."""
+    rows = startup.measure_startup()
+    assert startup.check_budgets(rows) == []
+
+
+def test_failing_probe_is_reported(monkeypatch):
+    """A probe that crashes is a failure, not a skipped measurement."""
+    monkeypatch.setitem(startup.PROBES, "cli_first_result", "import missing_module_for_test\n")
+    rows = startup.measure_startup(["cli_first_result"], repeat=1)
+    problems = startup.check_budgets(rows)
+    assert len(problems) == 1
+    assert "ModuleNotFoundError" in problems[0]
@@ -0,0 +1,22 @@
+import random
+
+import pytest
+
+from algorithms import ALGORITHMS, get_seek_sequence
+from traces import replay_trace
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("direction", ["left", "right"])
+def test_replay_matches_list_input(tmp_path, algorithm, direction):
+    """Replaying a trace gives the same sequence and THM as scheduling the track list."""
+    rng = random.Random(7)
+    tracks = [rng.randrange(500) for _ in range(300)]
+    path = tmp_path / "trace.csv"
+    path.write_text("sector\n" + "\n".join(map(str, tracks)) + "\n")
+
+    seek_sequence, thm = replay_trace(str(path), algorithm, 250, 500, direction)
+
+    expected = get_seek_sequence(algorithm, tracks, 250, 500, direction)
+    assert list(seek_sequence) == expected
+    assert thm == sum(abs(b - a) for a, b in zip(expected, expected[1:]))
@@ -0,0 +1,207 @@
+import mmap
+import os
+from array import array
+
+# Import project modules
+from algorithms import get_seek_sequence
+from metrics import calculate_thm
+from sequence import SeekSequence
+
+
+# Bytes of the mapped file parsed per chunk
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Supported trace formats
+TRACE_FORMATS = ("csv", "blkparse")
+
+
+def _parse_csv_lines(lines: list[bytes], column: int, out: array) -> None:
+    """
+    Append the sector column of CSV lines to out.
+
+    Blank lines and lines starting with '#' are skipped. A line whose
+    sector field is not an integer (e.g. a header row) is skipped too.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        fields = line.split(b",")
+        if column >= len(fields):
+            continue
+        try:
+            out.append(int(fields[column]))
+        except ValueError:
+            continue
+
+
+def _parse_blkparse_lines(lines: list[bytes], action: bytes | None, out: array) -> None:
+    """
+    Append the sector numbers of blkparse event lines to out.
+
+    Default blkparse output looks like:
+        8,0    3        1     0.000000000   697  D   W 223490 + 8 [kworker/3:1]
+    i.e. device, cpu, sequence, timestamp, pid, action, RWBS, sector.
+    Summary lines and events without a sector are skipped.
+    """
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+        if action is not None and fields[5] != action:
+            continue
+        try:
+            out.append(int(fields[7]))
+        except ValueError:
+            continue
+
+
+def iter_trace_chunks(
+    path: str,
+    fmt: str = "csv",
+    sectors_per_track: int = 1,
+    heads: int = 1,
+    column: int = 0,
+    action: str | None = "D",
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES
+):
+    """
+    Parse a block trace chunk by chunk and yield track numbers.
+
+    The file is memory-mapped and parsed chunk_bytes at a time, so only one
+    chunk of text is decoded at any moment. Sector numbers are mapped to
+    tracks (cylinders) with the given geometry:
+        track = sector // (sectors_per_track * heads)
+
+    Args:
+        path: Path to the trace file.
+        fmt: "csv" (one request per line, sector in the given column) or
+             "blkparse" (default blkparse text output).
+        sectors_per_track: Sectors on one track.
+        heads: Number of heads (surfaces) per cylinder.
+        column: Zero-based CSV column holding the sector number.
+        action: blkparse action to keep ("D" = issued to the driver,
+                None = every event with a sector).
+        chunk_bytes: Approximate number of bytes parsed per chunk.
+
+    Yields:
+        array('q') of track numbers for each chunk, in file order.
+
+    Raises:
+        ValueError: If the format or geometry is invalid.
+    """
+    if fmt not in TRACE_FORMATS:
+        raise ValueError(f"Unknown trace format: {fmt}. Valid options: {list(TRACE_FORMATS)}")
+    if sectors_per_track <= 0 or heads <= 0:
+        raise ValueError("Geometry must have a positive number of sectors per track and heads.")
+
+    sectors_per_cylinder = sectors_per_track * heads
+    action_bytes = action.encode() if action is not None else None
+
+    # mmap cannot map an empty file
+    if os.path.getsize(path) == 0:
+        return
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        start = 0
+        while start < size:
+            # Cut the chunk at the last complete line
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                newline = mm.rfind(b"\n", start, end)
+                if newline == -1:
+                    # Line longer than a chunk: extend to its end
+                    newline = mm.find(b"\n", end)
+                    if newline == -1:
+                        newline = size - 1
+                end = newline + 1
+
+            lines = mm[start:end].split(b"\n")
+            start = end
+
+            sectors = array("q")
+            if fmt == "csv":
+                _parse_csv_lines(lines, column, sectors)
+            else:
+                _parse_blkparse_lines(lines, action_bytes, sectors)
+
+            if sectors_per_cylinder == 1:
+                yield sectors
+            else:
+                yield array("q", (sector // sectors_per_cylinder for sector in sectors))
+
+
+def load_trace(
+    path: str,
+    fmt: str = "csv",
+    sectors_per_track: int = 1,
+    heads: int = 1,
+    disk_size: int = None,
+    **kwargs
+) -> array:
+    """
+    Load a whole block trace as a compact array of track numbers.
+
+    Args:
+        path: Path to the trace file.
+        fmt: "csv" or "blkparse" (see iter_trace_chunks).
+        sectors_per_track: Sectors on one track.
+        heads: Number of heads (surfaces) per cylinder.
+        disk_size: If given, every track must be between 0 and disk_size-1.
+        **kwargs: Passed to iter_trace_chunks (column, action, chunk_bytes).
+
+    Returns:
+        array('q') of track numbers in trace order (8 bytes per request).
+
+    Raises:
+        ValueError: If a track falls outside the disk.
+    """
+    tracks = array("q")
+    for chunk in iter_trace_chunks(path, fmt, sectors_per_track, heads, **kwargs):
+        if disk_size is not None and chunk:
+            lowest, highest = min(chunk), max(chunk)
+            if lowest < 0 or highest >= disk_size:
+                bad = lowest if lowest < 0 else highest
+                raise ValueError(f"Track {bad} is out of range. Must be between 0 and {disk_size - 1}.")
+        tracks.extend(chunk)
+    return tracks
+
+
+def replay_trace(
+    path: str,
+    algorithm: str,
+    head: int,
+    disk_size: int,
+    direction: str = None,
+    fmt: str = "csv",
+    sectors_per_track: int = 1,
+    heads: int = 1,
+    **kwargs
+) -> tuple[SeekSequence, int]:
+    """
+    Replay a block trace through a scheduling algorithm.
+
+    The trace stays in compact arrays end to end when NumPy is installed:
+    FCFS copies it into the sequence, SSTF collapses it with np.unique()
+    and the SCAN family sorts it with NumPy, so no Python list of the whole
+    trace is built. Without NumPy, SSTF and the SCAN family fall back to
+    ordering the requests in Python lists and dicts.
+
+    Args:
+        path: Path to the trace file.
+        algorithm: Name of algorithm ("FCFS", "SSTF", "SCAN", "C-SCAN", "LOOK", "C-LOOK")
+        head: Initial head position
+        disk_size: Total number of tracks
+        direction: "left" or "right" (required for SCAN, C-SCAN, LOOK, C-LOOK)
+        fmt: "csv" or "blkparse" (see iter_trace_chunks).
+        sectors_per_track: Sectors on one track.
+        heads: Number of heads (surfaces) per cylinder.
+        **kwargs: Passed to iter_trace_chunks (column, action, chunk_bytes).
+
+    Returns:
+        Tuple of (seek_sequence, thm); the sequence is a compact SeekSequence.
+    """
+    tracks = load_trace(path, fmt, sectors_per_track, heads, disk_size=disk_size, **kwargs)
+    seek_sequence = get_seek_sequence(algorithm, tracks, head, disk_size, direction, compact=True)
+    return seek_sequence, calculate_thm(seek_sequence)
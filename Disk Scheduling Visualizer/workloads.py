@@ -0,0 +1,240 @@
+import numpy as np
+
+
+# Requests generated per block; bounds memory for workloads of any length
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+DEFAULT_SEED = 42
+
+# Zipf popularity ranks kept; the tail beyond this carries negligible mass
+ZIPF_MAX_RANKS = 1 << 20
+
+
+# ═══════════════════════════════════════════════════════════════
+# TRACK DISTRIBUTIONS
+# ═══════════════════════════════════════════════════════════════
+# Each distribution is a factory: given the random generator, disk size
+# and its parameters it returns a function that draws a block of n tracks.
+# Set-up work (such as the Zipf table) is done once per workload.
+
+def _uniform(rng: np.random.Generator, disk_size: int):
+    """Tracks drawn uniformly from the whole disk."""
+    def block(n: int) -> np.ndarray:
+        return rng.integers(0, disk_size, n)
+    return block
+
+
+def _zipf(rng: np.random.Generator, disk_size: int, exponent: float = 1.1):
+    """
+    Hotspots: track popularity follows a Zipf law with the given exponent.
+
+    Popularity ranks are assigned to randomly chosen tracks, so the hot
+    tracks are scattered over the disk. At most ZIPF_MAX_RANKS distinct
+    tracks are used.
+    """
+    n_ranks = min(disk_size, ZIPF_MAX_RANKS)
+    weights = 1.0 / np.arange(1, n_ranks + 1) ** exponent
+    cdf = np.cumsum(weights)
+    cdf /= cdf[-1]
+    tracks_by_rank = rng.choice(disk_size, n_ranks, replace=False)
+
+    def block(n: int) -> np.ndarray:
+        ranks = np.searchsorted(cdf, rng.random(n), side="right")
+        return tracks_by_rank[np.minimum(ranks, n_ranks - 1)]
+    return block
+
+
+def _sequential(rng: np.random.Generator, disk_size: int, mean_run: int = 64):
+    """
+    Runs of consecutive tracks (geometric length, mean mean_run) from random starts.
+
+    Runs wrap around the end of the disk. A run is cut at the end of a block.
+    """
+    def block(n: int) -> np.ndarray:
+        # Enough runs to cover the block with high probability; top up if not
+        lengths = rng.geometric(1 / mean_run, n // mean_run + 16)
+        while lengths.sum() < n:
+            lengths = np.concatenate([lengths, rng.geometric(1 / mean_run, n // mean_run + 16)])
+        starts = rng.integers(0, disk_size, len(lengths))
+
+        run_starts = np.cumsum(lengths) - lengths
+        offsets = np.arange(n) - np.repeat(run_starts, lengths)[:n]
+        return (np.repeat(starts, lengths)[:n] + offsets) % disk_size
+    return block
+
+
+def _bimodal(rng: np.random.Generator, disk_size: int, centers: tuple = (0.25, 0.75),
+             spread: float = 0.05, split: float = 0.5):
+    """
+    Two normal clusters (centers and spread as fractions of the disk).
+
+    A fraction split of the requests comes from the first cluster.
+    """
+    def block(n: int) -> np.ndarray:
+        first = rng.random(n) < split
+        means = np.where(first, centers[0], centers[1]) * (disk_size - 1)
+        tracks = np.rint(rng.normal(means, spread * disk_size))
+        return np.clip(tracks, 0, disk_size - 1).astype(np.int64)
+    return block
+
+
+DISTRIBUTIONS = {
+    "uniform": _uniform,
+    "zipf": _zipf,
+    "sequential": _sequential,
+    "bimodal": _bimodal,
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# ARRIVAL PROCESSES
+# ═══════════════════════════════════════════════════════════════
+
+def _poisson_gaps(rng: np.random.Generator, rate: float = 1.0):
+    """Exponential inter-arrival times (a Poisson process with the given rate)."""
+    def block(n: int) -> np.ndarray:
+        return rng.exponential(1 / rate, n)
+    return block
+
+
+def _burst_gaps(rng: np.random.Generator, rate: float = 1.0, mean_burst: int = 32,
+                burst_rate: float = 100.0):
+    """
+    Bursty arrivals: bursts of mean_burst requests (geometric) arriving at
+    burst_rate, separated by idle gaps sized so the long-run rate is rate.
+    """
+    # Mean idle gap so that mean_burst requests take mean_burst / rate on average
+    idle = max(0.0, mean_burst / rate - (mean_burst - 1) / burst_rate)
+
+    def block(n: int) -> np.ndarray:
+        gaps = rng.exponential(1 / burst_rate, n)
+        # Each request starts a new burst with probability 1 / mean_burst
+        new_burst = rng.random(n) < 1 / mean_burst
+        gaps[new_burst] = rng.exponential(idle, int(new_burst.sum())) if idle > 0 else 0.0
+        return gaps
+    return block
+
+
+ARRIVAL_PROCESSES = {
+    "poisson": _poisson_gaps,
+    "burst": _burst_gaps,
+}
+
+
+# ═══════════════════════════════════════════════════════════════
+# PUBLIC API
+# ═══════════════════════════════════════════════════════════════
+
+def _block_sizes(n: int, block_size: int):
+    """Split n into block_size pieces (the last one possibly shorter)."""
+    for start in range(0, n, block_size):
+        yield min(block_size, n - start)
+
+
+def iter_workload(
+    distribution: str,
+    n: int,
+    disk_size: int,
+    seed: int = DEFAULT_SEED,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    **params
+):
+    """
+    Generate a synthetic request stream in vectorized blocks.
+
+    Only one block is held in memory, so workloads of 10^8 requests and
+    more can be streamed into trace replay, the online simulator or
+    metrics. The same distribution, parameters, seed and block_size always
+    give the same stream.
+
+    Args:
+        distribution: One of DISTRIBUTIONS ("uniform", "zipf",
+                      "sequential", "bimodal").
+        n: Total number of requests.
+        disk_size: Total number of tracks (valid tracks: 0 to disk_size-1).
+        seed: Random seed.
+        block_size: Requests per yielded array.
+        **params: Distribution parameters (e.g. exponent=1.2 for "zipf",
+                  mean_run=16 for "sequential").
+
+    Yields:
+        int64 ndarrays of track numbers, in stream order.
+
+    Raises:
+        ValueError: If the distribution name is invalid.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}. Valid options: {list(DISTRIBUTIONS.keys())}")
+
+    rng = np.random.default_rng(seed)
+    draw = DISTRIBUTIONS[distribution](rng, disk_size, **params)
+    for size in _block_sizes(n, block_size):
+        yield draw(size).astype(np.int64, copy=False)
+
+
+def generate_workload(distribution: str, n: int, disk_size: int, seed: int = DEFAULT_SEED,
+                      **params) -> list[int]:
+    """
+    Generate a whole request list at once (for workloads that fit in memory).
+
+    Returns:
+        List of track numbers, identical to concatenating iter_workload()
+        with the default block size.
+    """
+    blocks = list(iter_workload(distribution, n, disk_size, seed, **params))
+    if not blocks:
+        return []
+    return np.concatenate(blocks).tolist()
+
+
+def iter_arrivals(
+    distribution: str,
+    n: int,
+    disk_size: int,
+    arrival: str = "poisson",
+    seed: int = DEFAULT_SEED,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    arrival_params: dict = None,
+    **params
+):
+    """
+    Generate timed requests in vectorized blocks.
+
+    Tracks come from the given distribution and arrival times from an
+    arrival process: "poisson" (parameter rate) or "burst" (parameters
+    rate, mean_burst and burst_rate).
+
+    Args:
+        distribution, n, disk_size, seed, block_size, **params: As in iter_workload().
+        arrival: One of ARRIVAL_PROCESSES.
+        arrival_params: Parameters of the arrival process.
+
+    Yields:
+        (times, tracks) pairs of float64 / int64 ndarrays; times increase
+        across blocks.
+
+    Raises:
+        ValueError: If the distribution or arrival process is invalid.
+    """
+    if arrival not in ARRIVAL_PROCESSES:
+        raise ValueError(f"Unknown arrival process: {arrival}. Valid options: {list(ARRIVAL_PROCESSES.keys())}")
+
+    # Separate streams so the tracks do not depend on the arrival process
+    track_seed, time_seed = np.random.SeedSequence(seed).spawn(2)
+    gaps = ARRIVAL_PROCESSES[arrival](np.random.default_rng(time_seed), **(arrival_params or {}))
+
+    clock = 0.0
+    for tracks in iter_workload(distribution, n, disk_size, track_seed, block_size, **params):
+        times = clock + np.cumsum(gaps(len(tracks)))
+        clock = float(times[-1])
+        yield times, tracks
+
+
+def arrival_stream(*args, **kwargs):
+    """
+    iter_arrivals() flattened into (arrival_time, track) pairs.
+
+    Suitable as the arrivals argument of simulation.simulate().
+    """
+    for times, tracks in iter_arrivals(*args, **kwargs):
+        yield from zip(times.tolist(), tracks.tolist())